@@ -0,0 +1,372 @@
+"""Offline benchmark for Notion Travel fetch and normalization stages.
+
+Usage (from the repository root, with Home Assistant installed):
+
+    python benchmarks/notion_travel/bench_coordinator.py --trips 200 --children 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import gc
+import json
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tests" / "notion_travel"))
+
+# The shared fake session; importing it first also loads Home Assistant's bootstrap.
+from fake_notion import FakeNotionSession  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.notion_travel.api import NotionApiClient, TokenBucket  # noqa: E402
+from custom_components.notion_travel.const import CONF_DB_TRIPS  # noqa: E402
+from custom_components.notion_travel.coordinator import (  # noqa: E402
+    NotionTravelDataUpdateCoordinator,
+    _apply_parsed,
+)
+from custom_components.notion_travel.helpers import get_property  # noqa: E402
+from custom_components.notion_travel.models import TripView  # noqa: E402
+from synthetic import GENERIC_DATASET, SyntheticConfig, SyntheticWorkspace  # noqa: E402
+
+# Representative logical lookups made while parsing a child page, including misses.
+LOOKUPS: tuple[tuple[str, ...], ...] = (
+    ("Name", "Title"),
+    ("Status",),
+    ("Notes",),
+    ("URL", "Website", "Map Link", "Reference URL"),
+    ("Check In", "Check-In"),
+    ("Confirmation", "Confirmation Number", "Reservation Number", "Booking Number"),
+    ("Cost Per Night", "Cost"),
+    ("Cuisine Type", "Cuisine"),
+    ("Date/Time", "Reservation Time", "Reservation"),
+)
+
+# Projection a generic dataset would configure under `additional_databases`.
+GENERIC_PROJECTION = ["Quantity", "Packed", "Start Time"]
+
+
+def measure(
+    name: str, func: Callable[[], Any], repeat: int, track_memory: bool
+) -> dict[str, Any]:
+    """Time `func` over `repeat` runs, then measure one run under tracemalloc."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    result: dict[str, Any] = {
+        "stage": name,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+    }
+
+    if track_memory:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        value = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stats = after.compare_to(before, "filename")
+        result["peak_kib"] = round((peak - baseline) / 1024, 1)
+        result["retained_blocks"] = sum(stat.count_diff for stat in stats)
+        del value
+
+    return result
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Build the workspace and run every benchmark stage."""
+    workspace = SyntheticWorkspace(
+        SyntheticConfig(
+            trips=args.trips,
+            children_per_dataset=args.children,
+            extra_properties=args.properties,
+            seed=args.seed,
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = NotionTravelDataUpdateCoordinator(
+            hass,
+            token="benchmark",
+            databases=workspace.databases,
+            scan_interval_seconds=1800,
+            incremental_sync=False,
+        )
+        session = FakeNotionSession(
+            {
+                database_id: workspace.pages[dataset]
+                for dataset, database_id in workspace.databases.items()
+            },
+            page_size=args.page_size,
+            cache_responses=True,
+        )
+        coordinator._client = NotionApiClient(  # noqa: SLF001
+            session, "benchmark", limiter=TokenBucket(rate=1e9, burst=10**9)
+        )
+        loop = asyncio.get_running_loop()
+
+        def fetch() -> None:
+            coordinator._raw_pages.clear()  # noqa: SLF001
+            coordinator._records.clear()  # noqa: SLF001
+            # Runs on a worker thread so the stage can be timed synchronously.
+            # Pages are parsed as each response arrives, so this includes parsing.
+            asyncio.run_coroutine_threadsafe(
+                coordinator._fetch_databases(  # noqa: SLF001
+                    list(workspace.databases), dt_util.utcnow()
+                ),
+                loop,
+            ).result()
+
+        def fetch_buffered() -> None:
+            # For comparison: hold every decoded response, then parse them all.
+            async def fetch_dataset(dataset: str, database_id: str) -> None:
+                responses = [
+                    results
+                    async for results in coordinator._iter_database_results(  # noqa: SLF001
+                        database_id
+                    )
+                ]
+                pages: dict[str, Any] = {}
+                records: dict[str, Any] = {}
+                for results in responses:
+                    resolver = coordinator._rows_resolver(dataset, results)  # noqa: SLF001
+                    _apply_parsed(
+                        coordinator._parse_results(dataset, results, resolver),  # noqa: SLF001
+                        pages,
+                        records,
+                    )
+
+            async def fetch_all() -> None:
+                await asyncio.gather(
+                    *(
+                        fetch_dataset(dataset, database_id)
+                        for dataset, database_id in workspace.databases.items()
+                    )
+                )
+
+            asyncio.run_coroutine_threadsafe(fetch_all(), loop).result()
+
+        await loop.run_in_executor(None, fetch)
+        raw = coordinator._cached_rows()  # noqa: SLF001
+        session.requests.clear()
+        session.response_bytes = 0
+
+        child_pages = [
+            (dataset, page)
+            for dataset, pages in raw.items()
+            if dataset != CONF_DB_TRIPS
+            for page in pages
+        ]
+        all_pages = [page for pages in raw.values() for page in pages]
+        generic_properties = [page["properties"] for page in raw[GENERIC_DATASET]]
+        resolvers = {
+            dataset: coordinator._rows_resolver(dataset, rows)  # noqa: SLF001
+            for dataset, rows in raw.items()
+        }
+        generic_resolver = resolvers[GENERIC_DATASET]
+        records = {
+            dataset: list(items.values())
+            for dataset, items in coordinator._records.items()  # noqa: SLF001
+        }
+        normalized = coordinator._link(records)  # noqa: SLF001
+
+        def parse_children() -> list[Any]:
+            return [
+                coordinator._parse_page(dataset, page, resolvers[dataset])  # noqa: SLF001
+                for dataset, page in child_pages
+            ]
+
+        def build_timelines() -> list[Any]:
+            return [
+                coordinator._build_timeline_events(trip)  # noqa: SLF001
+                for trip in normalized["trips"]
+            ]
+
+        def build_event_calendar() -> Any:
+            return coordinator._event_calendar(normalized["trips"])  # noqa: SLF001
+
+        event_calendar = build_event_calendar()
+        all_items = event_calendar.between(
+            dt_util.utc_from_timestamp(0), dt_util.utcnow() + timedelta(days=365 * 20)
+        )
+        # About 100 month-long windows starting at event starts, like calendar panel views.
+        query_starts = [item.lower for item in all_items[:: max(1, len(all_items) // 100)]]
+
+        def query_event_calendar() -> int:
+            month = timedelta(days=31)
+            return sum(len(event_calendar.between(start, start + month)) for start in query_starts)
+
+        def trip_views(make_view: Callable[[Any], TripView]) -> int:
+            # What each state write and timeline request consumes per trip.
+            size = 0
+            for trip in normalized["trips"]:
+                view = make_view(trip)
+                size += len(view.attributes) + len(view.timeline_json)
+            return size
+
+        def build_trip_views() -> int:
+            return trip_views(lambda trip: TripView(trip, coordinator.attribute_mode))
+
+        def cached_trip_views() -> int:
+            return trip_views(coordinator.trip_view)
+
+        cached_trip_views()
+
+        def parse_generic_all() -> list[Any]:
+            return [
+                coordinator._parse_generic_properties(  # noqa: SLF001
+                    properties, None, generic_resolver
+                )
+                for properties in generic_properties
+            ]
+
+        def parse_generic_projected() -> list[Any]:
+            return [
+                coordinator._parse_generic_properties(  # noqa: SLF001
+                    properties, GENERIC_PROJECTION, generic_resolver
+                )
+                for properties in generic_properties
+            ]
+
+        def lookups_get_property() -> int:
+            found = 0
+            for page in all_pages:
+                properties = page["properties"]
+                for names in LOOKUPS:
+                    found += bool(get_property(properties, *names))
+            return found
+
+        def lookups_resolver() -> int:
+            found = 0
+            for dataset, pages in raw.items():
+                for page in pages:
+                    prop = resolvers[dataset].bind(page["properties"])
+                    for names in LOOKUPS:
+                        found += bool(prop(*names))
+            return found
+
+        patch_dataset, patch_page = child_pages[len(child_pages) // 2]
+
+        def patch_child_page() -> Any:
+            # What `refresh_page` or a webhook costs for one booking once it is fetched.
+            trip_index = normalized["trip_index"]
+            touched = coordinator._apply_child_page(  # noqa: SLF001
+                patch_dataset, patch_page, trip_index, normalized["relations"]
+            )
+            now = dt_util.utcnow()
+            for trip_id in touched:
+                coordinator._finalize_trip(trip_index[trip_id], now)  # noqa: SLF001
+            return coordinator._patch_data(  # noqa: SLF001
+                normalized, set(), {patch_page["id"]}
+            )
+
+        stages: list[tuple[str, Callable[[], Any]]] = [
+            ("parse_rows", lambda: coordinator._parse_rows(raw, resolvers)),  # noqa: SLF001
+            ("link", lambda: coordinator._link(records)),  # noqa: SLF001
+            ("parse_child_page", parse_children),
+            ("build_timeline_events", build_timelines),
+            ("event_calendar_build", build_event_calendar),
+            ("event_calendar_query", query_event_calendar),
+            ("trip_views_build", build_trip_views),
+            ("trip_views_cached", cached_trip_views),
+            ("generic_all", parse_generic_all),
+            ("generic_projected", parse_generic_projected),
+            ("get_property", lookups_get_property),
+            ("property_resolver", lookups_resolver),
+            # Last: it relinks one item in `normalized`, reordering that trip's items.
+            ("patch_child_page", patch_child_page),
+        ]
+
+        results: list[dict[str, Any]] = []
+        runs = args.repeat + (0 if args.no_memory else 1)
+        # Streaming parses each response as it arrives; compare peak_kib with buffering.
+        for name, func in (("fetch", fetch), ("fetch_buffered", fetch_buffered)):
+            session.requests.clear()
+            session.response_bytes = 0
+            fetch_result = await loop.run_in_executor(
+                None,
+                lambda name=name, func=func: measure(name, func, args.repeat, not args.no_memory),
+            )
+            fetch_result["requests_per_run"] = len(session.requests) // runs
+            fetch_result["bytes_per_run"] = session.response_bytes // runs
+            results.append(fetch_result)
+        for name, func in stages:
+            results.append(measure(name, func, args.repeat, not args.no_memory))
+
+        await hass.async_stop(force=True)
+
+    return {
+        "config": {
+            "trips": args.trips,
+            "children_per_dataset": args.children,
+            "extra_properties": args.properties,
+            "page_size": args.page_size,
+            "rows": workspace.row_count,
+        },
+        "results": results,
+    }
+
+
+def _print_table(report: dict[str, Any]) -> None:
+    config = report["config"]
+    print(
+        f"rows={config['rows']} trips={config['trips']} "
+        f"children/dataset/trip={config['children_per_dataset']} "
+        f"extra_properties={config['extra_properties']} page_size={config['page_size']}"
+    )
+    columns = (
+        "stage",
+        "min_ms",
+        "median_ms",
+        "peak_kib",
+        "retained_blocks",
+        "requests_per_run",
+        "bytes_per_run",
+    )
+    print("  ".join(f"{column:>21}" for column in columns))
+    for row in report["results"]:
+        print("  ".join(f"{row.get(column, '-')!s:>21}" for column in columns))
+
+
+def main() -> None:
+    """Parse CLI arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trips", type=int, default=50)
+    parser.add_argument("--children", type=int, default=10, help="rows per child dataset per trip")
+    parser.add_argument("--properties", type=int, default=10, help="extra properties per page")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc pass")
+    parser.add_argument("--json", action="store_true", help="print a JSON report")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_table(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Synthetic Notion query payloads for Notion Travel benchmarks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import random
+from typing import Any
+
+CHILD_DATASETS = ("flights", "lodging", "transportation", "activities", "dining", "notes")
+GENERIC_DATASET = "packing"
+
+
+@dataclass
+class SyntheticConfig:
+    """Shape of the generated workspace."""
+
+    trips: int = 50
+    children_per_dataset: int = 10
+    extra_properties: int = 10
+    seed: int = 1234
+
+
+def _text(value: str) -> list[dict[str, Any]]:
+    return [{"type": "text", "plain_text": value, "text": {"content": value}}]
+
+
+def _title(value: str) -> dict[str, Any]:
+    return {"id": "title", "type": "title", "title": _text(value)}
+
+
+def _rich_text(value: str) -> dict[str, Any]:
+    return {"id": "rt", "type": "rich_text", "rich_text": _text(value)}
+
+
+def _select(value: str) -> dict[str, Any]:
+    return {"id": "sel", "type": "select", "select": {"id": value, "name": value, "color": "default"}}
+
+
+def _number(value: float) -> dict[str, Any]:
+    return {"id": "num", "type": "number", "number": value}
+
+
+def _date(start: datetime, end: datetime | None = None) -> dict[str, Any]:
+    return {
+        "id": "date",
+        "type": "date",
+        "date": {
+            "start": start.isoformat(),
+            "end": end.isoformat() if end else None,
+            "time_zone": None,
+        },
+    }
+
+
+def _relation(*page_ids: str) -> dict[str, Any]:
+    return {"id": "rel", "type": "relation", "relation": [{"id": pid} for pid in page_ids]}
+
+
+def _url(value: str) -> dict[str, Any]:
+    return {"id": "url", "type": "url", "url": value}
+
+
+def _page(page_id: str, properties: dict[str, Any], edited: datetime) -> dict[str, Any]:
+    return {
+        "object": "page",
+        "id": page_id,
+        "created_time": edited.isoformat(),
+        "last_edited_time": edited.isoformat(),
+        "archived": False,
+        "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+        "properties": properties,
+    }
+
+
+class SyntheticWorkspace:
+    """Generate a deterministic set of Notion pages per dataset."""
+
+    def __init__(self, config: SyntheticConfig) -> None:
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.pages: dict[str, list[dict[str, Any]]] = {}
+        self._generate()
+
+    @property
+    def databases(self) -> dict[str, str]:
+        """Return dataset name -> synthetic database ID."""
+        return {dataset: f"db-{dataset}" for dataset in self.pages}
+
+    @property
+    def row_count(self) -> int:
+        """Return the total number of generated pages."""
+        return sum(len(pages) for pages in self.pages.values())
+
+    def _extra(self, properties: dict[str, Any]) -> dict[str, Any]:
+        for index in range(self.config.extra_properties):
+            properties[f"Extra Field {index}"] = _rich_text(f"value {index} " * 4)
+        return properties
+
+    def _edited(self) -> datetime:
+        return self._now - timedelta(minutes=self._random.randint(0, 60 * 24 * 365))
+
+    def _generate(self) -> None:
+        trips: list[dict[str, Any]] = []
+        trip_starts: list[tuple[str, datetime]] = []
+        for index in range(self.config.trips):
+            trip_id = f"trip-{index:05d}"
+            start = self._now + timedelta(days=self._random.randint(-900, 400))
+            end = start + timedelta(days=self._random.randint(2, 14))
+            trip_starts.append((trip_id, start))
+            trips.append(
+                _page(
+                    trip_id,
+                    self._extra(
+                        {
+                            "Name": _title(f"Trip {index}"),
+                            "Destination": _rich_text(f"City {index % 97}"),
+                            "Status": _select("Planned"),
+                            "Dates": _date(start, end),
+                            "Budget": _number(5000),
+                            "Notes": _rich_text("Trip notes " * 10),
+                        }
+                    ),
+                    self._edited(),
+                )
+            )
+        self.pages["trips"] = trips
+
+        for dataset in (*CHILD_DATASETS, GENERIC_DATASET):
+            rows: list[dict[str, Any]] = []
+            for trip_id, start in trip_starts:
+                for index in range(self.config.children_per_dataset):
+                    page_id = f"{dataset}-{trip_id}-{index:04d}"
+                    when = start + timedelta(hours=self._random.randint(0, 24 * 10))
+                    rows.append(
+                        _page(page_id, self._child_properties(dataset, trip_id, index, when), self._edited())
+                    )
+            self.pages[dataset] = rows
+
+    def _child_properties(
+        self, dataset: str, trip_id: str, index: int, when: datetime
+    ) -> dict[str, Any]:
+        later = when + timedelta(hours=self._random.randint(1, 6))
+        properties: dict[str, Any] = {
+            "Name": _title(f"{dataset.title()} {index}"),
+            "Trip": _relation(trip_id),
+            "Status": _select("Booked"),
+            "Notes": _rich_text("Some notes about this booking " * 3),
+            "Cost": _number(round(self._random.uniform(10, 900), 2)),
+            "URL": _url(f"https://example.com/{dataset}/{index}"),
+        }
+        if dataset == "flights":
+            properties.update(
+                {
+                    "Airline": _select("Example Air"),
+                    "Flight Number": _rich_text(f"EX{index:03d}"),
+                    "Departure Airport": _rich_text("AAA"),
+                    "Arrival Airport": _rich_text("BBB"),
+                    "Departure Time": _date(when),
+                    "Arrival Time": _date(later),
+                    "Seat": _rich_text("12A"),
+                    "Confirmation": _rich_text("ABC123"),
+                }
+            )
+        elif dataset == "lodging":
+            properties.update(
+                {
+                    "Address": _rich_text("1 Example Street"),
+                    "Check-In": _date(when),
+                    "Check-Out": _date(later + timedelta(days=2)),
+                    "Reservation Number": _rich_text("R-123"),
+                    "Cost Per Night": _number(150),
+                }
+            )
+        elif dataset in ("transportation", "activities"):
+            properties.update(
+                {
+                    "Type": _select("Train"),
+                    "Category": _select("Tour"),
+                    "Start Time": _date(when),
+                    "End Time": _date(later),
+                    "Start Location": _rich_text("Station A"),
+                    "End Location": _rich_text("Station B"),
+                    "Location": _rich_text("Somewhere"),
+                }
+            )
+        elif dataset == "dining":
+            properties.update(
+                {
+                    "Cuisine": _select("Italian"),
+                    "Meal Type": _select("Dinner"),
+                    "Reservation Time": _date(when),
+                    "Location": _rich_text("Main Square"),
+                }
+            )
+        elif dataset == "notes":
+            properties.update(
+                {
+                    "Category": _select("Tip"),
+                    "Date Relevant": _date(when),
+                    "Content": _rich_text("Remember this " * 20),
+                }
+            )
+        else:
+            properties.update(
+                {
+                    "Quantity": _number(index),
+                    "Packed": {"id": "chk", "type": "checkbox", "checkbox": bool(index % 2)},
+                    "Start Time": _date(when),
+                }
+            )
+        return self._extra(properties)
@@ -6,12 +6,19 @@ import logging
 
 import voluptuous as vol
 
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.discovery import async_load_platform
 
 from .const import (
+    ATTRIBUTE_MODES,
+    CONF_ACTIVE_INTERVAL,
+    CONF_ACTIVE_WINDOW_DAYS,
+    CONF_ADAPTIVE,
     CONF_ADDITIONAL_DATABASES,
+    CONF_ATTRIBUTE_MODE,
+    CONF_DATABASE_ID,
     CONF_DATABASES,
     CONF_DB_ACTIVITIES,
     CONF_DB_DINING,
@@ -20,13 +27,42 @@ from .const import (
     CONF_DB_NOTES,
     CONF_DB_TRANSPORTATION,
     CONF_DB_TRIPS,
+    CONF_EXCLUDE_STATUSES,
+    CONF_EXECUTOR_THRESHOLD,
+    CONF_FULL_SYNC_INTERVAL,
+    CONF_IDLE_AFTER,
+    CONF_IDLE_INTERVAL,
+    CONF_INCREMENTAL_SYNC,
+    CONF_INTERVAL,
+    CONF_LIMIT_CHILDREN_TO_TRIPS,
+    CONF_MAX_TRIPS,
+    CONF_PAST_TRIP_DAYS,
+    CONF_PROPERTIES,
+    CONF_QUERY_FILTERS,
+    CONF_REFRESH_POLICIES,
     CONF_SCAN_INTERVAL,
     CONF_TOKEN,
+    CONF_TRIP_ENTITIES,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_VERIFICATION_TOKEN,
+    CONF_WORKSPACES,
     DATA_CONFIG,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_ACTIVE_WINDOW_DAYS,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_EXECUTOR_THRESHOLD,
+    DEFAULT_FULL_SYNC_INTERVAL,
+    DEFAULT_IDLE_AFTER,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_INCREMENTAL_SYNC,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MIN_SCAN_INTERVAL,
+    PLATFORMS,
 )
+from .services import async_register_services
+from .webhook import async_register_webhook
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,19 +78,114 @@ DATABASES_SCHEMA = vol.Schema(
     }
 )
 
-ADDITIONAL_DATABASES_SCHEMA = vol.Schema({cv.string: cv.string})
 
+def _database_id_only(value: str) -> dict[str, str]:
+    return {CONF_DATABASE_ID: value}
+
+
+# An additional database is either its ID, or its ID plus the properties to
+# publish; unlisted properties are then only parsed on request.
+ADDITIONAL_DATABASE_SCHEMA = vol.Any(
+    vol.All(cv.string, _database_id_only),
+    vol.Schema(
+        {
+            vol.Required(CONF_DATABASE_ID): cv.string,
+            vol.Optional(CONF_PROPERTIES): vol.All(cv.ensure_list, [cv.string]),
+        }
+    ),
+)
+
+ADDITIONAL_DATABASES_SCHEMA = vol.Schema({cv.string: ADDITIONAL_DATABASE_SCHEMA})
+
+INTERVAL_SECONDS = vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL))
+
+REFRESH_POLICY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_INTERVAL): INTERVAL_SECONDS,
+        vol.Optional(CONF_ADAPTIVE, default=False): cv.boolean,
+        vol.Optional(CONF_ACTIVE_INTERVAL, default=DEFAULT_ACTIVE_INTERVAL): INTERVAL_SECONDS,
+        vol.Optional(CONF_ACTIVE_WINDOW_DAYS, default=DEFAULT_ACTIVE_WINDOW_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_IDLE_INTERVAL, default=DEFAULT_IDLE_INTERVAL): INTERVAL_SECONDS,
+        vol.Optional(CONF_IDLE_AFTER, default=DEFAULT_IDLE_AFTER): INTERVAL_SECONDS,
+    }
+)
+
+REFRESH_POLICIES_SCHEMA = vol.Schema({cv.string: REFRESH_POLICY_SCHEMA})
+
+QUERY_FILTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_PAST_TRIP_DAYS): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(CONF_EXCLUDE_STATUSES, default=[]): vol.All(
+            cv.ensure_list, [cv.string]
+        ),
+        vol.Optional(CONF_LIMIT_CHILDREN_TO_TRIPS, default=False): cv.boolean,
+    }
+)
+
+TRIP_ENTITIES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MAX_TRIPS, default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(CONF_PAST_TRIP_DAYS, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+    }
+)
+
+WORKSPACE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TOKEN): cv.string,
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)
+        ),
+        vol.Optional(CONF_INCREMENTAL_SYNC, default=DEFAULT_INCREMENTAL_SYNC): cv.boolean,
+        vol.Optional(CONF_FULL_SYNC_INTERVAL, default=DEFAULT_FULL_SYNC_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)
+        ),
+        vol.Optional(CONF_EXECUTOR_THRESHOLD, default=DEFAULT_EXECUTOR_THRESHOLD): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_ATTRIBUTE_MODE, default=DEFAULT_ATTRIBUTE_MODE): vol.In(
+            ATTRIBUTE_MODES
+        ),
+        vol.Required(CONF_DATABASES): DATABASES_SCHEMA,
+        vol.Optional(CONF_ADDITIONAL_DATABASES, default={}): ADDITIONAL_DATABASES_SCHEMA,
+        vol.Optional(CONF_REFRESH_POLICIES, default={}): REFRESH_POLICIES_SCHEMA,
+        vol.Optional(CONF_WEBHOOK_ID): cv.string,
+        vol.Optional(CONF_WEBHOOK_VERIFICATION_TOKEN): cv.string,
+        vol.Optional(CONF_QUERY_FILTERS, default={}): QUERY_FILTERS_SCHEMA,
+        vol.Optional(CONF_TRIP_ENTITIES, default={}): TRIP_ENTITIES_SCHEMA,
+    }
+)
+
+NAMED_WORKSPACE_SCHEMA = WORKSPACE_SCHEMA.extend({vol.Required(CONF_NAME): cv.slug})
+
+
+def _unique_workspaces(workspaces: list[dict]) -> list[dict]:
+    for key in (CONF_NAME, CONF_WEBHOOK_ID):
+        values = [workspace[key] for workspace in workspaces if key in workspace]
+        if len(values) != len(set(values)):
+            raise vol.Invalid(f"Each workspace needs a different {key}")
+    return workspaces
+
+
+# Either one workspace configured directly, or a list of named workspaces
+# (each with its own token, databases and options).
 CONFIG_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
-            {
-                vol.Required(CONF_TOKEN): cv.string,
-                vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
-                    vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)
-                ),
-                vol.Required(CONF_DATABASES): DATABASES_SCHEMA,
-                vol.Optional(CONF_ADDITIONAL_DATABASES, default={}): ADDITIONAL_DATABASES_SCHEMA,
-            }
+        DOMAIN: vol.Any(
+            WORKSPACE_SCHEMA,
+            vol.Schema(
+                {
+                    vol.Required(CONF_WORKSPACES): vol.All(
+                        cv.ensure_list,
+                        vol.Length(min=1),
+                        [NAMED_WORKSPACE_SCHEMA],
+                        _unique_workspaces,
+                    )
+                }
+            ),
         )
     },
     extra=vol.ALLOW_EXTRA,
@@ -67,9 +198,27 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     if not domain_config:
         return True
 
+    if CONF_WORKSPACES in domain_config:
+        workspaces = {
+            workspace[CONF_NAME]: workspace for workspace in domain_config[CONF_WORKSPACES]
+        }
+    else:
+        workspaces = {None: domain_config}
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][DATA_CONFIG] = domain_config
+    hass.data[DOMAIN][DATA_CONFIG] = workspaces
+    async_register_services(hass)
+    async_register_websocket_commands(hass)
+    for workspace, workspace_config in workspaces.items():
+        if CONF_WEBHOOK_ID in workspace_config:
+            await async_register_webhook(
+                hass,
+                workspace,
+                workspace_config[CONF_WEBHOOK_ID],
+                workspace_config.get(CONF_WEBHOOK_VERIFICATION_TOKEN),
+            )
 
-    _LOGGER.debug("Loaded %s YAML config and scheduling sensor platform", DOMAIN)
-    hass.async_create_task(async_load_platform(hass, "sensor", DOMAIN, {}, config))
+    _LOGGER.debug("Loaded %s YAML config and scheduling platforms", DOMAIN)
+    for platform in PLATFORMS:
+        hass.async_create_task(async_load_platform(hass, platform, DOMAIN, {}, config))
     return True
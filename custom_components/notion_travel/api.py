@@ -0,0 +1,250 @@
+"""Notion API client for the Notion Travel integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, replace
+import json
+import logging
+import random
+import time
+from typing import Any
+
+from aiohttp import ClientError, ClientSession
+
+from .const import (
+    API_BASE_URL,
+    NOTION_BACKOFF_BASE_SECONDS,
+    NOTION_BACKOFF_MAX_SECONDS,
+    NOTION_MAX_CONCURRENT_REQUESTS,
+    NOTION_MAX_RETRIES,
+    NOTION_RATE_LIMIT_BURST,
+    NOTION_RATE_LIMIT_PER_SECOND,
+    NOTION_REQUEST_TIMEOUT,
+    NOTION_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class NotionApiError(Exception):
+    """Raised when a Notion API call fails after all retries."""
+
+
+@dataclass(slots=True)
+class ApiMetrics:
+    """Cumulative request counters for one client."""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    response_bytes: int = 0
+    http_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    def copy(self) -> ApiMetrics:
+        """Return a point-in-time copy."""
+        return replace(self)
+
+    def since(self, start: ApiMetrics) -> dict[str, Any]:
+        """Return counter deltas since `start`, with durations in milliseconds."""
+        return {
+            "requests": self.requests - start.requests,
+            "retries": self.retries - start.retries,
+            "errors": self.errors - start.errors,
+            "response_bytes": self.response_bytes - start.response_bytes,
+            "http_ms": round((self.http_seconds - start.http_seconds) * 1000, 2),
+            "decode_ms": round((self.decode_seconds - start.decode_seconds) * 1000, 2),
+        }
+
+
+class TokenBucket:
+    """Async token bucket limiting the request rate."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize limiter with a refill rate (tokens/second) and capacity."""
+        self._rate = rate
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until one token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket so no request starts for roughly `seconds`."""
+        self._tokens = min(self._tokens, -seconds * self._rate)
+        self._updated = time.monotonic()
+
+
+class NotionApiClient:
+    """Concurrency-limited, rate-limit-aware Notion HTTP client."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        token: str,
+        limiter: TokenBucket | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize client."""
+        self._session = session
+        self._token = token
+        self._limiter = limiter or TokenBucket(
+            NOTION_RATE_LIMIT_PER_SECOND, NOTION_RATE_LIMIT_BURST
+        )
+        self._semaphore = semaphore or asyncio.Semaphore(NOTION_MAX_CONCURRENT_REQUESTS)
+        self.metrics = ApiMetrics()
+
+    async def query_database(self, database_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Execute a Notion database query call."""
+        return await self._request(
+            "POST",
+            f"{API_BASE_URL}/databases/{database_id}/query",
+            f"database {database_id}",
+            payload,
+        )
+
+    async def retrieve_database(self, database_id: str) -> dict[str, Any]:
+        """Retrieve one Notion database, including its property schema."""
+        return await self._request(
+            "GET", f"{API_BASE_URL}/databases/{database_id}", f"database {database_id}"
+        )
+
+    async def retrieve_page(self, page_id: str) -> dict[str, Any]:
+        """Retrieve one Notion page by ID."""
+        return await self._request("GET", f"{API_BASE_URL}/pages/{page_id}", f"page {page_id}")
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        target: str,
+        payload: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send one API request, retrying rate-limited and transient failures."""
+        headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Notion-Version": NOTION_VERSION,
+            "Content-Type": "application/json",
+        }
+
+        attempt = 0
+        while True:
+            retry_after: float | None = None
+            # Wait for this token's rate budget before taking an in-flight slot,
+            # so a token paused by a 429 does not hold slots other tokens need.
+            await self._limiter.acquire()
+            async with self._semaphore:
+                started = time.perf_counter()
+                try:
+                    async with self._session.request(
+                        method, url, headers=headers, json=payload, timeout=NOTION_REQUEST_TIMEOUT
+                    ) as response:
+                        body = await response.read()
+                        self.metrics.requests += 1
+                        self.metrics.response_bytes += len(body)
+                        self.metrics.http_seconds += time.perf_counter() - started
+                        if response.status == 200:
+                            decode_started = time.perf_counter()
+                            result = json.loads(body)
+                            self.metrics.decode_seconds += time.perf_counter() - decode_started
+                            return result
+
+                        if response.status not in RETRYABLE_STATUSES or attempt >= NOTION_MAX_RETRIES:
+                            self.metrics.errors += 1
+                            raise NotionApiError(
+                                f"Notion API error ({response.status}) for {target}: "
+                                f"{body.decode(errors='replace')}"
+                            )
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                        reason = f"HTTP {response.status}"
+                except (ClientError, asyncio.TimeoutError) as err:
+                    self.metrics.http_seconds += time.perf_counter() - started
+                    if attempt >= NOTION_MAX_RETRIES:
+                        self.metrics.errors += 1
+                        raise NotionApiError(
+                            f"Notion API connection error for {target}: {err}"
+                        ) from err
+                    reason = repr(err)
+
+            delay = self._backoff_delay(attempt, retry_after)
+            if retry_after is not None:
+                self._limiter.pause(delay)
+            attempt += 1
+            self.metrics.retries += 1
+            _LOGGER.debug(
+                "Retrying Notion request for %s in %.1fs after %s (attempt %d/%d)",
+                target,
+                delay,
+                reason,
+                attempt,
+                NOTION_MAX_RETRIES,
+            )
+            await asyncio.sleep(delay)
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Return the wait before the next attempt, honoring Retry-After."""
+        if retry_after is not None:
+            return min(
+                retry_after + random.uniform(0, NOTION_BACKOFF_BASE_SECONDS),
+                NOTION_BACKOFF_MAX_SECONDS,
+            )
+        ceiling = min(NOTION_BACKOFF_MAX_SECONDS, NOTION_BACKOFF_BASE_SECONDS * 2**attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class NotionClientPool:
+    """Create clients that share one HTTP session and per-token rate budgets.
+
+    Notion rate-limits each integration token, so all clients for one token
+    draw from the same token bucket (and back off together on `429`), while
+    one semaphore caps in-flight requests across every token. Each client
+    still keeps its own metrics.
+    """
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize pool around a shared session."""
+        self._session = session
+        self._semaphore = asyncio.Semaphore(NOTION_MAX_CONCURRENT_REQUESTS)
+        self._limiters: dict[str, TokenBucket] = {}
+
+    def client(self, token: str) -> NotionApiClient:
+        """Return a new client drawing on the shared budget for `token`."""
+        limiter = self._limiters.get(token)
+        if limiter is None:
+            limiter = self._limiters[token] = TokenBucket(
+                NOTION_RATE_LIMIT_PER_SECOND, NOTION_RATE_LIMIT_BURST
+            )
+        return NotionApiClient(
+            self._session, token, limiter=limiter, semaphore=self._semaphore
+        )
+
+    @property
+    def token_count(self) -> int:
+        """Return the number of distinct tokens with a rate budget."""
+        return len(self._limiters)
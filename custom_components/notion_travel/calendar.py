@@ -0,0 +1,102 @@
+"""Calendar platform for the Notion Travel integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import NotionTravelDataUpdateCoordinator, async_get_coordinators
+from .models import CalendarIndex, CalendarItem
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up Notion Travel calendars from YAML config, for every workspace."""
+    coordinators = await async_get_coordinators(hass)
+    if not coordinators:
+        _LOGGER.error("%s config missing in hass.data", DOMAIN)
+        return
+
+    for coordinator in coordinators:
+        if not coordinator.last_update_success:
+            _LOGGER.error("Initial %s refresh failed; calendars not added", coordinator.name)
+            continue
+
+        async_add_entities(
+            [
+                NotionTravelCalendar(
+                    coordinator,
+                    "trip_calendar",
+                    coordinator.entity_name("Trips"),
+                    coordinator.unique_id("trips_calendar"),
+                ),
+                NotionTravelCalendar(
+                    coordinator,
+                    "event_calendar",
+                    coordinator.entity_name("Itinerary"),
+                    coordinator.unique_id("itinerary_calendar"),
+                ),
+            ]
+        )
+
+
+class NotionTravelCalendar(
+    CoordinatorEntity[NotionTravelDataUpdateCoordinator], CalendarEntity
+):
+    """Calendar answered from one of the coordinator's calendar indexes."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:calendar-month"
+
+    def __init__(
+        self,
+        coordinator: NotionTravelDataUpdateCoordinator,
+        data_key: str,
+        name: str,
+        unique_id: str,
+    ) -> None:
+        """Initialize calendar."""
+        super().__init__(coordinator)
+        self._data_key = data_key
+        self._attr_name = name
+        self._attr_unique_id = unique_id
+
+    def _index(self) -> CalendarIndex:
+        return (self.coordinator.data or {}).get(self._data_key) or CalendarIndex()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next upcoming entry."""
+        item = self._index().next_after(dt_util.utcnow())
+        return _calendar_event(item) if item else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return entries overlapping the requested range."""
+        return [_calendar_event(item) for item in self._index().between(start_date, end_date)]
+
+
+def _calendar_event(item: CalendarItem) -> CalendarEvent:
+    return CalendarEvent(
+        start=item.start,
+        end=item.end,
+        summary=item.summary,
+        description=item.description or None,
+        location=item.location or None,
+        uid=item.uid,
+    )
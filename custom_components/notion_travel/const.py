@@ -9,10 +9,45 @@ DOMAIN = "notion_travel"
 API_BASE_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
 
+# Notion allows an average of three requests per second per integration.
+NOTION_RATE_LIMIT_PER_SECOND = 3
+NOTION_RATE_LIMIT_BURST = 3
+NOTION_MAX_CONCURRENT_REQUESTS = 3
+NOTION_MAX_RETRIES = 4
+NOTION_BACKOFF_BASE_SECONDS = 1.0
+NOTION_BACKOFF_MAX_SECONDS = 60.0
+NOTION_REQUEST_TIMEOUT = 30
+
 CONF_TOKEN = "token"
+CONF_WORKSPACES = "workspaces"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_DATABASES = "databases"
 CONF_ADDITIONAL_DATABASES = "additional_databases"
+CONF_INCREMENTAL_SYNC = "incremental_sync"
+CONF_FULL_SYNC_INTERVAL = "full_sync_interval"
+CONF_EXECUTOR_THRESHOLD = "executor_threshold"
+CONF_ATTRIBUTE_MODE = "attribute_mode"
+CONF_REFRESH_POLICIES = "refresh_policies"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_WEBHOOK_VERIFICATION_TOKEN = "webhook_verification_token"
+CONF_QUERY_FILTERS = "query_filters"
+
+CONF_PAST_TRIP_DAYS = "past_trip_days"
+CONF_EXCLUDE_STATUSES = "exclude_statuses"
+CONF_LIMIT_CHILDREN_TO_TRIPS = "limit_children_to_trips"
+
+CONF_TRIP_ENTITIES = "trip_entities"
+CONF_MAX_TRIPS = "max_trips"
+
+CONF_DATABASE_ID = "database_id"
+CONF_PROPERTIES = "properties"
+
+CONF_INTERVAL = "interval"
+CONF_ADAPTIVE = "adaptive"
+CONF_ACTIVE_INTERVAL = "active_interval"
+CONF_ACTIVE_WINDOW_DAYS = "active_window_days"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_IDLE_AFTER = "idle_after"
 
 CONF_DB_TRIPS = "trips"
 CONF_DB_FLIGHTS = "flights"
@@ -22,13 +57,60 @@ CONF_DB_ACTIVITIES = "activities"
 CONF_DB_DINING = "dining"
 CONF_DB_NOTES = "notes"
 
+# hass.data[DOMAIN][DATA_CONFIG] and [DATA_COORDINATORS] are keyed by workspace
+# name; the workspace configured directly under `notion_travel:` is None.
 DATA_CONFIG = "config"
-DATA_COORDINATOR = "coordinator"
+DATA_COORDINATORS = "coordinators"
+DATA_CLIENT_POOL = "client_pool"
+DATA_COORDINATOR_LOCKS = "coordinator_locks"
+
+SERVICE_REFRESH_PAGE = "refresh_page"
+SERVICE_GET_DIAGNOSTICS = "get_diagnostics"
+ATTR_PAGE_ID = "page_id"
+ATTR_WORKSPACE = "workspace"
+
+WS_TYPE_TRIP_TIMELINE = f"{DOMAIN}/trip_timeline"
+WS_TYPE_ITEM_PROPERTIES = f"{DOMAIN}/item_properties"
+
+# Notion caps compound filters at 100 conditions; child queries only filter
+# by trip relation when the in-scope trips fit comfortably under that.
+MAX_RELATION_FILTER_TRIPS = 50
+
+# Change notifications arriving within this window are coalesced into one refresh.
+WEBHOOK_DEBOUNCE_SECONDS = 5
+NOTION_SIGNATURE_HEADER = "X-Notion-Signature"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY = 30
+ENTITY_STORAGE_KEY = f"{DOMAIN}.trip_entities"
+ENTITY_SAVE_DELAY = 10
+WEBHOOK_STORAGE_KEY = f"{DOMAIN}.webhook"
 
 DEFAULT_SCAN_INTERVAL = 1800
 MIN_SCAN_INTERVAL = 60
+DEFAULT_INCREMENTAL_SYNC = True
+DEFAULT_FULL_SYNC_INTERVAL = 21600
+DEFAULT_EXECUTOR_THRESHOLD = 500
+DEFAULT_ACTIVE_INTERVAL = 300
+DEFAULT_ACTIVE_WINDOW_DAYS = 2
+DEFAULT_IDLE_INTERVAL = 7200
+DEFAULT_IDLE_AFTER = 259200
+
+ATTRIBUTE_MODE_FULL = "full"
+ATTRIBUTE_MODE_COMPACT = "compact"
+ATTRIBUTE_MODES = [ATTRIBUTE_MODE_FULL, ATTRIBUTE_MODE_COMPACT]
+DEFAULT_ATTRIBUTE_MODE = ATTRIBUTE_MODE_FULL
+COMPACT_UPCOMING_EVENTS = 3
+
+# Notion rounds last_edited_time to the minute, so incremental queries
+# re-read a small overlap before the previous sync watermark.
+INCREMENTAL_SYNC_OVERLAP_SECONDS = 120
+
+PLATFORMS = [Platform.SENSOR, Platform.CALENDAR]
 
-PLATFORMS = [Platform.SENSOR]
+# Calendar length of timed events that have no (or no later) end in Notion.
+CALENDAR_DEFAULT_EVENT_MINUTES = 60
 
 DOMAIN_LABELS = {
     CONF_DB_FLIGHTS: "Flights",
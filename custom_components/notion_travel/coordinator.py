@@ -3,19 +3,33 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 import logging
+import time
 from typing import Any
 
-from aiohttp import ClientError
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .api import ApiMetrics, NotionApiError, NotionClientPool
 from .const import (
-    API_BASE_URL,
+    CALENDAR_DEFAULT_EVENT_MINUTES,
+    CONF_ACTIVE_INTERVAL,
+    CONF_ACTIVE_WINDOW_DAYS,
+    CONF_ADAPTIVE,
+    CONF_ADDITIONAL_DATABASES,
+    CONF_ATTRIBUTE_MODE,
+    CONF_DATABASE_ID,
+    CONF_DATABASES,
     CONF_DB_ACTIVITIES,
     CONF_DB_DINING,
     CONF_DB_FLIGHTS,
@@ -23,11 +37,39 @@ from .const import (
     CONF_DB_NOTES,
     CONF_DB_TRANSPORTATION,
     CONF_DB_TRIPS,
+    CONF_EXCLUDE_STATUSES,
+    CONF_EXECUTOR_THRESHOLD,
+    CONF_FULL_SYNC_INTERVAL,
+    CONF_IDLE_AFTER,
+    CONF_IDLE_INTERVAL,
+    CONF_INCREMENTAL_SYNC,
+    CONF_INTERVAL,
+    CONF_LIMIT_CHILDREN_TO_TRIPS,
+    CONF_PAST_TRIP_DAYS,
+    CONF_PROPERTIES,
+    CONF_QUERY_FILTERS,
+    CONF_REFRESH_POLICIES,
+    CONF_SCAN_INTERVAL,
+    CONF_TOKEN,
+    DATA_CLIENT_POOL,
+    DATA_CONFIG,
+    DATA_COORDINATOR_LOCKS,
+    DATA_COORDINATORS,
+    DEFAULT_ATTRIBUTE_MODE,
+    DEFAULT_EXECUTOR_THRESHOLD,
+    DEFAULT_FULL_SYNC_INTERVAL,
+    DEFAULT_INCREMENTAL_SYNC,
     DOMAIN,
-    ICON_BY_DOMAIN,
-    NOTION_VERSION,
+    INCREMENTAL_SYNC_OVERLAP_SECONDS,
+    MAX_RELATION_FILTER_TRIPS,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    WEBHOOK_DEBOUNCE_SECONDS,
 )
 from .helpers import (
+    PropertyResolver,
+    calendar_span,
     extract_date_end,
     extract_date_start,
     extract_date_time_zone,
@@ -35,14 +77,28 @@ from .helpers import (
     extract_multi_select,
     extract_number,
     extract_phone,
-    extract_relation_ids,
     extract_rich_text,
     extract_select,
     extract_title,
     extract_url,
-    get_property,
+    fingerprint,
+    normalize_notion_id,
+    parse_datetime,
+    parse_generic_property,
     parse_trip_relation_ids,
     safe_float,
+    trip_relation_key,
+    workspace_key,
+)
+from .models import (
+    CalendarIndex,
+    CalendarItem,
+    ChildItem,
+    RelationGraph,
+    Timeline,
+    TimelineEvent,
+    Trip,
+    TripView,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -57,215 +113,1315 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         token: str,
         databases: dict[str, str],
         scan_interval_seconds: int,
+        incremental_sync: bool = DEFAULT_INCREMENTAL_SYNC,
+        full_sync_interval_seconds: int = DEFAULT_FULL_SYNC_INTERVAL,
+        executor_threshold: int = DEFAULT_EXECUTOR_THRESHOLD,
+        attribute_mode: str = DEFAULT_ATTRIBUTE_MODE,
+        refresh_policies: dict[str, dict[str, Any]] | None = None,
+        query_filters: dict[str, Any] | None = None,
+        generic_properties: dict[str, list[str]] | None = None,
+        workspace: str | None = None,
     ) -> None:
-        """Initialize coordinator."""
-        self._token = token
+        """Initialize coordinator.
+
+        `workspace` names one of several configured workspaces; it namespaces
+        the snapshot, entity unique IDs and entity names.
+        """
+        self._workspace = workspace
         self._databases = databases
         self._child_datasets = tuple(
             dataset for dataset in databases if dataset != CONF_DB_TRIPS
         )
-        self._session = async_get_clientsession(hass)
+        self._client = async_get_client_pool(hass).client(token)
+        self._incremental_sync = incremental_sync
+        self._full_sync_interval = timedelta(seconds=full_sync_interval_seconds)
+        self._raw_pages: dict[str, dict[str, dict[str, Any]]] = {}
+        self._records: dict[str, dict[str, Trip | ChildItem]] = {}
+        self._resolvers: dict[str, PropertyResolver] = {}
+        self._sync_watermarks: dict[str, datetime] = {}
+        self._last_full_syncs: dict[str, datetime] = {}
+        self._scan_interval_seconds = scan_interval_seconds
+        self._refresh_policies = refresh_policies or {}
+        self._query_filters = query_filters or {}
+        self._generic_properties = generic_properties or {}
+        self._next_due: dict[str, datetime] = {}
+        self._last_edited: dict[str, datetime] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, workspace_key(STORAGE_KEY, workspace)
+        )
+        self._executor_threshold = executor_threshold
+        self._normalize_stats: dict[str, Any] = {}
+        self._relink_pending = False
+        self._fetch_stats: dict[str, dict[str, Any]] = {}
+        self._fetched_rows = 0
+        self._refresh_metrics: dict[str, Any] = {}
+        self._attribute_mode = attribute_mode
+        self._trip_views: dict[str, TripView] = {}
+        self._dataset_by_database_id = {
+            normalize_notion_id(database_id): dataset
+            for dataset, database_id in databases.items()
+        }
+        self._pending_datasets: set[str] = set()
+        self._pending_pages: set[str] = set()
+        self._unsub_time_boundary: CALLBACK_TYPE | None = None
+        self._update_task: asyncio.Task[dict[str, Any]] | None = None
+        self._update_datasets: frozenset[str] = frozenset()
 
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval_seconds),
+            name=workspace_key(DOMAIN, workspace),
+            update_interval=timedelta(seconds=self._tick_seconds()),
+        )
+        self._targeted_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WEBHOOK_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self._async_refresh_pending,
         )
 
+    def _tick_seconds(self) -> int:
+        """Return the coordinator interval: the shortest any dataset may poll."""
+        intervals = [self._scan_interval_seconds]
+        for dataset, policy in self._refresh_policies.items():
+            if dataset not in self._databases:
+                _LOGGER.warning("Ignoring refresh policy for unknown dataset %s", dataset)
+                continue
+            intervals.append(policy.get(CONF_INTERVAL, self._scan_interval_seconds))
+            if policy.get(CONF_ADAPTIVE):
+                intervals.append(policy[CONF_ACTIVE_INTERVAL])
+        return min(intervals)
+
+    @property
+    def workspace(self) -> str | None:
+        """Return the workspace name, None for the unnamed workspace."""
+        return self._workspace
+
+    def unique_id(self, suffix: str) -> str:
+        """Return an entity unique ID, namespaced by workspace."""
+        return f"{workspace_key(DOMAIN, self._workspace)}_{suffix}"
+
+    def entity_name(self, name: str) -> str:
+        """Return an entity name, prefixed with the workspace when named."""
+        if self._workspace is None:
+            return name
+        return f"{self._workspace.replace('_', ' ').title()} {name}"
+
+    def has_page(self, page_id: str) -> bool:
+        """Return True when the page is cached by this coordinator."""
+        return self._dataset_for_page(page_id) is not None
+
     @property
     def child_datasets(self) -> tuple[str, ...]:
         """Return configured non-trip datasets."""
         return self._child_datasets
 
+    @property
+    def attribute_mode(self) -> str:
+        """Return how much timeline detail sensors publish as attributes."""
+        return self._attribute_mode
+
+    @property
+    def normalize_stats(self) -> dict[str, Any]:
+        """Return timing details of the most recent normalization."""
+        return self._normalize_stats
+
+    @property
+    def refresh_metrics(self) -> dict[str, Any]:
+        """Return stage timings and API usage of the most recent Notion refresh."""
+        return self._refresh_metrics
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return sync state and cumulative API usage for diagnostics."""
+        return {
+            "workspace": self._workspace,
+            "databases": list(self._databases),
+            "last_update_success": self.last_update_success,
+            "update_interval": self.update_interval.total_seconds() if self.update_interval else None,
+            "next_due": {dataset: due.isoformat() for dataset, due in self._next_due.items()},
+            "sync_watermarks": {
+                dataset: value.isoformat() for dataset, value in self._sync_watermarks.items()
+            },
+            "last_full_syncs": {
+                dataset: value.isoformat() for dataset, value in self._last_full_syncs.items()
+            },
+            "cached_rows": {dataset: len(records) for dataset, records in self._records.items()},
+            "trips": len((self.data or {}).get("trips", [])),
+            "api_totals": self._client.metrics.since(ApiMetrics()),
+            "last_refresh": self._refresh_metrics,
+        }
+
+    def get_item_properties(
+        self, item_id: str, names: list[str] | None = None
+    ) -> dict[str, Any] | None:
+        """Parse properties of one cached child item on request.
+
+        Returns every property (or just `names`) of the item's raw page,
+        including those left out of a dataset's configured projection.
+        """
+        item = self.get_item(item_id)
+        if item is None:
+            return None
+        page = self._raw_pages.get(item.dataset, {}).get(item_id)
+        if page is None:
+            return None
+        properties = page.get("properties", {})
+        return self._parse_generic_properties(
+            properties, names, self._resolver(item.dataset, properties)
+        )
+
+    def get_item(self, item_id: str) -> ChildItem | None:
+        """Return one linked child item by ID."""
+        relations: RelationGraph | None = (self.data or {}).get("relations")
+        return relations.get_item(item_id) if relations else None
+
+    def get_item_trips(self, item_id: str) -> list[Trip]:
+        """Return the loaded trips one child item links to (e.g. a shared lodging)."""
+        data = self.data or {}
+        relations: RelationGraph | None = data.get("relations")
+        if relations is None:
+            return []
+        trip_index = data["trip_index"]
+        return [
+            trip_index[trip_id]
+            for trip_id in relations.trips_for_item(item_id)
+            if trip_id in trip_index
+        ]
+
+    def get_trip(self, trip_id: str | None = None) -> Trip | None:
+        """Return one normalized trip, defaulting to the next trip."""
+        data = self.data or {}
+        trip_id = trip_id or data.get("next_trip_id")
+        if not trip_id:
+            return None
+        return data.get("trip_index", {}).get(trip_id)
+
+    def trip_view(self, trip: Trip) -> TripView:
+        """Return the cached attribute/websocket payloads of one trip.
+
+        Views are rebuilt only when the trip's fingerprint or upcoming window
+        changed, so sensors and websocket clients share one payload per change.
+        """
+        view = self._trip_views.get(trip.id)
+        if view is None or view.key != TripView.key_for(trip):
+            view = self._trip_views[trip.id] = TripView(trip, self._attribute_mode)
+        return view
+
+    async def async_request_targeted_refresh(
+        self,
+        database_ids: Iterable[str] = (),
+        page_ids: Iterable[str] = (),
+    ) -> None:
+        """Queue a debounced refresh of the pages/datasets named by a change notification.
+
+        Named pages are refetched individually. Notifications naming only
+        databases refresh those datasets; when nothing can be mapped, every
+        dataset is refreshed.
+        """
+        page_ids = set(page_ids)
+        if page_ids:
+            self._pending_pages.update(page_ids)
+        else:
+            datasets = {
+                self._dataset_by_database_id[normalize_notion_id(database_id)]
+                for database_id in database_ids
+                if normalize_notion_id(database_id) in self._dataset_by_database_id
+            }
+            self._pending_datasets.update(datasets or self._databases)
+        await self._targeted_refresh_debouncer.async_call()
+
+    async def _async_refresh_pending(self) -> None:
+        """Refresh pages and datasets queued by change notifications."""
+        page_ids, self._pending_pages = self._pending_pages, set()
+        datasets, self._pending_datasets = self._pending_datasets, set()
+
+        if page_ids:
+            try:
+                await self.async_refresh_pages(page_ids)
+            except NotionApiError as err:
+                _LOGGER.warning("Targeted Notion page refresh failed, refreshing all: %s", err)
+                datasets.update(self._databases)
+
+        if not datasets:
+            return
+        _LOGGER.debug("Refreshing %s after change notification", ", ".join(sorted(datasets)))
+        for dataset in datasets:
+            self._next_due.pop(dataset, None)
+        await self._async_refresh_due()
+
+    async def async_refresh(self) -> None:
+        """Refresh every dataset now.
+
+        Only the scheduled poll follows refresh policies; explicit refreshes
+        (`homeassistant.update_entity`, `async_request_refresh`) fetch all
+        datasets regardless of when each is next due.
+        """
+        self._next_due.clear()
+        await self._async_refresh_due()
+
+    async def _async_refresh_due(self) -> None:
+        """Refresh only the datasets that are currently due."""
+        await super().async_refresh()
+
+    async def async_refresh_pages(self, page_ids: Iterable[str]) -> None:
+        """Refetch individual pages and patch only the trips they belong to.
+
+        Raises NotionApiError when a page cannot be retrieved.
+        """
+        if self.data is None:
+            await self.async_refresh()
+            return
+
+        pages = await asyncio.gather(
+            *(self._client.retrieve_page(page_id) for page_id in set(page_ids))
+        )
+        # Patch on top of an in-flight update's result rather than having it overwrite ours.
+        await self._async_wait_for_update()
+
+        retrieved: list[tuple[str, dict[str, Any]]] = []
+        for page in pages:
+            dataset = self._dataset_for_retrieved_page(page)
+            if dataset is None:
+                _LOGGER.debug("Ignoring page %s outside configured databases", page.get("id"))
+                continue
+            self._store_retrieved_page(dataset, page)
+            retrieved.append((dataset, page))
+
+        # Pages that touch no loaded trip still belong in the snapshot.
+        if retrieved:
+            self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+        if (data := self._apply_pages(self.data, retrieved)) is not None:
+            self.async_set_updated_data(data)
+
+    def _apply_pages(
+        self, data: dict[str, Any], pages: Iterable[tuple[str, dict[str, Any]]]
+    ) -> dict[str, Any] | None:
+        """Patch pages already merged into the record set into coordinator data.
+
+        The trip list, relation graph and calendar indexes are patched in
+        place; only the trips and items the pages touch are visited. Returns
+        None when no loaded trip changed.
+        """
+        trips: list[Trip] = data["trips"]
+        trip_index: dict[str, Trip] = data["trip_index"]
+        relations: RelationGraph = data["relations"]
+        touched: set[str] = set()
+        trip_pages: set[str] = set()
+        item_ids: set[str] = set()
+
+        for dataset, page in pages:
+            page_id = page.get("id", "")
+            if dataset == CONF_DB_TRIPS:
+                was_loaded = page_id in trip_index
+                touched.update(self._apply_trip_page(page, trips, trip_index, relations))
+                is_loaded = page_id in trip_index
+                if was_loaded or is_loaded:
+                    trip_pages.add(page_id)
+                if was_loaded != is_loaded:
+                    # The trip's items enter or leave the itinerary calendar.
+                    item_ids.update(item.id for item in relations.items_for_trip(page_id))
+            else:
+                touched.update(self._apply_child_page(dataset, page, trip_index, relations))
+                item_ids.add(page_id)
+
+        # Archived, trashed or filtered-out trips were dropped without being touched.
+        if not touched and not trip_pages:
+            return None
+
+        now = dt_util.utcnow()
+        for trip_id in touched:
+            if trip := trip_index.get(trip_id):
+                self._finalize_trip(trip, now)
+
+        return self._patch_data(data, trip_pages, item_ids)
+
+    def _dataset_for_retrieved_page(self, page: dict[str, Any]) -> str | None:
+        """Return the dataset of a page from its parent database, then the cache."""
+        parent_id = page.get("parent", {}).get("database_id")
+        if parent_id:
+            dataset = self._dataset_by_database_id.get(normalize_notion_id(parent_id))
+            if dataset is not None:
+                return dataset
+        return self._dataset_for_page(page.get("id", ""))
+
+    def _store_retrieved_page(self, dataset: str, page: dict[str, Any]) -> None:
+        """Merge one retrieved page into the cached page and record sets."""
+        self._merge_changed_pages(dataset, [page])
+        latest = _latest_edit([page])
+        if latest and (dataset not in self._last_edited or latest > self._last_edited[dataset]):
+            self._last_edited[dataset] = latest
+
+    def _apply_trip_page(
+        self,
+        page: dict[str, Any],
+        trips: list[Trip],
+        trip_index: dict[str, Trip],
+        relations: RelationGraph,
+    ) -> set[str]:
+        """Replace, add or drop one trip in place; return the trip IDs to finalize."""
+        trip_id = page.get("id", "")
+        old = trip_index.pop(trip_id, None)
+        if old is not None:
+            del trips[self._trip_position(trips, old)]
+        parsed = self._records.get(CONF_DB_TRIPS, {}).get(trip_id)
+        if parsed is None:
+            return set()
+
+        trip = self._new_trip(parsed)
+        if old is not None:
+            trip.items = old.items
+            trip.timeline = old.timeline
+        else:
+            for item in relations.items_for_trip(trip.id):
+                trip.items[item.dataset].append(item)
+            trip.timeline = self._build_timeline_events(trip)
+        # After trips with the same start, as the stable sort in `_build_data` would.
+        trips.insert(bisect_right(trips, self._trip_sort_key(trip), key=self._trip_sort_key), trip)
+        trip_index[trip.id] = trip
+        return {trip.id}
+
+    def _trip_position(self, trips: list[Trip], trip: Trip) -> int:
+        """Return the index of one trip in the start-sorted trip list."""
+        index = bisect_left(trips, self._trip_sort_key(trip), key=self._trip_sort_key)
+        while trips[index] is not trip:
+            index += 1
+        return index
+
+    def _apply_child_page(
+        self,
+        dataset: str,
+        page: dict[str, Any],
+        trip_index: dict[str, Trip],
+        relations: RelationGraph,
+    ) -> set[str]:
+        """Relink one child item to its trips; return the trip IDs to finalize."""
+        page_id = page.get("id", "")
+        old_trip_ids = relations.trips_for_item(page_id)
+        old = relations.remove(page_id)
+        new = self._records.get(dataset, {}).get(page_id)
+
+        touched: set[str] = set()
+        if old is not None:
+            for trip_id in old_trip_ids:
+                if trip := trip_index.get(trip_id):
+                    items = trip.items.get(old.dataset, [])
+                    items[:] = [item for item in items if item.id != page_id]
+                    trip.timeline.remove(page_id)
+                    touched.add(trip_id)
+        if new is not None:
+            relations.add(new)
+            event = self._build_timeline_event(dataset, new)
+            for trip_id in relations.trips_for_item(new.id):
+                if trip := trip_index.get(trip_id):
+                    trip.items.setdefault(dataset, []).append(new)
+                    trip.timeline.insert(event)
+                    touched.add(trip_id)
+        return touched
+
+    def _dataset_for_page(self, page_id: str) -> str | None:
+        """Return the dataset a cached page belongs to."""
+        normalized = normalize_notion_id(page_id)
+        for dataset, pages in self._raw_pages.items():
+            if any(normalize_notion_id(cached_id) == normalized for cached_id in pages):
+                return dataset
+        return None
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes and the time boundary timer."""
+        self._cancel_time_boundary()
+        self._targeted_refresh_debouncer.async_shutdown()
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, re-arm the time boundary and drop views of removed trips."""
+        self._schedule_time_boundary()
+        trip_index = (self.data or {}).get("trip_index", {})
+        for trip_id in self._trip_views.keys() - trip_index.keys():
+            del self._trip_views[trip_id]
+        super().async_update_listeners()
+
+    @callback
+    def _schedule_time_boundary(self) -> None:
+        """Schedule a local recompute when the next event or trip boundary passes."""
+        self._cancel_time_boundary()
+        if self.data is None:
+            return
+        boundary = self._next_time_boundary(dt_util.utcnow())
+        if boundary is not None:
+            self._unsub_time_boundary = async_track_point_in_utc_time(
+                self.hass, self._handle_time_boundary, boundary
+            )
+
+    @callback
+    def _cancel_time_boundary(self) -> None:
+        if self._unsub_time_boundary is not None:
+            self._unsub_time_boundary()
+            self._unsub_time_boundary = None
+
+    @callback
+    def _handle_time_boundary(self, now: datetime) -> None:
+        """Recompute time-dependent views from cached data, without calling Notion."""
+        self._unsub_time_boundary = None
+        if self.data is None:
+            return
+
+        for trip in self.data["trips"]:
+            trip.timeline_events_upcoming = trip.timeline.upcoming(now)
+        self.data = {**self.data, "next_trip_id": self._find_next_trip_id(self.data["trips"])}
+        _LOGGER.debug("Recomputed upcoming events and next trip at %s", now.isoformat())
+        self.async_update_listeners()
+
+    def _next_time_boundary(self, now: datetime) -> datetime | None:
+        """Return when the upcoming views, next trip or day countdown next change.
+
+        Upcoming events only ever drop out of the view (once both their start
+        and end have passed), and the next trip only changes when it ends.
+        """
+        boundaries = [dt_util.start_of_local_day() + timedelta(days=1)]
+        for trip in self.data["trips"]:
+            for event in trip.timeline_events_upcoming:
+                boundaries.append(max(dt for dt in (event.start_dt, event.end_dt) if dt))
+
+        if next_trip := self.get_trip():
+            if end := next_trip.end_dt or next_trip.start_dt:
+                boundaries.append(end)
+
+        future = [boundary for boundary in boundaries if boundary >= now]
+        if not future:
+            return None
+        # Views compare with `>= now`, so recompute just after the boundary.
+        return min(future) + timedelta(seconds=1)
+
+    async def async_load_snapshot(self) -> bool:
+        """Hydrate coordinator data from the last persisted snapshot.
+
+        Returns True when usable data was restored, so entities can be added
+        before the first Notion fetch completes.
+        """
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+
+        snapshot_databases: dict[str, str] = snapshot.get("databases", {})
+        self._raw_pages = {
+            dataset: {page.get("id", ""): page for page in pages}
+            for dataset, pages in snapshot.get("pages", {}).items()
+            if dataset in self._databases
+            and snapshot_databases.get(dataset) == self._databases[dataset]
+        }
+        if CONF_DB_TRIPS not in self._raw_pages:
+            self._raw_pages = {}
+            return False
+
+        self._sync_watermarks = _parse_snapshot_datetimes(
+            snapshot.get("sync_watermark"), self._raw_pages
+        )
+        self._last_full_syncs = _parse_snapshot_datetimes(
+            snapshot.get("last_full_sync"), self._raw_pages
+        )
+        for dataset, pages in self._raw_pages.items():
+            self._last_edited[dataset] = _latest_edit(pages.values())
+
+        raw = self._cached_rows()
+        resolvers = {dataset: self._rows_resolver(dataset, rows) for dataset, rows in raw.items()}
+        parse_loop_ms = 0.0
+        if sum(len(rows) for rows in raw.values()) > self._executor_threshold:
+            self._records = await self.hass.async_add_executor_job(
+                self._parse_rows, raw, resolvers
+            )
+        else:
+            parse_started = time.perf_counter()
+            self._records = self._parse_rows(raw, resolvers)
+            parse_loop_ms = _elapsed_ms(parse_started)
+        self.data = await self._async_normalize(parse_loop_ms)
+        self._schedule_time_boundary()
+        _LOGGER.debug(
+            "Restored %s snapshot with %d trips", DOMAIN, len(self.data.get("trips", []))
+        )
+        return True
+
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch latest data from all configured Notion databases."""
+        """Fetch due Notion databases, joining an in-flight update that covers them.
+
+        Overlapping triggers (the poll interval, `homeassistant.update_entity`,
+        change notifications) share one fetch and one normalization. A request
+        for datasets the in-flight update does not include waits for it and
+        then fetches only what is still due.
+        """
+        while (task := self._update_task) is not None:
+            if set(self._due_datasets(dt_util.utcnow())) <= self._update_datasets:
+                return await asyncio.shield(task)
+            await self._async_wait_for_update()
+
+        now = dt_util.utcnow()
+        due = self._due_datasets(now)
+        if not due and self.data is not None:
+            return self.data
+
+        task = self.hass.async_create_task(self._async_fetch_and_normalize(due, now))
+        self._update_task = task
+        self._update_datasets = frozenset(due)
+        task.add_done_callback(self._clear_update_task)
+        return await asyncio.shield(task)
+
+    @callback
+    def _clear_update_task(self, task: asyncio.Task[dict[str, Any]]) -> None:
+        if self._update_task is task:
+            self._update_task = None
+            self._update_datasets = frozenset()
+
+    async def _async_wait_for_update(self) -> None:
+        """Wait for the in-flight update, if any, ignoring its outcome."""
+        if (task := self._update_task) is not None:
+            await asyncio.wait([task])
+
+    async def _async_fetch_and_normalize(
+        self, due: list[str], now: datetime
+    ) -> dict[str, Any]:
+        """Fetch the due datasets and bring the coordinator data up to date.
+
+        Full syncs and the first load relink the whole record set. When every
+        due dataset synced incrementally, only the changed pages are patched
+        into the current data, and nothing is done if no page changed.
+        """
+        started = time.perf_counter()
+        api_before = self._client.metrics.copy()
+        self._fetch_stats = {}
         try:
-            raw = await self._fetch_all_databases()
-            return self._normalize(raw)
+            changes = await self._fetch_databases(due, now)
+            fetch_ms = _elapsed_ms(started)
+            parse_loop_ms = sum(stats["parse_loop_ms"] for stats in self._fetch_stats.values())
+            if (
+                self.data is None
+                or self._relink_pending
+                or any(pages is None for pages in changes.values())
+            ):
+                data = await self._async_normalize(parse_loop_ms)
+            else:
+                data = self._patch_changed_pages(changes, parse_loop_ms)
         except UpdateFailed:
+            # Pages merged before the failure are only picked up by a relink.
+            self._relink_pending = True
             raise
         except Exception as err:
+            self._relink_pending = True
             raise UpdateFailed(f"Unexpected Notion Travel update failure: {err}") from err
 
-    async def _fetch_all_databases(self) -> dict[str, list[dict[str, Any]]]:
-        """Fetch all rows from Trips + all child datasets."""
-        datasets = list(self._databases.keys())
-        tasks = [self._fetch_database_rows(self._databases[name]) for name in datasets]
-        rows_by_dataset = await asyncio.gather(*tasks)
-        return dict(zip(datasets, rows_by_dataset, strict=True))
+        api = self._client.metrics.since(api_before)
+        self._refresh_metrics = {
+            "last_refresh": now.isoformat(),
+            "duration_ms": _elapsed_ms(started),
+            "stages": {
+                "fetch_ms": fetch_ms,
+                "http_ms": api["http_ms"],
+                "decode_ms": api["decode_ms"],
+                "parse_ms": round(
+                    sum(stats["parse_ms"] for stats in self._fetch_stats.values()), 2
+                ),
+                "link_ms": self._normalize_stats["duration_ms"],
+                "timeline_ms": self._normalize_stats["timeline_ms"],
+            },
+            "api": api,
+            "normalize": self._normalize_stats,
+            "databases": self._fetch_stats,
+            "cached_rows": {
+                dataset: len(records) for dataset, records in self._records.items()
+            },
+        }
 
-    async def _fetch_database_rows(self, database_id: str) -> list[dict[str, Any]]:
-        """Read all pages in a Notion database, handling pagination."""
-        rows: list[dict[str, Any]] = []
-        next_cursor: str | None = None
+        # Schedule after normalizing so adaptive policies see the fresh trips.
+        for dataset in due:
+            self._next_due[dataset] = now + self._refresh_interval(dataset, now, data)
 
-        while True:
-            payload: dict[str, Any] = {}
-            if next_cursor:
-                payload["start_cursor"] = next_cursor
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+        return data
 
-            response = await self._query_database(database_id, payload)
-            rows.extend(response.get("results", []))
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the JSON-serializable snapshot persisted between restarts."""
+        return {
+            "databases": self._databases,
+            "pages": self._cached_rows(),
+            "sync_watermark": {
+                dataset: value.isoformat() for dataset, value in self._sync_watermarks.items()
+            },
+            "last_full_sync": {
+                dataset: value.isoformat() for dataset, value in self._last_full_syncs.items()
+            },
+        }
 
-            if not response.get("has_more"):
-                break
+    def _cached_rows(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the cached raw page set as lists per dataset."""
+        return {name: list(pages.values()) for name, pages in self._raw_pages.items()}
+
+    def _due_datasets(self, now: datetime) -> list[str]:
+        """Return datasets whose refresh policy says they should be fetched now."""
+        return [
+            dataset
+            for dataset in self._databases
+            if dataset not in self._next_due or self._next_due[dataset] <= now
+        ]
+
+    def _refresh_interval(
+        self, dataset: str, now: datetime, data: dict[str, Any]
+    ) -> timedelta:
+        """Return the polling interval for one dataset under its refresh policy.
+
+        Adaptive policies poll faster while a trip is within the active window
+        or in progress, and back off once the dataset has not been edited for
+        `idle_after` seconds.
+        """
+        policy = self._refresh_policies.get(dataset, {})
+        interval = timedelta(seconds=policy.get(CONF_INTERVAL, self._scan_interval_seconds))
+        if not policy.get(CONF_ADAPTIVE):
+            return interval
+
+        window = timedelta(days=policy[CONF_ACTIVE_WINDOW_DAYS])
+        if self._has_active_trip(data.get("trips", []), now, window):
+            return timedelta(seconds=policy[CONF_ACTIVE_INTERVAL])
+
+        last_edited = self._last_edited.get(dataset)
+        if last_edited and now - last_edited >= timedelta(seconds=policy[CONF_IDLE_AFTER]):
+            return max(interval, timedelta(seconds=policy[CONF_IDLE_INTERVAL]))
+
+        return interval
+
+    def _has_active_trip(
+        self, trips: list[Trip], now: datetime, window: timedelta
+    ) -> bool:
+        """Return True when a trip is in progress or starts within `window`."""
+        for trip in trips:
+            start = trip.start_dt
+            if start is None:
+                continue
+            end = trip.end_dt or start
+            # Date-only end dates parse to midnight, so keep the last day active.
+            if start - window <= now and end >= now - timedelta(days=1):
+                return True
+        return False
+
+    async def _fetch_databases(
+        self, datasets: list[str], now: datetime
+    ) -> dict[str, list[dict[str, Any]] | None]:
+        """Fetch the given datasets into the cached page and record sets.
+
+        With incremental sync enabled, only pages edited since the dataset's
+        previous successful sync are requested and merged into the cached page
+        set. A periodic full sync still runs so deleted pages are dropped.
+
+        Returns the changed pages of each dataset, or None for a full sync.
+        """
+        self._fetched_rows = 0
+        changes: dict[str, list[dict[str, Any]] | None] = {}
+        if self._query_filters.get(CONF_LIMIT_CHILDREN_TO_TRIPS) and CONF_DB_TRIPS in datasets:
+            # Child queries are filtered by the trips in scope, so load those first.
+            changes[CONF_DB_TRIPS] = await self._fetch_dataset(CONF_DB_TRIPS, now)
+            datasets = [name for name in datasets if name != CONF_DB_TRIPS]
+        results = await asyncio.gather(*(self._fetch_dataset(name, now) for name in datasets))
+        changes.update(zip(datasets, results))
+        return changes
+
+    async def _fetch_dataset(
+        self, dataset: str, now: datetime
+    ) -> list[dict[str, Any]] | None:
+        """Fetch one dataset, parsing each response page while the next is in flight.
+
+        Returns the changed pages of an incremental sync, or None for a full sync.
+        """
+        edited_since = self._incremental_since(dataset, now)
+        full_sync = edited_since is None
+        # A full sync builds fresh maps and swaps them in only once it completes.
+        pages = {} if full_sync else self._raw_pages.setdefault(dataset, {})
+        records = {} if full_sync else self._records.setdefault(dataset, {})
+        changed_pages: list[dict[str, Any]] = []
+        changed = 0
+        responses_count = 0
+        parse_seconds = 0.0
+        parse_loop_seconds = 0.0
+        latest: datetime | None = None
+        started = time.perf_counter()
+
+        query_filter = await self._full_sync_filter(dataset, now) if full_sync else None
+        async with aclosing(
+            self._iter_database_results(self._databases[dataset], edited_since, query_filter)
+        ) as responses:
+            async for results in responses:
+                # Once the refresh is past the executor threshold, parse off the loop too.
+                self._fetched_rows += len(results)
+                parse_started = time.perf_counter()
+                resolver = self._rows_resolver(dataset, results)
+                if self._fetched_rows > self._executor_threshold:
+                    parsed = await self.hass.async_add_executor_job(
+                        self._parse_results, dataset, results, resolver
+                    )
+                else:
+                    parsed = self._parse_results(dataset, results, resolver)
+                    parse_loop_seconds += time.perf_counter() - parse_started
+                _apply_parsed(parsed, pages, records)
+                parse_seconds += time.perf_counter() - parse_started
+                responses_count += 1
+                changed += len(results)
+                if not full_sync:
+                    changed_pages.extend(results)
+                edited = _latest_edit(results)
+                if edited and (latest is None or edited > latest):
+                    latest = edited
+
+        if full_sync:
+            self._raw_pages[dataset] = pages
+            self._records[dataset] = records
+            self._last_full_syncs[dataset] = now
+        else:
+            _LOGGER.debug(
+                "Incremental Notion sync merged %d changed %s pages", changed, dataset
+            )
+
+        if latest and (dataset not in self._last_edited or latest > self._last_edited[dataset]):
+            self._last_edited[dataset] = latest
+
+        self._sync_watermarks[dataset] = now
+        self._fetch_stats[dataset] = {
+            "sync": "full" if full_sync else "incremental",
+            "filtered": query_filter is not None,
+            "pages": responses_count,
+            "rows": changed,
+            "parse_ms": round(parse_seconds * 1000, 2),
+            "parse_loop_ms": round(parse_loop_seconds * 1000, 2),
+            "duration_ms": _elapsed_ms(started),
+        }
+        return None if full_sync else changed_pages
 
-            next_cursor = response.get("next_cursor")
-            if not next_cursor:
-                break
+    def _incremental_since(self, dataset: str, now: datetime) -> datetime | None:
+        """Return the last_edited_time lower bound, or None when a full sync is due."""
+        if not self._incremental_sync or dataset not in self._raw_pages:
+            return None
+        watermark = self._sync_watermarks.get(dataset)
+        last_full_sync = self._last_full_syncs.get(dataset)
+        if watermark is None or last_full_sync is None:
+            return None
+        if now - last_full_sync >= self._full_sync_interval:
+            return None
+        return watermark - timedelta(seconds=INCREMENTAL_SYNC_OVERLAP_SECONDS)
+
+    def _merge_changed_pages(self, dataset: str, rows: list[dict[str, Any]]) -> None:
+        """Merge changed pages into the cached page and record sets for one dataset."""
+        _apply_parsed(
+            self._parse_results(dataset, rows, self._rows_resolver(dataset, rows)),
+            self._raw_pages.setdefault(dataset, {}),
+            self._records.setdefault(dataset, {}),
+        )
 
-        return rows
+    def _resolver(self, dataset: str, properties: dict[str, Any]) -> PropertyResolver:
+        """Return the property resolver of a dataset, rebuilt when its schema changed.
+
+        Only called on the event loop; executor parsing gets the resolver
+        passed in, so no cache is shared across threads.
+        """
+        resolver = self._resolvers.get(dataset)
+        if resolver is None or not resolver.matches(properties):
+            resolver = self._resolvers[dataset] = PropertyResolver(properties)
+        return resolver
+
+    def _rows_resolver(
+        self, dataset: str, rows: list[dict[str, Any]]
+    ) -> PropertyResolver | None:
+        """Return the dataset resolver for a batch of rows, keyed on its first page."""
+        if not rows:
+            return self._resolvers.get(dataset)
+        return self._resolver(dataset, rows[0].get("properties", {}))
+
+    def _parse_results(
+        self,
+        dataset: str,
+        results: list[dict[str, Any]],
+        resolver: PropertyResolver | None,
+    ) -> list[tuple[dict[str, Any], Trip | ChildItem | None]]:
+        """Parse query results without touching the caches (safe in the executor).
+
+        Removed pages and trips the query filters exclude parse to None.
+        """
+        now = dt_util.utcnow()
+        parsed: list[tuple[dict[str, Any], Trip | ChildItem | None]] = []
+        for page in results:
+            record = None if _is_removed(page) else self._parse_page(dataset, page, resolver)
+            if isinstance(record, Trip) and not self._trip_in_scope(record, now):
+                record = None
+            parsed.append((page, record))
+        return parsed
 
-    async def _query_database(self, database_id: str, payload: dict[str, Any]) -> dict[str, Any]:
-        """Execute a Notion database query call."""
-        url = f"{API_BASE_URL}/databases/{database_id}/query"
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Notion-Version": NOTION_VERSION,
-            "Content-Type": "application/json",
+    def _trip_in_scope(self, trip: Trip, now: datetime) -> bool:
+        """Return False for trips the configured query filters exclude."""
+        if trip.status and trip.status in self._query_filters.get(CONF_EXCLUDE_STATUSES, ()):
+            return False
+        past_days = self._query_filters.get(CONF_PAST_TRIP_DAYS)
+        last_day = trip.end_dt or trip.start_dt
+        if past_days is not None and last_day is not None:
+            return last_day >= now - timedelta(days=past_days + 1)
+        return True
+
+    async def _full_sync_filter(self, dataset: str, now: datetime) -> dict[str, Any] | None:
+        """Return the Notion filter limiting a full sync to in-scope pages.
+
+        Property names and types are resolved from the database schema, which
+        is re-read on every filtered full sync so renamed properties are
+        picked up. Filters that cannot be resolved are skipped.
+        """
+        if dataset == CONF_DB_TRIPS:
+            if not (
+                self._query_filters.get(CONF_EXCLUDE_STATUSES)
+                or self._query_filters.get(CONF_PAST_TRIP_DAYS) is not None
+            ):
+                return None
+            schema = await self._database_schema(dataset)
+            return self._trip_filter(schema, now)
+
+        if not self._query_filters.get(CONF_LIMIT_CHILDREN_TO_TRIPS):
+            return None
+        trip_ids = list(self._records.get(CONF_DB_TRIPS, {}))
+        if not trip_ids or len(trip_ids) > MAX_RELATION_FILTER_TRIPS:
+            return None
+        relation_key = trip_relation_key(await self._database_schema(dataset))
+        if relation_key is None:
+            return None
+        return {
+            "or": [
+                {"property": relation_key, "relation": {"contains": trip_id}}
+                for trip_id in trip_ids
+            ]
         }
 
+    def _trip_filter(self, schema: dict[str, Any], now: datetime) -> dict[str, Any] | None:
+        """Build the Trips filter for status exclusions and the past-trip window.
+
+        Notion compares a date range filter with the range start, while the
+        past-trip window applies to the end. The cutoff is therefore moved
+        back by the longest trip loaded so far, and the date condition is left
+        out until trips are loaded; `_trip_in_scope` applies the exact window.
+        """
+        resolver = PropertyResolver(schema)
+        conditions: list[dict[str, Any]] = []
+
+        status_key = resolver.key_for("Status")
+        status_type = schema[status_key].get("type") if status_key else None
+        if status_type in ("select", "status"):
+            conditions.extend(
+                {"property": status_key, status_type: {"does_not_equal": status}}
+                for status in self._query_filters.get(CONF_EXCLUDE_STATUSES, ())
+            )
+
+        past_days = self._query_filters.get(CONF_PAST_TRIP_DAYS)
+        date_key = resolver.key_for("Dates", "Date")
+        longest = self._longest_trip_span()
+        if (
+            past_days is not None
+            and longest is not None
+            and date_key
+            and schema[date_key].get("type") == "date"
+        ):
+            cutoff = (now - timedelta(days=past_days + 1) - longest).date().isoformat()
+            conditions.append(
+                {
+                    "or": [
+                        {"property": date_key, "date": {"on_or_after": cutoff}},
+                        {"property": date_key, "date": {"is_empty": True}},
+                    ]
+                }
+            )
+
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {"and": conditions}
+
+    def _longest_trip_span(self) -> timedelta | None:
+        """Return the longest start-to-end span of the loaded trips, if any are loaded."""
+        trips = self._records.get(CONF_DB_TRIPS)
+        if not trips:
+            return None
+        return max(
+            (
+                trip.end_dt - trip.start_dt
+                for trip in trips.values()
+                if trip.start_dt is not None
+                and trip.end_dt is not None
+                and trip.end_dt > trip.start_dt
+            ),
+            default=timedelta(0),
+        )
+
+    async def _database_schema(self, dataset: str) -> dict[str, Any]:
+        """Return the property schema of one configured database."""
+        try:
+            database = await self._client.retrieve_database(self._databases[dataset])
+        except NotionApiError as err:
+            raise UpdateFailed(str(err)) from err
+        return database.get("properties", {})
+
+    async def _iter_database_results(
+        self,
+        database_id: str,
+        edited_since: datetime | None = None,
+        query_filter: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield each page of query results, requesting the next one before yielding."""
+        payload: dict[str, Any] = {}
+        if edited_since is not None:
+            payload["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": edited_since.isoformat()},
+            }
+        if query_filter is not None:
+            payload["filter"] = (
+                {"and": [payload["filter"], query_filter]} if "filter" in payload else query_filter
+            )
+
+        pending = asyncio.ensure_future(self._query_database(database_id, payload))
         try:
-            async with self._session.post(url, headers=headers, json=payload, timeout=30) as response:
-                if response.status != 200:
-                    body = await response.text()
-                    raise UpdateFailed(
-                        f"Notion API error ({response.status}) for database {database_id}: {body}"
+            while pending is not None:
+                response = await pending
+                pending = None
+                next_cursor = response.get("next_cursor")
+                if response.get("has_more") and next_cursor:
+                    pending = asyncio.ensure_future(
+                        self._query_database(
+                            database_id, {**payload, "start_cursor": next_cursor}
+                        )
                     )
-                return await response.json()
-        except ClientError as err:
-            raise UpdateFailed(f"Notion API connection error for database {database_id}: {err}") from err
-
-    def _normalize(self, raw: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
-        """Normalize raw Notion pages into HA-friendly structures."""
-        trips: list[dict[str, Any]] = []
-        trip_index: dict[str, dict[str, Any]] = {}
-
-        for page in raw.get(CONF_DB_TRIPS, []):
-            trip = self._parse_trip_page(page)
-            trip["items"] = {dataset: [] for dataset in self._child_datasets}
-            trip["counts"] = {dataset: 0 for dataset in self._child_datasets}
-            trip["total_cost"] = 0.0
+                yield response.get("results", [])
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _query_database(self, database_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Execute a Notion database query call."""
+        try:
+            return await self._client.query_database(database_id, payload)
+        except NotionApiError as err:
+            raise UpdateFailed(str(err)) from err
+
+    async def _async_normalize(self, parse_loop_ms: float = 0.0) -> dict[str, Any]:
+        """Link parsed records into trips, in the executor when the row count is large.
+
+        `parse_loop_ms` is the time spent parsing these rows on the event loop,
+        reported with linking as `loop_blocking_ms`.
+        """
+        records = {dataset: list(items.values()) for dataset, items in self._records.items()}
+        row_count = sum(len(items) for items in records.values())
+        in_executor = row_count > self._executor_threshold
+
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        if in_executor:
+            data = await self.hass.async_add_executor_job(self._link, records, timings)
+        else:
+            data = self._link(records, timings)
+        duration_ms = _elapsed_ms(started)
+
+        self._relink_pending = False
+        self._normalize_stats = {
+            "rows": row_count,
+            "patched": False,
+            "executor": in_executor,
+            "duration_ms": duration_ms,
+            "loop_blocking_ms": round(parse_loop_ms + (0.0 if in_executor else duration_ms), 2),
+            "timeline_ms": timings.get("timeline_ms", 0.0),
+        }
+        _LOGGER.debug(
+            "Normalized %d Notion rows in %.2f ms (%s)",
+            row_count,
+            duration_ms,
+            "executor" if in_executor else "event loop",
+        )
+        return data
+
+    def _patch_changed_pages(
+        self, changes: dict[str, list[dict[str, Any]] | None], parse_loop_ms: float
+    ) -> dict[str, Any]:
+        """Patch incrementally synced pages into the current data on the loop."""
+        pages = [(dataset, page) for dataset, rows in changes.items() for page in rows or ()]
+        started = time.perf_counter()
+        data = self.data
+        if pages:
+            data = self._apply_pages(data, pages) or data
+        duration_ms = _elapsed_ms(started)
+
+        self._normalize_stats = {
+            "rows": len(pages),
+            "patched": True,
+            "executor": False,
+            "duration_ms": duration_ms,
+            "loop_blocking_ms": round(parse_loop_ms + duration_ms, 2),
+            "timeline_ms": 0.0,
+        }
+        _LOGGER.debug("Patched %d changed Notion rows in %.2f ms", len(pages), duration_ms)
+        return data
+
+    def _parse_rows(
+        self,
+        raw: dict[str, list[dict[str, Any]]],
+        resolvers: dict[str, PropertyResolver | None],
+    ) -> dict[str, dict[str, Trip | ChildItem]]:
+        """Parse a raw page set into records keyed by page ID."""
+        return {
+            dataset: {
+                page.get("id", ""): self._parse_page(dataset, page, resolvers.get(dataset))
+                for page in pages
+            }
+            for dataset, pages in raw.items()
+        }
+
+    def _parse_page(
+        self, dataset: str, page: dict[str, Any], resolver: PropertyResolver | None
+    ) -> Trip | ChildItem:
+        """Parse one raw page from any configured dataset."""
+        properties = page.get("properties", {})
+        if resolver is None or not resolver.matches(properties):
+            # A page read across a schema change gets a resolver of its own.
+            resolver = PropertyResolver(properties)
+        if dataset == CONF_DB_TRIPS:
+            return self._parse_trip_page(page, resolver)
+        return self._parse_child_page(dataset, page, resolver)
+
+    def _new_trip(self, parsed: Trip) -> Trip:
+        """Return a copy of a parsed trip record with empty derived fields."""
+        return replace(
+            parsed,
+            items={dataset: [] for dataset in self._child_datasets},
+            counts={},
+            total_cost=0.0,
+            timeline=Timeline(),
+            timeline_events_upcoming=[],
+            fingerprint=None,
+        )
+
+    def _link(
+        self, records: dict[str, list[Any]], timings: dict[str, float] | None = None
+    ) -> dict[str, Any]:
+        """Link parsed trip and child records into HA-friendly structures.
+
+        When `timings` is given, the time spent building timelines is recorded.
+        """
+        trips: list[Trip] = []
+        trip_index: dict[str, Trip] = {}
+        relations = RelationGraph()
+
+        for parsed in records.get(CONF_DB_TRIPS, []):
+            trip = self._new_trip(parsed)
             trips.append(trip)
-            trip_index[trip["id"]] = trip
+            trip_index[trip.id] = trip
 
         for dataset in self._child_datasets:
-            for page in raw.get(dataset, []):
-                item = self._parse_child_page(dataset, page)
-                trip_ids: list[str] = item.pop("trip_ids", [])
-
-                for trip_id in trip_ids:
-                    trip = trip_index.get(trip_id)
-                    if not trip:
-                        continue
-                    trip["items"][dataset].append(item)
+            for item in records.get(dataset, []):
+                relations.add(item)
 
+        now = dt_util.utcnow()
+        started = time.perf_counter()
+        # One event per item, shared by every trip it links to.
+        events: dict[str, TimelineEvent] = {}
         for trip in trips:
-            running_total = 0.0
-            for dataset in self._child_datasets:
-                items = trip["items"][dataset]
-                trip["counts"][dataset] = len(items)
-                for item in items:
-                    cost = safe_float(item.get("cost"))
-                    if cost is not None:
-                        running_total += cost
-            trip["total_cost"] = round(running_total, 2)
-            timeline_events = self._build_timeline_events(trip)
-            trip["timeline_events"] = timeline_events
-            trip["timeline_events_upcoming"] = self._filter_upcoming_events(timeline_events)
-
+            timeline_events: list[TimelineEvent] = []
+            for item in relations.items_for_trip(trip.id):
+                trip.items[item.dataset].append(item)
+                event = events.get(item.id)
+                if event is None:
+                    event = events[item.id] = self._build_timeline_event(item.dataset, item)
+                timeline_events.append(event)
+            trip.timeline = Timeline(timeline_events)
+            self._finalize_trip(trip, now)
+        if timings is not None:
+            timings["timeline_ms"] = _elapsed_ms(started)
+
+        return self._build_data(trips, trip_index, relations)
+
+    def _build_data(
+        self,
+        trips: list[Trip],
+        trip_index: dict[str, Trip],
+        relations: RelationGraph,
+    ) -> dict[str, Any]:
+        """Assemble coordinator data from finalized trips."""
         trips.sort(key=self._trip_sort_key)
-        next_trip_id = self._find_next_trip_id(trips)
-
         return {
             "trips": trips,
             "trip_index": trip_index,
-            "next_trip_id": next_trip_id,
+            "relations": relations,
+            "trip_calendar": CalendarIndex(
+                item for trip in trips if (item := self._trip_calendar_item(trip)) is not None
+            ),
+            "event_calendar": self._event_calendar(trips),
+            "next_trip_id": self._find_next_trip_id(trips),
+            "fingerprint": fingerprint([trip.fingerprint for trip in trips]),
             "last_update": dt_util.utcnow().isoformat(),
         }
 
-    def _parse_trip_page(self, page: dict[str, Any]) -> dict[str, Any]:
-        """Parse one page from the Trips database."""
-        properties = page.get("properties", {})
-
-        dates_prop = get_property(properties, "Dates", "Date")
+    def _patch_data(
+        self, data: dict[str, Any], trip_ids: set[str], item_ids: set[str]
+    ) -> dict[str, Any]:
+        """Return coordinator data after a page patch.
+
+        Only the calendar entries of the given trips and items are replaced.
+        The next trip and the dataset fingerprint are recomputed from the
+        trips' already computed start dates and fingerprints.
+        """
+        trips: list[Trip] = data["trips"]
+        trip_index: dict[str, Trip] = data["trip_index"]
+        relations: RelationGraph = data["relations"]
+
+        trip_calendar: CalendarIndex = data["trip_calendar"]
+        for trip_id in trip_ids:
+            trip_calendar.remove(trip_id)
+            trip = trip_index.get(trip_id)
+            if trip is not None and (entry := self._trip_calendar_item(trip)) is not None:
+                trip_calendar.insert(entry)
+
+        # Like `_event_calendar`: items linked to at least one loaded trip.
+        event_calendar: CalendarIndex = data["event_calendar"]
+        for item_id in item_ids:
+            event_calendar.remove(item_id)
+            item = relations.get_item(item_id)
+            if item is None or not any(
+                trip_id in trip_index for trip_id in relations.trips_for_item(item_id)
+            ):
+                continue
+            event = self._build_timeline_event(item.dataset, item)
+            if (entry := self._event_calendar_item(event)) is not None:
+                event_calendar.insert(entry)
 
         return {
-            "id": page.get("id", ""),
-            "name": extract_title(get_property(properties, "Name", "Title")) or "Untitled Trip",
-            "destination": extract_rich_text(get_property(properties, "Destination")),
-            "status": extract_select(get_property(properties, "Status")),
-            "tags": extract_multi_select(get_property(properties, "Tags")),
-            "start_date": extract_date_start(dates_prop),
-            "end_date": extract_date_end(dates_prop),
-            "budget": extract_number(get_property(properties, "Budget")),
-            "latitude": extract_number(get_property(properties, "Latitude")),
-            "longitude": extract_number(get_property(properties, "Longitude")),
-            "notes": extract_rich_text(get_property(properties, "Notes")),
-            "cover_images": extract_files(get_property(properties, "Cover Image", "Cover")),
-            "url": page.get("url", ""),
-            "last_edited_time": page.get("last_edited_time"),
+            **data,
+            "next_trip_id": self._find_next_trip_id(trips),
+            "fingerprint": fingerprint([trip.fingerprint for trip in trips]),
+            "last_update": dt_util.utcnow().isoformat(),
         }
 
-    def _parse_child_page(self, dataset: str, page: dict[str, Any]) -> dict[str, Any]:
+    def _event_calendar(self, trips: list[Trip]) -> CalendarIndex:
+        """Index every timeline event once (shared events included) by time."""
+        events = {event.id: event for trip in trips for event in trip.timeline_events}
+        return CalendarIndex(
+            item
+            for event in events.values()
+            if (item := self._event_calendar_item(event)) is not None
+        )
+
+    def _trip_calendar_item(self, trip: Trip) -> CalendarItem | None:
+        """Return the calendar entry spanning one trip's dates."""
+        return _calendar_item(
+            trip.id,
+            trip.name,
+            trip.start_date,
+            trip.end_date,
+            description="\n".join(part for part in (trip.notes, trip.url) if part),
+            location=trip.destination,
+        )
+
+    def _event_calendar_item(self, event: TimelineEvent) -> CalendarItem | None:
+        """Return the calendar entry for one timeline event."""
+        item = event.item
+        confirmation = item.get("confirmation")
+        parts = (
+            event.subtitle,
+            f"Confirmation: {confirmation}" if confirmation else "",
+            item.notion_url,
+        )
+        return _calendar_item(
+            item.id,
+            item.name or "Untitled",
+            event.start,
+            event.end,
+            description="\n".join(part for part in parts if part),
+            location=event.location,
+        )
+
+    def _finalize_trip(self, trip: Trip, now: datetime) -> None:
+        """Recompute counts, cost, upcoming events and fingerprint for one trip."""
+        running_total = 0.0
+        for dataset in self._child_datasets:
+            items = trip.items.setdefault(dataset, [])
+            trip.counts[dataset] = len(items)
+            for item in items:
+                cost = safe_float(item.cost)
+                if cost is not None:
+                    running_total += cost
+        trip.total_cost = round(running_total, 2)
+        trip.timeline_events_upcoming = trip.timeline.upcoming(now)
+        trip.fingerprint = fingerprint(trip.content_dict())
+
+    def _parse_trip_page(self, page: dict[str, Any], resolver: PropertyResolver) -> Trip:
+        """Parse one page from the Trips database."""
+        properties = page.get("properties", {})
+        get_property = resolver.bind(properties)
+
+        dates_prop = get_property("Dates", "Date")
+        start_date = extract_date_start(dates_prop)
+        end_date = extract_date_end(dates_prop)
+
+        return Trip(
+            id=page.get("id", ""),
+            name=extract_title(get_property("Name", "Title")) or "Untitled Trip",
+            destination=extract_rich_text(get_property("Destination")),
+            status=extract_select(get_property("Status")),
+            tags=extract_multi_select(get_property("Tags")),
+            start_date=start_date,
+            end_date=end_date,
+            budget=extract_number(get_property("Budget")),
+            latitude=extract_number(get_property("Latitude")),
+            longitude=extract_number(get_property("Longitude")),
+            notes=extract_rich_text(get_property("Notes")),
+            cover_images=extract_files(get_property("Cover Image", "Cover")),
+            url=page.get("url", ""),
+            last_edited_time=page.get("last_edited_time"),
+            start_dt=parse_datetime(start_date),
+            end_dt=parse_datetime(end_date),
+        )
+
+    def _parse_child_page(
+        self, dataset: str, page: dict[str, Any], resolver: PropertyResolver
+    ) -> ChildItem:
         """Parse one page from a child dataset."""
         properties = page.get("properties", {})
+        get_property = resolver.bind(properties)
 
-        item: dict[str, Any] = {
-            "id": page.get("id", ""),
-            "name": extract_title(get_property(properties, "Name", "Title")) or "Untitled",
-            "status": extract_select(get_property(properties, "Status")),
-            "notes": extract_rich_text(get_property(properties, "Notes")),
-            "notion_url": page.get("url", ""),
-            "external_url": extract_url(
-                get_property(properties, "URL", "Website", "Map Link", "Reference URL")
-            ),
-            "trip_ids": parse_trip_relation_ids(page),
-            "last_edited_time": page.get("last_edited_time"),
-        }
+        details: dict[str, Any] = {}
 
         if dataset == CONF_DB_FLIGHTS:
-            departure_time_prop = get_property(properties, "Departure Time")
-            arrival_time_prop = get_property(properties, "Arrival Time")
-            item.update(
+            departure_time_prop = get_property("Departure Time")
+            arrival_time_prop = get_property("Arrival Time")
+            details.update(
                 {
-                    "airline": self._select_or_text(get_property(properties, "Airline")),
-                    "flight_number": extract_rich_text(get_property(properties, "Flight Number")),
-                    "departure_airport": extract_rich_text(get_property(properties, "Departure Airport")),
-                    "arrival_airport": extract_rich_text(get_property(properties, "Arrival Airport")),
+                    "airline": self._select_or_text(get_property("Airline")),
+                    "flight_number": extract_rich_text(get_property("Flight Number")),
+                    "departure_airport": extract_rich_text(get_property("Departure Airport")),
+                    "arrival_airport": extract_rich_text(get_property("Arrival Airport")),
                     "departure_time": extract_date_start(departure_time_prop),
                     "arrival_time": extract_date_start(arrival_time_prop),
                     "departure_time_zone": extract_date_time_zone(departure_time_prop),
                     "arrival_time_zone": extract_date_time_zone(arrival_time_prop),
-                    "class": extract_select(get_property(properties, "Class")),
-                    "seat": extract_rich_text(get_property(properties, "Seat")),
+                    "class": extract_select(get_property("Class")),
+                    "seat": extract_rich_text(get_property("Seat")),
                     "confirmation": extract_rich_text(
                         get_property(
-                            properties,
                             "Confirmation",
                             "Confirmation Number",
                             "Record Locator",
                             "PNR",
                         )
                     ),
-                    "cost": extract_number(get_property(properties, "Cost")),
+                    "cost": extract_number(get_property("Cost")),
                 }
             )
 
         elif dataset == CONF_DB_LODGING:
-            check_in_prop = get_property(properties, "Check In", "Check-In")
-            check_out_prop = get_property(properties, "Check Out", "Check-Out")
-            item.update(
+            check_in_prop = get_property("Check In", "Check-In")
+            check_out_prop = get_property("Check Out", "Check-Out")
+            details.update(
                 {
-                    "address": extract_rich_text(get_property(properties, "Address")),
+                    "address": extract_rich_text(get_property("Address")),
                     "check_in": extract_date_start(check_in_prop),
                     "check_out": extract_date_start(check_out_prop),
                     "check_in_time_zone": extract_date_time_zone(check_in_prop),
                     "check_out_time_zone": extract_date_time_zone(check_out_prop),
                     "confirmation": extract_rich_text(
                         get_property(
-                            properties,
                             "Confirmation",
                             "Confirmation Number",
                             "Reservation Number",
@@ -273,23 +1429,22 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             "Booking Number",
                         )
                     ),
-                    "cost": extract_number(get_property(properties, "Cost Per Night", "Cost")),
-                    "phone": extract_phone(get_property(properties, "Phone")),
-                    "website": extract_url(get_property(properties, "URL", "Website", "Map Link")),
+                    "cost": extract_number(get_property("Cost Per Night", "Cost")),
+                    "phone": extract_phone(get_property("Phone")),
+                    "website": extract_url(get_property("URL", "Website", "Map Link")),
                 }
             )
 
         elif dataset == CONF_DB_TRANSPORTATION:
-            start_time_prop = get_property(properties, "Start Time")
-            end_time_prop = get_property(properties, "End Time")
-            item.update(
+            start_time_prop = get_property("Start Time")
+            end_time_prop = get_property("End Time")
+            details.update(
                 {
-                    "type": extract_select(get_property(properties, "Type")),
-                    "company": self._select_or_text(get_property(properties, "Company")),
-                    "vehicle_type": extract_select(get_property(properties, "Vehicle Type")),
+                    "type": extract_select(get_property("Type")),
+                    "company": self._select_or_text(get_property("Company")),
+                    "vehicle_type": extract_select(get_property("Vehicle Type")),
                     "confirmation": extract_rich_text(
                         get_property(
-                            properties,
                             "Confirmation",
                             "Confirmation Number",
                             "Reservation Number",
@@ -301,47 +1456,46 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "end_time": extract_date_start(end_time_prop),
                     "start_time_zone": extract_date_time_zone(start_time_prop),
                     "end_time_zone": extract_date_time_zone(end_time_prop),
-                    "start_location": extract_rich_text(get_property(properties, "Start Location")),
-                    "end_location": extract_rich_text(get_property(properties, "End Location")),
-                    "website": extract_url(get_property(properties, "URL", "Website", "Map Link")),
-                    "cost": extract_number(get_property(properties, "Cost")),
+                    "start_location": extract_rich_text(get_property("Start Location")),
+                    "end_location": extract_rich_text(get_property("End Location")),
+                    "website": extract_url(get_property("URL", "Website", "Map Link")),
+                    "cost": extract_number(get_property("Cost")),
                 }
             )
 
         elif dataset == CONF_DB_ACTIVITIES:
-            start_time_prop = get_property(properties, "Start Time")
-            end_time_prop = get_property(properties, "End Time")
-            item.update(
+            start_time_prop = get_property("Start Time")
+            end_time_prop = get_property("End Time")
+            details.update(
                 {
-                    "category": extract_select(get_property(properties, "Category")),
+                    "category": extract_select(get_property("Category")),
                     "start_time": extract_date_start(start_time_prop),
                     "end_time": extract_date_start(end_time_prop),
                     "start_time_zone": extract_date_time_zone(start_time_prop),
                     "end_time_zone": extract_date_time_zone(end_time_prop),
-                    "duration": extract_rich_text(get_property(properties, "Duration")),
-                    "location": extract_rich_text(get_property(properties, "Location")),
-                    "cost": extract_number(get_property(properties, "Cost")),
-                    "website": extract_url(get_property(properties, "URL", "Website", "Map Link")),
+                    "duration": extract_rich_text(get_property("Duration")),
+                    "location": extract_rich_text(get_property("Location")),
+                    "cost": extract_number(get_property("Cost")),
+                    "website": extract_url(get_property("URL", "Website", "Map Link")),
                 }
             )
 
         elif dataset == CONF_DB_DINING:
-            reservation_time_prop = get_property(properties, "Date/Time", "Reservation Time", "Reservation")
-            item.update(
+            reservation_time_prop = get_property("Date/Time", "Reservation Time", "Reservation")
+            details.update(
                 {
-                    "cuisine_type": extract_select(get_property(properties, "Cuisine Type", "Cuisine")),
-                    "meal_type": extract_select(get_property(properties, "Meal Type")),
-                    "location": extract_rich_text(get_property(properties, "Location")),
-                    "phone": extract_phone(get_property(properties, "Phone")),
+                    "cuisine_type": extract_select(get_property("Cuisine Type", "Cuisine")),
+                    "meal_type": extract_select(get_property("Meal Type")),
+                    "location": extract_rich_text(get_property("Location")),
+                    "phone": extract_phone(get_property("Phone")),
                     "reservation_time": extract_date_start(reservation_time_prop),
                     "date_time": extract_date_start(reservation_time_prop),
                     "reservation_time_zone": extract_date_time_zone(reservation_time_prop),
                     "date_time_time_zone": extract_date_time_zone(reservation_time_prop),
-                    "cost": extract_number(get_property(properties, "Cost")),
-                    "priority": extract_select(get_property(properties, "Priority")),
+                    "cost": extract_number(get_property("Cost")),
+                    "priority": extract_select(get_property("Priority")),
                     "confirmation": extract_rich_text(
                         get_property(
-                            properties,
                             "Reservation Number",
                             "Confirmation",
                             "Confirmation Number",
@@ -349,106 +1503,92 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             "Booking ID",
                         )
                     ),
-                    "website": extract_url(get_property(properties, "URL", "Website", "Map Link")),
+                    "website": extract_url(get_property("URL", "Website", "Map Link")),
                 }
             )
 
         elif dataset == CONF_DB_NOTES:
-            date_relevant_prop = get_property(properties, "Date Relevant", "Date")
-            item.update(
+            date_relevant_prop = get_property("Date Relevant", "Date")
+            details.update(
                 {
-                    "category": extract_select(get_property(properties, "Category")),
-                    "priority": extract_select(get_property(properties, "Priority")),
+                    "category": extract_select(get_property("Category")),
+                    "priority": extract_select(get_property("Priority")),
                     "date_relevant": extract_date_start(date_relevant_prop),
                     "date_relevant_time_zone": extract_date_time_zone(date_relevant_prop),
-                    "content": extract_rich_text(get_property(properties, "Content", "Notes")),
+                    "content": extract_rich_text(get_property("Content", "Notes")),
                     "reference_url": extract_url(
-                        get_property(properties, "URL", "Reference URL", "Map Link", "Website")
+                        get_property("URL", "Reference URL", "Map Link", "Website")
                     ),
-                    "cost": extract_number(get_property(properties, "Cost")),
+                    "cost": extract_number(get_property("Cost")),
                 }
             )
         else:
-            item.update(
+            details.update(
                 {
                     "cost": extract_number(
                         get_property(
-                            properties,
                             "Cost",
                             "Price",
                             "Amount",
                             "Estimated Cost",
                         )
                     ),
-                    "properties": self._parse_generic_properties(properties),
+                    "properties": self._parse_generic_properties(
+                        properties, self._generic_properties.get(dataset), resolver
+                    ),
                 }
             )
 
-        # Add raw relation IDs from child page for debugging/troubleshooting.
-        item["relation_ids"] = parse_trip_relation_ids(page)
-        return item
+        relation_ids = parse_trip_relation_ids(page, resolver)
+        return ChildItem(
+            id=page.get("id", ""),
+            dataset=dataset,
+            name=extract_title(get_property("Name", "Title")) or "Untitled",
+            status=extract_select(get_property("Status")),
+            notes=extract_rich_text(get_property("Notes")),
+            notion_url=page.get("url", ""),
+            external_url=extract_url(
+                get_property("URL", "Website", "Map Link", "Reference URL")
+            ),
+            last_edited_time=page.get("last_edited_time"),
+            cost=details.pop("cost", None),
+            trip_ids=relation_ids,
+            # Raw relation IDs are kept for debugging/troubleshooting.
+            relation_ids=relation_ids,
+            details=details,
+        )
 
     def _select_or_text(self, prop: dict[str, Any]) -> str:
         """Extract select text first, then rich text fallback."""
         return extract_select(prop) or extract_rich_text(prop)
 
-    def _build_timeline_events(self, trip: dict[str, Any]) -> list[dict[str, Any]]:
-        """Create one chronological cross-dataset event stream for a trip."""
-        events: list[dict[str, Any]] = []
-        items_by_dataset = trip.get("items", {})
-
-        for dataset in self._child_datasets:
-            for item in items_by_dataset.get(dataset, []):
-                event = self._build_timeline_event(dataset, item)
-                if event is not None:
-                    events.append(event)
-
-        events.sort(key=self._timeline_sort_key)
-        return events
-
-    def _filter_upcoming_events(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Return timeline events that are upcoming/active from now onward."""
-        now = dt_util.utcnow()
-        upcoming: list[dict[str, Any]] = []
-
-        for event in events:
-            start = self._parse_datetime(event.get("start"))
-            end = self._parse_datetime(event.get("end"))
-            if start and start >= now:
-                upcoming.append(event)
-                continue
-            if end and end >= now:
-                upcoming.append(event)
-                continue
-
-        return upcoming
+    def _build_timeline_events(self, trip: Trip) -> Timeline:
+        """Create one chronological cross-dataset timeline for a trip."""
+        return Timeline(
+            self._build_timeline_event(dataset, item)
+            for dataset in self._child_datasets
+            for item in trip.items.get(dataset, [])
+        )
 
-    def _build_timeline_event(self, dataset: str, item: dict[str, Any]) -> dict[str, Any] | None:
-        """Normalize one child item into a timeline event model."""
+    def _build_timeline_event(self, dataset: str, item: ChildItem) -> TimelineEvent:
+        """Normalize one child item into a timeline event referencing the item."""
         start, end = self._event_window(dataset, item)
-        time_zone = self._event_time_zone(dataset, item)
-
-        return {
-            "id": item.get("id"),
-            "dataset": dataset,
-            "title": item.get("name", "Untitled"),
-            "subtitle": self._event_subtitle(dataset, item),
-            "status": item.get("status"),
-            "location": self._event_location(dataset, item),
-            "start": start,
-            "end": end,
-            "time_zone": time_zone,
-            "cost": item.get("cost"),
-            "seat": item.get("seat"),
-            "icon": ICON_BY_DOMAIN.get(dataset, "mdi:calendar-star"),
-            "url": item.get("website") or item.get("reference_url") or item.get("external_url"),
-            "notion_url": item.get("notion_url") or item.get("url"),
-            "confirmation": item.get("confirmation"),
-            "content": item.get("content") or item.get("notes"),
-            "last_edited_time": item.get("last_edited_time"),
-        }
+        start_dt = parse_datetime(start)
+        end_dt = parse_datetime(end)
+
+        return TimelineEvent(
+            item=item,
+            start=start,
+            end=end,
+            time_zone=self._event_time_zone(dataset, item),
+            subtitle=self._event_subtitle(dataset, item),
+            location=self._event_location(dataset, item),
+            start_dt=start_dt,
+            end_dt=end_dt,
+            sort_key=self._timeline_sort_key(item, start_dt, end_dt),
+        )
 
-    def _event_window(self, dataset: str, item: dict[str, Any]) -> tuple[str | None, str | None]:
+    def _event_window(self, dataset: str, item: ChildItem) -> tuple[str | None, str | None]:
         """Return start/end datetime strings for known datasets with fallback keys."""
         start_keys: dict[str, tuple[str, ...]] = {
             CONF_DB_FLIGHTS: ("departure_time", "arrival_time"),
@@ -474,7 +1614,7 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         end = self._first_non_empty(item, *(end_keys.get(dataset, ()) + generic_end))
         return start, end
 
-    def _event_time_zone(self, dataset: str, item: dict[str, Any]) -> str | None:
+    def _event_time_zone(self, dataset: str, item: ChildItem) -> str | None:
         """Return configured timezone for the event when provided by Notion."""
         time_zone_keys: dict[str, tuple[str, ...]] = {
             CONF_DB_FLIGHTS: ("departure_time_zone", "arrival_time_zone"),
@@ -496,7 +1636,7 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return self._first_non_empty(item, *(time_zone_keys.get(dataset, ()) + generic_time_zone_keys))
 
-    def _first_non_empty(self, source: dict[str, Any], *keys: str) -> str | None:
+    def _first_non_empty(self, source: ChildItem, *keys: str) -> str | None:
         """Return first non-empty string value from known keys."""
         for key in keys:
             value = source.get(key)
@@ -504,7 +1644,7 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return value
         return None
 
-    def _event_subtitle(self, dataset: str, item: dict[str, Any]) -> str:
+    def _event_subtitle(self, dataset: str, item: ChildItem) -> str:
         """Return a concise secondary label for timeline display."""
         if dataset == CONF_DB_FLIGHTS:
             airline = item.get("airline")
@@ -532,7 +1672,7 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return dataset.replace("_", " ").title()
 
-    def _event_location(self, dataset: str, item: dict[str, Any]) -> str:
+    def _event_location(self, dataset: str, item: ChildItem) -> str:
         """Return best-effort location string by dataset."""
         if dataset == CONF_DB_FLIGHTS:
             dep = item.get("departure_airport")
@@ -558,95 +1698,230 @@ class NotionTravelDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             or ""
         )
 
-    def _timeline_sort_key(self, event: dict[str, Any]) -> tuple[datetime, str]:
+    def _timeline_sort_key(
+        self, item: ChildItem, start: datetime | None, end: datetime | None
+    ) -> tuple[datetime, str]:
         """Sort timeline events by their best available datetime."""
         event_dt = (
-            self._parse_datetime(event.get("start"))
-            or self._parse_datetime(event.get("end"))
-            or self._parse_datetime(event.get("last_edited_time"))
+            start
+            or end
+            or parse_datetime(item.last_edited_time)
             or datetime.max.replace(tzinfo=dt_util.UTC)
         )
-        return (event_dt, str(event.get("title") or ""))
+        return (event_dt, item.name or "")
 
-    def _find_next_trip_id(self, trips: list[dict[str, Any]]) -> str | None:
+    def _find_next_trip_id(self, trips: list[Trip]) -> str | None:
         """Find the nearest trip that is in-progress/upcoming based on start date."""
         now = dt_util.utcnow()
         candidates: list[tuple[datetime, str]] = []
 
         for trip in trips:
-            start = self._parse_datetime(trip.get("start_date"))
-            end = self._parse_datetime(trip.get("end_date")) or start
+            start = trip.start_dt
+            end = trip.end_dt or start
             if start is None:
                 continue
 
             if end and end < now:
                 continue
 
-            candidates.append((start, trip["id"]))
+            candidates.append((start, trip.id))
 
         if not candidates:
-            return trips[0]["id"] if trips else None
+            return trips[0].id if trips else None
 
         candidates.sort(key=lambda item: item[0])
         return candidates[0][1]
 
-    def _parse_generic_properties(self, properties: dict[str, Any]) -> dict[str, Any]:
-        """Parse unknown dataset properties into JSON-safe primitives."""
-        parsed: dict[str, Any] = {}
-
-        for name, prop in properties.items():
-            prop_type = prop.get("type")
-            if prop_type == "title":
-                parsed[name] = extract_title(prop)
-            elif prop_type == "rich_text":
-                parsed[name] = extract_rich_text(prop)
-            elif prop_type == "select":
-                parsed[name] = extract_select(prop)
-            elif prop_type == "multi_select":
-                parsed[name] = extract_multi_select(prop)
-            elif prop_type == "number":
-                parsed[name] = extract_number(prop)
-            elif prop_type == "date":
-                parsed[name] = {
-                    "start": extract_date_start(prop),
-                    "end": extract_date_end(prop),
-                }
-            elif prop_type == "relation":
-                parsed[name] = extract_relation_ids(prop)
-            elif prop_type == "phone_number":
-                parsed[name] = extract_phone(prop)
-            elif prop_type == "url":
-                parsed[name] = extract_url(prop)
-            elif prop_type == "files":
-                parsed[name] = extract_files(prop)
-            elif prop_type == "checkbox":
-                parsed[name] = bool(prop.get("checkbox"))
-            elif prop_type == "email":
-                parsed[name] = prop.get("email")
-            else:
-                parsed[name] = prop.get(prop_type)
+    def _parse_generic_properties(
+        self,
+        properties: dict[str, Any],
+        names: list[str] | None,
+        resolver: PropertyResolver,
+    ) -> dict[str, Any]:
+        """Parse dataset properties into JSON-safe primitives.
+
+        With `names`, only those properties (matched like other property
+        lookups) are parsed; the rest stay raw and are parsed on request by
+        `get_item_properties`.
+        """
+        if names is None:
+            return {name: parse_generic_property(prop) for name, prop in properties.items()}
 
+        parsed: dict[str, Any] = {}
+        for name in names:
+            key = resolver.key_for(name)
+            if key is not None:
+                parsed[key] = parse_generic_property(properties[key])
         return parsed
 
-    def _trip_sort_key(self, trip: dict[str, Any]) -> datetime:
+    def _trip_sort_key(self, trip: Trip) -> datetime:
         """Sort trips by start date, falling back to very-future for undated trips."""
-        value = self._parse_datetime(trip.get("start_date"))
+        value = trip.start_dt
         if value is None:
             return datetime.max.replace(tzinfo=dt_util.UTC)
         return value
 
-    def _parse_datetime(self, value: str | None) -> datetime | None:
-        """Parse Notion date/date-time values to timezone-aware datetime."""
-        if not value:
-            return None
 
-        formatted = value.replace("Z", "+00:00")
-        try:
-            parsed = datetime.fromisoformat(formatted)
-        except ValueError:
-            return None
+async def async_get_coordinator(
+    hass: HomeAssistant, workspace: str | None = None
+) -> NotionTravelDataUpdateCoordinator | None:
+    """Return the coordinator of one workspace, creating it on first use.
 
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt_util.UTC)
+    The first caller loads the snapshot (or waits for the first refresh);
+    platforms set up concurrently wait for it. Returns None without config.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cfg = domain_data.get(DATA_CONFIG, {}).get(workspace)
+    if not cfg:
+        return None
 
-        return parsed.astimezone(dt_util.UTC)
+    locks: dict[str | None, asyncio.Lock] = domain_data.setdefault(DATA_COORDINATOR_LOCKS, {})
+    coordinators: dict[str | None, NotionTravelDataUpdateCoordinator] = domain_data.setdefault(
+        DATA_COORDINATORS, {}
+    )
+    async with locks.setdefault(workspace, asyncio.Lock()):
+        coordinator = coordinators.get(workspace)
+        if coordinator is not None:
+            return coordinator
+
+        databases = dict(cfg[CONF_DATABASES])
+        additional = cfg.get(CONF_ADDITIONAL_DATABASES, {})
+        databases.update(
+            {dataset: entry[CONF_DATABASE_ID] for dataset, entry in additional.items()}
+        )
+
+        coordinator = NotionTravelDataUpdateCoordinator(
+            hass=hass,
+            token=cfg[CONF_TOKEN],
+            databases=databases,
+            scan_interval_seconds=cfg[CONF_SCAN_INTERVAL],
+            incremental_sync=cfg[CONF_INCREMENTAL_SYNC],
+            full_sync_interval_seconds=cfg[CONF_FULL_SYNC_INTERVAL],
+            executor_threshold=cfg[CONF_EXECUTOR_THRESHOLD],
+            attribute_mode=cfg[CONF_ATTRIBUTE_MODE],
+            refresh_policies=cfg[CONF_REFRESH_POLICIES],
+            query_filters=cfg[CONF_QUERY_FILTERS],
+            generic_properties={
+                dataset: entry[CONF_PROPERTIES]
+                for dataset, entry in additional.items()
+                if CONF_PROPERTIES in entry
+            },
+            workspace=workspace,
+        )
+        coordinators[workspace] = coordinator
+        await coordinator.async_register_shutdown()
+
+        if await coordinator.async_load_snapshot():
+            # Entities come up from the snapshot; Notion is refreshed in the background.
+            hass.async_create_task(coordinator.async_refresh())
+        else:
+            await coordinator.async_refresh()
+        return coordinator
+
+
+async def async_get_coordinators(
+    hass: HomeAssistant,
+) -> list[NotionTravelDataUpdateCoordinator]:
+    """Return the coordinators of every configured workspace, in config order."""
+    workspaces = hass.data.get(DOMAIN, {}).get(DATA_CONFIG, {})
+    coordinators = await asyncio.gather(
+        *(async_get_coordinator(hass, workspace) for workspace in workspaces)
+    )
+    return [coordinator for coordinator in coordinators if coordinator is not None]
+
+
+@callback
+def async_loaded_coordinators(hass: HomeAssistant) -> list[NotionTravelDataUpdateCoordinator]:
+    """Return the coordinators created so far, without creating any."""
+    return list(hass.data.get(DOMAIN, {}).get(DATA_COORDINATORS, {}).values())
+
+
+@callback
+def async_get_client_pool(hass: HomeAssistant) -> NotionClientPool:
+    """Return the Notion client pool shared by every coordinator instance."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    pool: NotionClientPool | None = domain_data.get(DATA_CLIENT_POOL)
+    if pool is None:
+        pool = domain_data[DATA_CLIENT_POOL] = NotionClientPool(async_get_clientsession(hass))
+    return pool
+
+
+def _calendar_item(
+    uid: str,
+    summary: str,
+    start: str | None,
+    end: str | None,
+    description: str,
+    location: str,
+) -> CalendarItem | None:
+    """Return a calendar entry for a Notion date range, or None when undated."""
+    span = calendar_span(start, end, timedelta(minutes=CALENDAR_DEFAULT_EVENT_MINUTES))
+    if span is None:
+        return None
+    start_value, end_value = span
+    return CalendarItem(
+        uid=uid,
+        summary=summary,
+        start=start_value,
+        end=end_value,
+        lower=_calendar_bound(start_value),
+        upper=_calendar_bound(end_value),
+        description=description,
+        location=location,
+    )
+
+
+def _calendar_bound(value: date | datetime) -> datetime:
+    """Return a calendar value as an aware datetime (local midnight for dates)."""
+    if isinstance(value, datetime):
+        return value
+    return dt_util.start_of_local_day(value)
+
+
+def _elapsed_ms(started: float) -> float:
+    """Return milliseconds since a `time.perf_counter()` reading."""
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _apply_parsed(
+    parsed: list[tuple[dict[str, Any], Trip | ChildItem | None]],
+    pages: dict[str, dict[str, Any]],
+    records: dict[str, Trip | ChildItem],
+) -> None:
+    """Cache parsed pages and their records, dropping pages that parsed to None."""
+    for page, record in parsed:
+        page_id = page.get("id", "")
+        if record is None:
+            pages.pop(page_id, None)
+            records.pop(page_id, None)
+        else:
+            pages[page_id] = page
+            records[page_id] = record
+
+
+def _is_removed(page: dict[str, Any]) -> bool:
+    """Return True for pages that were archived or moved to the trash."""
+    return bool(page.get("archived") or page.get("in_trash"))
+
+
+def _parse_snapshot_datetimes(
+    value: dict[str, str] | None, datasets: dict[str, Any]
+) -> dict[str, datetime]:
+    """Parse per-dataset ISO timestamps stored in the snapshot."""
+    parsed: dict[str, datetime] = {}
+    for dataset, raw in (value or {}).items():
+        if dataset in datasets and (timestamp := dt_util.parse_datetime(raw or "")):
+            parsed[dataset] = timestamp
+    return parsed
+
+
+def _latest_edit(pages: Iterable[dict[str, Any]]) -> datetime | None:
+    """Return the newest last_edited_time among raw pages."""
+    return max(
+        (
+            edited
+            for page in pages
+            if (edited := parse_datetime(page.get("last_edited_time"))) is not None
+        ),
+        default=None,
+    )
@@ -2,13 +2,38 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import hashlib
+import json
 from typing import Any
 
+from homeassistant.util import dt as dt_util
+
+MAX_CACHED_DATETIMES = 4096
+
+_UNRESOLVED = object()
+
 
 def _normalize_key(value: str) -> str:
     return value.strip().lower().replace(" ", "").replace("_", "")
 
 
+def normalize_notion_id(value: str) -> str:
+    """Return a Notion page/database ID without dashes, for comparisons."""
+    return value.replace("-", "").strip().lower()
+
+
+def workspace_key(key: str, workspace: str | None) -> str:
+    """Return a storage key (or ID) namespaced by workspace.
+
+    The unnamed workspace keeps the plain key so existing installs keep
+    their storage files and entity unique IDs.
+    """
+    return key if workspace is None else f"{key}_{workspace}"
+
+
 def get_property(properties: dict[str, Any], *names: str) -> dict[str, Any]:
     """Return the first property matching one of the provided names."""
     if not properties:
@@ -27,6 +52,70 @@ def get_property(properties: dict[str, Any], *names: str) -> dict[str, Any]:
     return {}
 
 
+class PropertyResolver:
+    """Map logical field names to concrete property keys for one database schema.
+
+    Every page in a Notion database shares the same property keys, so name
+    matching (exact, then normalized) runs once per field instead of once per
+    page, and values are then read with plain dict lookups.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize resolver from the property keys of one schema."""
+        self._keys = tuple(keys)
+        self._key_set = frozenset(self._keys)
+        self._normalized_to_key = {_normalize_key(key): key for key in self._keys}
+        self._resolved: dict[tuple[str, ...], str | None] = {}
+        self._trip_relation_key: Any = _UNRESOLVED
+
+    def matches(self, properties: dict[str, Any]) -> bool:
+        """Return True if the page properties have exactly this schema's keys."""
+        return properties.keys() == self._key_set
+
+    def key_for(self, *names: str) -> str | None:
+        """Return the concrete property key for the first matching name."""
+        try:
+            return self._resolved[names]
+        except KeyError:
+            pass
+
+        key: str | None = None
+        for name in names:
+            if name in self._key_set:
+                key = name
+                break
+        else:
+            for name in names:
+                key = self._normalized_to_key.get(_normalize_key(name))
+                if key:
+                    break
+
+        self._resolved[names] = key
+        return key
+
+    def trip_relation_key(self, properties: dict[str, Any]) -> str | None:
+        """Return the key of the trip relation, resolved once per schema.
+
+        The cached key is re-checked against each page's property type, so a
+        property changed to or from a relation is picked up.
+        """
+        key = self._trip_relation_key
+        if key is _UNRESOLVED or (key is not None and properties[key].get("type") != "relation"):
+            key = self._trip_relation_key = _find_trip_relation_key(self, properties)
+        return key
+
+    def bind(self, properties: dict[str, Any]) -> Callable[..., dict[str, Any]]:
+        """Return a `get_property`-style lookup bound to one page's properties."""
+
+        def _get(*names: str) -> dict[str, Any]:
+            key = self.key_for(*names)
+            if key is None:
+                return {}
+            return properties.get(key, {})
+
+        return _get
+
+
 def extract_title(prop: dict[str, Any]) -> str:
     """Extract title text from a Notion title property."""
     if not prop:
@@ -46,11 +135,11 @@ def extract_rich_text(prop: dict[str, Any]) -> str:
 
 
 def extract_select(prop: dict[str, Any]) -> str:
-    """Extract selected option name from a Notion select property."""
+    """Extract selected option name from a Notion select or status property."""
     if not prop:
         return ""
 
-    select = prop.get("select")
+    select = prop.get("select") or prop.get("status")
     if not select:
         return ""
     return select.get("name", "")
@@ -143,24 +232,132 @@ def extract_files(prop: dict[str, Any]) -> list[dict[str, Any]]:
     return files
 
 
-def parse_trip_relation_ids(page: dict[str, Any]) -> list[str]:
-    """Extract relation IDs for the trip relation from a child database record."""
-    properties = page.get("properties", {})
-    relation_prop = get_property(properties, "Trip", "Trips")
-    relation_ids = extract_relation_ids(relation_prop)
-    if relation_ids:
-        return relation_ids
-
-    relation_properties = [
-        prop
-        for prop in properties.values()
+def parse_generic_property(prop: dict[str, Any]) -> Any:
+    """Parse one property of any type into JSON-safe primitives."""
+    prop_type = prop.get("type")
+    if prop_type == "title":
+        return extract_title(prop)
+    if prop_type == "rich_text":
+        return extract_rich_text(prop)
+    if prop_type == "select":
+        return extract_select(prop)
+    if prop_type == "multi_select":
+        return extract_multi_select(prop)
+    if prop_type == "number":
+        return extract_number(prop)
+    if prop_type == "date":
+        return {
+            "start": extract_date_start(prop),
+            "end": extract_date_end(prop),
+        }
+    if prop_type == "relation":
+        return extract_relation_ids(prop)
+    if prop_type == "phone_number":
+        return extract_phone(prop)
+    if prop_type == "url":
+        return extract_url(prop)
+    if prop_type == "files":
+        return extract_files(prop)
+    if prop_type == "checkbox":
+        return bool(prop.get("checkbox"))
+    if prop_type == "email":
+        return prop.get("email")
+    return prop.get(prop_type)
+
+
+def _find_trip_relation_key(
+    resolver: PropertyResolver, properties: dict[str, Any]
+) -> str | None:
+    key = resolver.key_for("Trip", "Trips")
+    if key and properties[key].get("type") == "relation":
+        return key
+
+    relation_keys = [
+        key
+        for key, prop in properties.items()
         if isinstance(prop, dict) and prop.get("type") == "relation"
     ]
+    return relation_keys[0] if len(relation_keys) == 1 else None
+
+
+def trip_relation_key(properties: dict[str, Any]) -> str | None:
+    """Return the key of the trip relation in a database or page property map.
+
+    This is a `Trip`/`Trips` relation, or else the only relation property.
+    """
+    return PropertyResolver(properties).trip_relation_key(properties)
+
+
+def parse_trip_relation_ids(
+    page: dict[str, Any], resolver: PropertyResolver | None = None
+) -> list[str]:
+    """Extract relation IDs for the trip relation from a child database record."""
+    properties = page.get("properties", {})
+    if resolver is None:
+        resolver = PropertyResolver(properties)
+    key = resolver.trip_relation_key(properties)
+    return extract_relation_ids(properties[key]) if key else []
+
+
+@lru_cache(maxsize=MAX_CACHED_DATETIMES)
+def parse_datetime(value: str | None) -> datetime | None:
+    """Parse Notion date/date-time values to timezone-aware UTC datetime.
+
+    Results are memoized; the same ISO strings recur across refreshes.
+    """
+    if not value:
+        return None
+
+    formatted = value.replace("Z", "+00:00")
+    try:
+        parsed = datetime.fromisoformat(formatted)
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+
+    return parsed.astimezone(dt_util.UTC)
+
+
+def calendar_span(
+    start: str | None, end: str | None, default_duration: timedelta
+) -> tuple[date, date] | tuple[datetime, datetime] | None:
+    """Return calendar start/end values for a Notion date range.
+
+    Date-only starts give all-day dates with an exclusive end. Date-times give
+    UTC datetimes, using `default_duration` when the end is missing or not
+    after the start.
+    """
+    if not start:
+        return None
+
+    if "T" not in start:
+        try:
+            start_date = date.fromisoformat(start[:10])
+        except ValueError:
+            return None
+        end_date = start_date
+        if end:
+            try:
+                end_date = max(date.fromisoformat(end[:10]), start_date)
+            except ValueError:
+                pass
+        return start_date, end_date + timedelta(days=1)
+
+    start_dt = parse_datetime(start)
+    if start_dt is None:
+        return None
+    end_dt = parse_datetime(end)
+    if end_dt is None or end_dt <= start_dt:
+        end_dt = start_dt + default_duration
+    return start_dt, end_dt
 
-    if len(relation_properties) == 1:
-        return extract_relation_ids(relation_properties[0])
 
-    return []
+def fingerprint(value: Any) -> str:
+    """Return a short stable content hash for JSON-like data."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=12).hexdigest()
 
 
 def safe_float(value: Any) -> float | None:
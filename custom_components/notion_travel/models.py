@@ -0,0 +1,463 @@
+"""Normalized record models for the Notion Travel integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+
+from .const import ATTRIBUTE_MODE_COMPACT, COMPACT_UPCOMING_EVENTS, ICON_BY_DOMAIN
+
+
+@dataclass(slots=True)
+class ChildItem:
+    """One row from a child dataset (flight, lodging, note, ...)."""
+
+    id: str
+    dataset: str
+    name: str
+    status: str
+    notes: str
+    notion_url: str
+    external_url: str
+    last_edited_time: str | None
+    cost: float | int | None
+    trip_ids: list[str]
+    relation_ids: list[str]
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a common field or dataset-specific detail by name."""
+        if key in self.details:
+            return self.details[key]
+        if key in _CHILD_ITEM_FIELDS:
+            return getattr(self, key)
+        return default
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize to the attribute/websocket payload shape."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "notes": self.notes,
+            "notion_url": self.notion_url,
+            "external_url": self.external_url,
+            "last_edited_time": self.last_edited_time,
+            **self.details,
+            "cost": self.cost,
+            "relation_ids": self.relation_ids,
+        }
+
+
+_CHILD_ITEM_FIELDS = frozenset(ChildItem.__dataclass_fields__) - {"details"}
+
+
+@dataclass(slots=True)
+class TimelineEvent:
+    """One dated entry on a trip timeline, backed by its source child item."""
+
+    item: ChildItem
+    start: str | None
+    end: str | None
+    time_zone: str | None
+    subtitle: str
+    location: str
+    start_dt: datetime | None
+    end_dt: datetime | None
+    sort_key: tuple[datetime, str]
+
+    @property
+    def id(self) -> str:
+        """Return the source item ID."""
+        return self.item.id
+
+    @property
+    def dataset(self) -> str:
+        """Return the source dataset name."""
+        return self.item.dataset
+
+    def is_upcoming(self, now: datetime) -> bool:
+        """Return True when the event starts or is still active at/after `now`."""
+        return bool(
+            (self.start_dt and self.start_dt >= now) or (self.end_dt and self.end_dt >= now)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize to the attribute/websocket payload shape."""
+        item = self.item
+        return {
+            "id": item.id,
+            "dataset": item.dataset,
+            "title": item.name or "Untitled",
+            "subtitle": self.subtitle,
+            "status": item.status,
+            "location": self.location,
+            "start": self.start,
+            "end": self.end,
+            "time_zone": self.time_zone,
+            "cost": item.cost,
+            "seat": item.get("seat"),
+            "icon": ICON_BY_DOMAIN.get(item.dataset, "mdi:calendar-star"),
+            "url": item.get("website") or item.get("reference_url") or item.external_url,
+            "notion_url": item.notion_url or item.get("url"),
+            "confirmation": item.get("confirmation"),
+            "content": item.get("content") or item.notes,
+            "last_edited_time": item.last_edited_time,
+        }
+
+
+def _event_sort_key(event: TimelineEvent) -> tuple[datetime, str]:
+    return event.sort_key
+
+
+def _grow_span(span: timedelta, start: datetime | None, end: datetime | None) -> timedelta:
+    """Return the longest entry span seen so far, including `start`-`end`.
+
+    Sorted-start indexes scan back from a query by this span. It is never
+    shrunk on removal; a stale maximum just widens the scanned window.
+    """
+    if start is None or end is None:
+        return span
+    return max(span, end - start)
+
+
+class Timeline:
+    """Timeline events kept sorted by their precomputed sort key.
+
+    Items are inserted and removed individually, and the upcoming view is found
+    by bisecting on `now`: events that start earlier can only still be active
+    if they began within the longest event span, so only that window and the
+    events after it are inspected.
+    """
+
+    __slots__ = ("_by_id", "_events", "_max_span")
+
+    def __init__(self, events: Iterable[TimelineEvent] = ()) -> None:
+        """Initialize from events in any order."""
+        self._events = sorted(events, key=_event_sort_key)
+        self._by_id = {event.id: event for event in self._events}
+        self._max_span = timedelta(0)
+        for event in self._events:
+            self._max_span = _grow_span(self._max_span, event.start_dt, event.end_dt)
+
+    @property
+    def events(self) -> list[TimelineEvent]:
+        """Return all events in chronological order."""
+        return self._events
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self._events)
+
+    def insert(self, event: TimelineEvent) -> None:
+        """Insert one event at its sorted position."""
+        self.remove(event.id)
+        self._by_id[event.id] = event
+        index = bisect_right(self._events, event.sort_key, key=_event_sort_key)
+        self._events.insert(index, event)
+        self._max_span = _grow_span(self._max_span, event.start_dt, event.end_dt)
+
+    def remove(self, item_id: str) -> None:
+        """Remove the event backed by one child item, if present."""
+        event = self._by_id.pop(item_id, None)
+        if event is None:
+            return
+        index = bisect_left(self._events, event.sort_key, key=_event_sort_key)
+        while self._events[index] is not event:
+            index += 1
+        del self._events[index]
+
+    def upcoming(self, now: datetime) -> list[TimelineEvent]:
+        """Return events that are upcoming or still active at `now`."""
+        start = bisect_left(self._events, (now - self._max_span, ""), key=_event_sort_key)
+        return [event for event in self._events[start:] if event.is_upcoming(now)]
+
+
+@dataclass(slots=True)
+class CalendarItem:
+    """One calendar entry for a trip or timeline event.
+
+    `start`/`end` are the calendar values (dates for all-day entries, with an
+    exclusive end); `lower`/`upper` are the same bounds as UTC datetimes.
+    """
+
+    uid: str
+    summary: str
+    start: date | datetime
+    end: date | datetime
+    lower: datetime
+    upper: datetime
+    description: str = ""
+    location: str = ""
+
+
+def _calendar_sort_key(item: CalendarItem) -> tuple[datetime, str]:
+    return (item.lower, item.uid)
+
+
+class CalendarIndex:
+    """Calendar items sorted by start, for range queries.
+
+    An item overlapping a range must start before the range ends and no
+    earlier than the range start minus the longest item span, so queries
+    bisect to that window instead of scanning every item. Items are
+    inserted and removed individually by UID when single pages change.
+    """
+
+    __slots__ = ("_by_uid", "_items", "_max_span", "_starts")
+
+    def __init__(self, items: Iterable[CalendarItem] = ()) -> None:
+        """Initialize from items in any order."""
+        self._items = sorted(items, key=_calendar_sort_key)
+        self._starts = [item.lower for item in self._items]
+        self._by_uid = {item.uid: item for item in self._items}
+        self._max_span = timedelta(0)
+        for item in self._items:
+            self._max_span = _grow_span(self._max_span, item.lower, item.upper)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._items)
+
+    def insert(self, item: CalendarItem) -> None:
+        """Insert or replace one item at its sorted position."""
+        self.remove(item.uid)
+        self._by_uid[item.uid] = item
+        index = bisect_right(self._items, _calendar_sort_key(item), key=_calendar_sort_key)
+        self._items.insert(index, item)
+        self._starts.insert(index, item.lower)
+        self._max_span = _grow_span(self._max_span, item.lower, item.upper)
+
+    def remove(self, uid: str) -> None:
+        """Remove the item with this UID, if present."""
+        item = self._by_uid.pop(uid, None)
+        if item is None:
+            return
+        index = bisect_left(self._items, _calendar_sort_key(item), key=_calendar_sort_key)
+        while self._items[index] is not item:
+            index += 1
+        del self._items[index]
+        del self._starts[index]
+
+    def between(self, start: datetime, end: datetime) -> list[CalendarItem]:
+        """Return items overlapping `[start, end)`, in start order."""
+        first = bisect_left(self._starts, start - self._max_span)
+        last = bisect_left(self._starts, end)
+        return [item for item in self._items[first:last] if item.upper > start]
+
+    def next_after(self, now: datetime) -> CalendarItem | None:
+        """Return the earliest-starting item that is in progress or upcoming."""
+        first = bisect_left(self._starts, now - self._max_span)
+        for item in self._items[first:]:
+            if item.upper > now:
+                return item
+        return None
+
+
+class RelationGraph:
+    """Trip/child item adjacency, indexed in both directions.
+
+    Each item is stored once however many trips it links to. Links to trips
+    that are not loaded are kept too, so a trip that appears later finds its
+    items without a scan, and relinking one item costs O(its trip count).
+    """
+
+    __slots__ = ("_item_trips", "_items", "_trip_items")
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._items: dict[str, ChildItem] = {}
+        self._item_trips: dict[str, tuple[str, ...]] = {}
+        self._trip_items: dict[str, dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._items)
+
+    def add(self, item: ChildItem) -> None:
+        """Add or replace one item and link it to its trips."""
+        self.remove(item.id)
+        trip_ids = tuple(dict.fromkeys(item.trip_ids))
+        self._items[item.id] = item
+        self._item_trips[item.id] = trip_ids
+        for trip_id in trip_ids:
+            self._trip_items.setdefault(trip_id, {})[item.id] = None
+
+    def remove(self, item_id: str) -> ChildItem | None:
+        """Remove one item and its links, returning the removed item."""
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return None
+        for trip_id in self._item_trips.pop(item_id):
+            linked = self._trip_items[trip_id]
+            del linked[item_id]
+            if not linked:
+                del self._trip_items[trip_id]
+        return item
+
+    def get_item(self, item_id: str) -> ChildItem | None:
+        """Return one item by ID."""
+        return self._items.get(item_id)
+
+    def trips_for_item(self, item_id: str) -> tuple[str, ...]:
+        """Return the IDs of the trips one item links to."""
+        return self._item_trips.get(item_id, ())
+
+    def items_for_trip(self, trip_id: str) -> list[ChildItem]:
+        """Return the items linked to one trip, in insertion order."""
+        items = self._items
+        return [items[item_id] for item_id in self._trip_items.get(trip_id, ())]
+
+
+@dataclass(slots=True)
+class Trip:
+    """One trip page with its linked child items and derived timeline."""
+
+    id: str
+    name: str
+    destination: str
+    status: str
+    tags: list[str]
+    start_date: str | None
+    end_date: str | None
+    budget: float | int | None
+    latitude: float | int | None
+    longitude: float | int | None
+    notes: str
+    cover_images: list[dict[str, Any]]
+    url: str
+    last_edited_time: str | None
+    start_dt: datetime | None = None
+    end_dt: datetime | None = None
+    items: dict[str, list[ChildItem]] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    total_cost: float = 0.0
+    timeline: Timeline = field(default_factory=Timeline)
+    timeline_events_upcoming: list[TimelineEvent] = field(default_factory=list)
+    fingerprint: str | None = None
+
+    @property
+    def timeline_events(self) -> list[TimelineEvent]:
+        """Return all timeline events in chronological order."""
+        return self.timeline.events
+
+    def content_dict(self) -> dict[str, Any]:
+        """Return parsed trip content and child items as plain data (for hashing)."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "destination": self.destination,
+            "status": self.status,
+            "tags": self.tags,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "budget": self.budget,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "notes": self.notes,
+            "cover_images": self.cover_images,
+            "url": self.url,
+            "last_edited_time": self.last_edited_time,
+            "counts": self.counts,
+            "total_cost": self.total_cost,
+            "items": {
+                dataset: [item.as_dict() for item in items]
+                for dataset, items in self.items.items()
+            },
+        }
+
+
+class TripView:
+    """Attribute and websocket payloads of one trip, built once and shared.
+
+    A view is valid while the trip's fingerprint and upcoming window are
+    unchanged; event dicts are built at most once and reused by the
+    attributes of every sensor for the trip and by the encoded timeline.
+    """
+
+    __slots__ = (
+        "_attribute_mode",
+        "_attributes",
+        "_events",
+        "_fingerprint",
+        "_payloads",
+        "_timeline_json",
+        "_trip_id",
+        "_upcoming",
+        "key",
+    )
+
+    def __init__(self, trip: Trip, attribute_mode: str) -> None:
+        """Capture the trip's current timeline; payloads are built on first use."""
+        self.key = self.key_for(trip)
+        self._trip_id = trip.id
+        self._fingerprint = trip.fingerprint
+        self._attribute_mode = attribute_mode
+        self._events = list(trip.timeline_events)
+        self._upcoming = list(trip.timeline_events_upcoming)
+        self._payloads: dict[str, dict[str, Any]] = {}
+        self._attributes: dict[str, Any] | None = None
+        self._timeline_json: bytes | None = None
+
+    @staticmethod
+    def key_for(trip: Trip) -> tuple[Any, ...]:
+        """Return the values a view of `trip` depends on."""
+        return (trip.fingerprint, tuple(event.id for event in trip.timeline_events_upcoming))
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return timeline attributes for sensors (treat as read-only).
+
+        Compact mode publishes counts, the next event and a short upcoming
+        window; the full timeline is then fetched on demand over the
+        websocket API.
+        """
+        if self._attributes is None:
+            self._attributes = self._build_attributes()
+        return self._attributes
+
+    @property
+    def timeline_json(self) -> bytes:
+        """Return the encoded full-timeline websocket payload."""
+        if self._timeline_json is None:
+            self._timeline_json = json_bytes(
+                {
+                    "trip_id": self._trip_id,
+                    "timeline_events": self._event_dicts(self._events),
+                    "timeline_events_upcoming": self._event_dicts(self._upcoming),
+                }
+            )
+        return self._timeline_json
+
+    def _build_attributes(self) -> dict[str, Any]:
+        events = self._events
+        upcoming = self._upcoming
+        next_event = upcoming[0] if upcoming else (events[0] if events else None)
+
+        attributes: dict[str, Any] = {
+            "attribute_mode": self._attribute_mode,
+            "timeline_event_count": len(events),
+            "timeline_upcoming_count": len(upcoming),
+        }
+        if self._attribute_mode == ATTRIBUTE_MODE_COMPACT:
+            attributes["upcoming_events"] = self._event_dicts(upcoming[:COMPACT_UPCOMING_EVENTS])
+            attributes["fingerprint"] = self._fingerprint
+        else:
+            attributes["timeline_events"] = self._event_dicts(events)
+            attributes["timeline_events_upcoming"] = self._event_dicts(upcoming)
+        attributes["next_event"] = self._event_dict(next_event) if next_event else None
+        return attributes
+
+    def _event_dicts(self, events: list[TimelineEvent]) -> list[dict[str, Any]]:
+        return [self._event_dict(event) for event in events]
+
+    def _event_dict(self, event: TimelineEvent) -> dict[str, Any]:
+        payload = self._payloads.get(event.id)
+        if payload is None:
+            payload = self._payloads[event.id] = event.as_dict()
+        return payload
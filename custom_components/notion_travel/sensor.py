@@ -2,31 +2,45 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import CURRENCY_DOLLAR
-from homeassistant.core import HomeAssistant
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    CURRENCY_DOLLAR,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
-    CONF_ADDITIONAL_DATABASES,
-    CONF_DATABASES,
-    CONF_SCAN_INTERVAL,
-    CONF_TOKEN,
+    CONF_MAX_TRIPS,
+    CONF_PAST_TRIP_DAYS,
+    CONF_TRIP_ENTITIES,
     DATA_CONFIG,
-    DATA_COORDINATOR,
     DOMAIN,
     DOMAIN_LABELS,
+    ENTITY_SAVE_DELAY,
+    ENTITY_STORAGE_KEY,
     ICON_BY_DOMAIN,
+    STORAGE_VERSION,
 )
-from .coordinator import NotionTravelDataUpdateCoordinator
+from .coordinator import NotionTravelDataUpdateCoordinator, async_get_coordinators
+from .helpers import workspace_key
+from .models import Trip, TripView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,75 +51,158 @@ async def async_setup_platform(
     async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
-    """Set up Notion Travel sensors from YAML config."""
-    domain_data = hass.data.setdefault(DOMAIN, {})
-    cfg = domain_data.get(DATA_CONFIG)
-
-    if not cfg:
+    """Set up Notion Travel sensors from YAML config, for every workspace."""
+    coordinators = await async_get_coordinators(hass)
+    if not coordinators:
         _LOGGER.error("%s config missing in hass.data", DOMAIN)
         return
 
-    coordinator: NotionTravelDataUpdateCoordinator | None = domain_data.get(DATA_COORDINATOR)
-    if coordinator is None:
-        databases = dict(cfg[CONF_DATABASES])
-        databases.update(cfg.get(CONF_ADDITIONAL_DATABASES, {}))
+    for coordinator in coordinators:
+        if not coordinator.last_update_success:
+            _LOGGER.error(
+                "Initial %s refresh failed; entities not added", coordinator.name
+            )
+            continue
 
-        coordinator = NotionTravelDataUpdateCoordinator(
-            hass=hass,
-            token=cfg[CONF_TOKEN],
-            databases=databases,
-            scan_interval_seconds=cfg[CONF_SCAN_INTERVAL],
+        initial_entities = _build_entities_for_dataset(coordinator, coordinator.data)
+        async_add_entities(initial_entities)
+
+        trip_entities = hass.data[DOMAIN][DATA_CONFIG][coordinator.workspace][
+            CONF_TRIP_ENTITIES
+        ]
+        manager = TripEntityManager(
+            hass,
+            coordinator,
+            async_add_entities,
+            max_trips=trip_entities[CONF_MAX_TRIPS],
+            past_days=trip_entities[CONF_PAST_TRIP_DAYS],
         )
-        domain_data[DATA_COORDINATOR] = coordinator
-        await coordinator.async_refresh()
-
-    if not coordinator.last_update_success:
-        _LOGGER.error("Initial %s refresh failed; entities not added", DOMAIN)
-        return
-
-    _remove_legacy_trip_entities(hass)
-
-    initial_entities = _build_entities_for_dataset(coordinator, coordinator.data)
-    async_add_entities(initial_entities)
+        await manager.async_setup()
 
 
 def _build_entities_for_dataset(
     coordinator: NotionTravelDataUpdateCoordinator, data: dict[str, Any]
 ) -> list[SensorEntity]:
     _ = data
-    return [NotionTravelNextTripSensor(coordinator)]
+    return [
+        NotionTravelNextTripSensor(coordinator),
+        NotionTravelRefreshDurationSensor(coordinator),
+        NotionTravelApiRequestsSensor(coordinator),
+        NotionTravelResponseBytesSensor(coordinator),
+    ]
 
 
-def _remove_legacy_trip_entities(hass: HomeAssistant) -> None:
-    """Remove legacy trip-specific entities from registry.
+class TripEntityManager:
+    """Add and remove per-trip sensors as trips enter and leave the window.
 
-    The Phase 2 UX intentionally focuses on one generalized next-trip sensor.
+    Sensors exist for at most `max_trips` trips (0 disables them), taken in
+    start order from trips that ended no more than `past_days` ago. The trip
+    IDs that have sensors are stored, so entries for trips deleted while Home
+    Assistant was stopped are also removed. Registry entries are found by
+    unique ID, never by scanning the whole entity registry.
     """
-    registry = er.async_get(hass)
-    removed = 0
-
-    for entry in list(registry.entities.values()):
-        if entry.platform != DOMAIN:
-            continue
 
-        unique_id = entry.unique_id or ""
-        if unique_id == "notion_travel_next_trip":
-            continue
-        if not unique_id.startswith("notion_travel_"):
-            continue
-
-        registry.async_remove(entry.entity_id)
-        removed += 1
-
-    if removed:
-        _LOGGER.info("Removed %d legacy Notion Travel trip-specific entities", removed)
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: NotionTravelDataUpdateCoordinator,
+        async_add_entities: AddEntitiesCallback,
+        max_trips: int,
+        past_days: int,
+    ) -> None:
+        """Initialize manager."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._max_trips = max_trips
+        self._past_days = past_days
+        self._registry = er.async_get(hass)
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, workspace_key(ENTITY_STORAGE_KEY, coordinator.workspace)
+        )
+        self._trip_ids: set[str] = set()
+
+    async def async_setup(self) -> None:
+        """Clean up stale entries, add current trip sensors and follow updates."""
+        stored = await self._store.async_load() or {}
+        data = self._coordinator.data or {}
+        # Entries for every known trip are checked once, which also removes
+        # sensors left by versions that created them for all trips.
+        known = set(stored.get("trip_ids", ())) | set(data.get("trip_index", {}))
+        self._remove_trips(known - self._wanted_trip_ids())
+        self._async_sync()
+        self._coordinator.async_add_listener(self._async_sync)
+
+    @callback
+    def _async_sync(self) -> None:
+        """Add sensors for trips entering the window and remove departed ones."""
+        wanted = self._wanted_trip_ids()
+        added = wanted - self._trip_ids
+        removed = self._trip_ids - wanted
+        if not added and not removed:
+            return
+
+        self._remove_trips(removed)
+        trip_index = (self._coordinator.data or {}).get("trip_index", {})
+        entities: list[SensorEntity] = []
+        for trip_id in added:
+            entities.extend(_build_entities_for_trip(self._coordinator, trip_index[trip_id]))
+        if entities:
+            self._async_add_entities(entities)
+
+        self._trip_ids = wanted
+        self._store.async_delay_save(self._data_to_save, ENTITY_SAVE_DELAY)
+
+    def _wanted_trip_ids(self) -> set[str]:
+        """Return IDs of the trips that should have sensors."""
+        if not self._max_trips:
+            return set()
+
+        cutoff = dt_util.utcnow() - timedelta(days=self._past_days + 1)
+        wanted: set[str] = set()
+        for trip in (self._coordinator.data or {}).get("trips", []):
+            last_day = trip.end_dt or trip.start_dt
+            if last_day is not None and last_day < cutoff:
+                continue
+            wanted.add(trip.id)
+            if len(wanted) >= self._max_trips:
+                break
+        return wanted
+
+    def _remove_trips(self, trip_ids: Iterable[str]) -> None:
+        """Remove registry entries (and so the entities) of the given trips."""
+        removed = 0
+        for trip_id in trip_ids:
+            for unique_id in _trip_unique_ids(self._coordinator, trip_id):
+                entity_id = self._registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+                if entity_id is not None:
+                    self._registry.async_remove(entity_id)
+                    removed += 1
+
+        if removed:
+            _LOGGER.debug("Removed %d Notion Travel trip entities", removed)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"trip_ids": sorted(self._trip_ids)}
+
+
+def _trip_unique_ids(coordinator: NotionTravelDataUpdateCoordinator, trip_id: str) -> list[str]:
+    """Return the unique IDs of every sensor built by `_build_entities_for_trip`."""
+    return [
+        coordinator.unique_id(f"{trip_id}_summary"),
+        coordinator.unique_id(f"{trip_id}_total_cost"),
+        *(
+            coordinator.unique_id(f"{trip_id}_{dataset}_count")
+            for dataset in coordinator.child_datasets
+        ),
+    ]
 
 
 def _build_entities_for_trip(
-    coordinator: NotionTravelDataUpdateCoordinator, trip: dict[str, Any]
+    coordinator: NotionTravelDataUpdateCoordinator, trip: Trip
 ) -> list[SensorEntity]:
-    trip_id = trip.get("id", "")
-    trip_name = trip.get("name", "Untitled Trip")
+    trip_id = trip.id
+    trip_name = trip.name
 
     entities: list[SensorEntity] = [
         NotionTravelTripSummarySensor(coordinator, trip_id, trip_name),
@@ -124,17 +221,43 @@ class NotionTravelBaseSensor(CoordinatorEntity[NotionTravelDataUpdateCoordinator
     """Shared base class for Notion Travel sensors."""
 
     _attr_has_entity_name = True
+    # Sensors with one instance per workspace set this; the unique ID and
+    # name are then namespaced by the coordinator's workspace.
+    _unique_id_suffix: str | None = None
 
     def __init__(self, coordinator: NotionTravelDataUpdateCoordinator) -> None:
         """Initialize base class."""
         super().__init__(coordinator)
+        self._last_state_key: tuple[Any, ...] | None = None
+        if self._unique_id_suffix is not None:
+            self._attr_unique_id = coordinator.unique_id(self._unique_id_suffix)
+            self._attr_name = coordinator.entity_name(self._attr_name)
+
+    async def async_added_to_hass(self) -> None:
+        """Record the state key written when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_state_key = self._state_key()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's slice of data changed."""
+        state_key = self._state_key()
+        if state_key == self._last_state_key:
+            return
+        self._last_state_key = state_key
+        self.async_write_ha_state()
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return a cheap key that changes whenever state or attributes would."""
+        data = self.coordinator.data or {}
+        return (self.available, data.get("fingerprint"))
 
 
 class NotionTravelNextTripSensor(NotionTravelBaseSensor):
     """Sensor for the next or in-progress trip."""
 
     _attr_name = "Next Trip"
-    _attr_unique_id = "notion_travel_next_trip"
+    _unique_id_suffix = "next_trip"
     _attr_icon = "mdi:airplane-takeoff"
 
     def __init__(self, coordinator: NotionTravelDataUpdateCoordinator) -> None:
@@ -147,7 +270,7 @@ class NotionTravelNextTripSensor(NotionTravelBaseSensor):
         trip = self._next_trip()
         if not trip:
             return "No trips"
-        return trip.get("name", "Untitled Trip")
+        return trip.name
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -156,36 +279,27 @@ class NotionTravelNextTripSensor(NotionTravelBaseSensor):
         if not trip:
             return {}
 
-        timeline_events = trip.get("timeline_events", [])
-        upcoming_events = trip.get("timeline_events_upcoming", [])
-        next_event = upcoming_events[0] if upcoming_events else (timeline_events[0] if timeline_events else None)
-
         return {
-            "trip_id": trip.get("id"),
-            "destination": trip.get("destination"),
-            "status": trip.get("status"),
-            "tags": trip.get("tags", []),
-            "start_date": trip.get("start_date"),
-            "end_date": trip.get("end_date"),
-            "days_until_start": _days_until(trip.get("start_date")),
-            "budget": trip.get("budget"),
-            "total_cost": trip.get("total_cost"),
-            "counts": trip.get("counts", {}),
-            "timeline_event_count": len(timeline_events),
-            "timeline_upcoming_count": len(upcoming_events),
-            "timeline_events": timeline_events,
-            "timeline_events_upcoming": upcoming_events,
-            "next_event": next_event,
-            "url": trip.get("url"),
+            "trip_id": trip.id,
+            "destination": trip.destination,
+            "status": trip.status,
+            "tags": trip.tags,
+            "start_date": trip.start_date,
+            "end_date": trip.end_date,
+            "days_until_start": _days_until(trip.start_dt),
+            "budget": trip.budget,
+            "total_cost": trip.total_cost,
+            "counts": trip.counts,
+            **self.coordinator.trip_view(trip).attributes,
+            "url": trip.url,
         }
 
-    def _next_trip(self) -> dict[str, Any] | None:
-        data = self.coordinator.data or {}
-        next_trip_id = data.get("next_trip_id")
-        trip_index = data.get("trip_index", {})
-        if next_trip_id:
-            return trip_index.get(next_trip_id)
-        return None
+    def _next_trip(self) -> Trip | None:
+        return self.coordinator.get_trip()
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return key covering the next trip's content and time-dependent values."""
+        return (self.available, *_trip_state_key(self._next_trip()))
 
 
 class NotionTravelTripSensor(NotionTravelBaseSensor):
@@ -202,10 +316,15 @@ class NotionTravelTripSensor(NotionTravelBaseSensor):
         self._trip_id = trip_id
         self._trip_name = trip_name
 
-    def _trip(self) -> dict[str, Any]:
+    def _trip(self) -> Trip | None:
         data = self.coordinator.data or {}
         trip_index = data.get("trip_index", {})
-        return trip_index.get(self._trip_id, {})
+        return trip_index.get(self._trip_id)
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return key covering this trip's content."""
+        trip = self._trip()
+        return (self.available, trip.fingerprint if trip else None)
 
 
 class NotionTravelTripSummarySensor(NotionTravelTripSensor):
@@ -221,40 +340,40 @@ class NotionTravelTripSummarySensor(NotionTravelTripSensor):
     ) -> None:
         """Initialize trip summary sensor."""
         super().__init__(coordinator, trip_id, trip_name)
-        self._attr_name = f"{trip_name}"
-        self._attr_unique_id = f"notion_travel_{self._trip_id}_summary"
+        self._attr_name = coordinator.entity_name(trip_name)
+        self._attr_unique_id = coordinator.unique_id(f"{trip_id}_summary")
 
     @property
     def native_value(self) -> str:
         """Return trip status."""
-        return self._trip().get("status") or "Unknown"
+        trip = self._trip()
+        return (trip.status if trip else "") or "Unknown"
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Return key covering this trip's content and time-dependent values."""
+        return (self.available, *_trip_state_key(self._trip()))
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return summary attributes for one trip."""
         trip = self._trip()
-        timeline_events = trip.get("timeline_events", [])
-        upcoming_events = trip.get("timeline_events_upcoming", [])
-        next_event = upcoming_events[0] if upcoming_events else (timeline_events[0] if timeline_events else None)
+        if not trip:
+            return {}
 
         return {
-            "trip_id": trip.get("id"),
-            "destination": trip.get("destination"),
-            "start_date": trip.get("start_date"),
-            "end_date": trip.get("end_date"),
-            "days_until_start": _days_until(trip.get("start_date")),
-            "tags": trip.get("tags", []),
-            "budget": trip.get("budget"),
-            "total_cost": trip.get("total_cost"),
-            "counts": trip.get("counts", {}),
-            "timeline_event_count": len(timeline_events),
-            "timeline_upcoming_count": len(upcoming_events),
-            "timeline_events": timeline_events,
-            "timeline_events_upcoming": upcoming_events,
-            "next_event": next_event,
-            "notes": trip.get("notes"),
-            "url": trip.get("url"),
-            "last_edited_time": trip.get("last_edited_time"),
+            "trip_id": trip.id,
+            "destination": trip.destination,
+            "start_date": trip.start_date,
+            "end_date": trip.end_date,
+            "days_until_start": _days_until(trip.start_dt),
+            "tags": trip.tags,
+            "budget": trip.budget,
+            "total_cost": trip.total_cost,
+            "counts": trip.counts,
+            **self.coordinator.trip_view(trip).attributes,
+            "notes": trip.notes,
+            "url": trip.url,
+            "last_edited_time": trip.last_edited_time,
         }
 
 
@@ -272,28 +391,32 @@ class NotionTravelTripDomainCountSensor(NotionTravelTripSensor):
         super().__init__(coordinator, trip_id, trip_name)
         self._dataset = dataset
         dataset_label = DOMAIN_LABELS.get(dataset, dataset.title())
-        self._attr_name = f"{trip_name} {dataset_label}"
-        self._attr_unique_id = f"notion_travel_{self._trip_id}_{dataset}_count"
+        self._attr_name = coordinator.entity_name(f"{trip_name} {dataset_label}")
+        self._attr_unique_id = coordinator.unique_id(f"{trip_id}_{dataset}_count")
         self._attr_icon = ICON_BY_DOMAIN.get(dataset, "mdi:format-list-bulleted")
 
     @property
     def native_value(self) -> int:
         """Return number of child records for this dataset."""
         trip = self._trip()
-        counts = trip.get("counts", {})
-        return int(counts.get(self._dataset, 0))
+        if not trip:
+            return 0
+        return int(trip.counts.get(self._dataset, 0))
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return expanded child rows for this dataset."""
         trip = self._trip()
-        items = trip.get("items", {}).get(self._dataset, [])
+        if not trip:
+            return {}
+
+        items = trip.items.get(self._dataset, [])
         return {
-            "trip_id": trip.get("id"),
-            "trip_name": trip.get("name"),
+            "trip_id": trip.id,
+            "trip_name": trip.name,
             "dataset": self._dataset,
             "count": len(items),
-            "items": items,
+            "items": [item.as_dict() for item in items],
         }
 
 
@@ -312,45 +435,134 @@ class NotionTravelTripTotalCostSensor(NotionTravelTripSensor):
     ) -> None:
         """Initialize trip total cost sensor."""
         super().__init__(coordinator, trip_id, trip_name)
-        self._attr_name = f"{trip_name} Total Cost"
-        self._attr_unique_id = f"notion_travel_{self._trip_id}_total_cost"
+        self._attr_name = coordinator.entity_name(f"{trip_name} Total Cost")
+        self._attr_unique_id = coordinator.unique_id(f"{trip_id}_total_cost")
 
     @property
     def native_value(self) -> float:
         """Return aggregated cost for all child datasets in one trip."""
         trip = self._trip()
-        value = trip.get("total_cost", 0.0)
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
+        return float(trip.total_cost) if trip else 0.0
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return budget/cost context."""
         trip = self._trip()
-        budget = trip.get("budget")
-        total = trip.get("total_cost", 0.0)
+        if not trip:
+            return {}
 
+        budget = trip.budget
         remaining = None
         if isinstance(budget, (int, float)):
-            remaining = round(float(budget) - float(total), 2)
+            remaining = round(float(budget) - float(trip.total_cost), 2)
 
         return {
-            "trip_id": trip.get("id"),
-            "trip_name": trip.get("name"),
+            "trip_id": trip.id,
+            "trip_name": trip.name,
             "budget": budget,
             "remaining_budget": remaining,
-            "counts": trip.get("counts", {}),
+            "counts": trip.counts,
         }
 
 
-def _days_until(start_date: str | None) -> int | None:
-    """Return number of days until start date."""
-    if not start_date:
-        return None
+class NotionTravelDiagnosticSensor(NotionTravelBaseSensor):
+    """Shared base class for refresh diagnostic sensors."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    start_dt = _parse_datetime(start_date)
+    def _metrics(self) -> dict[str, Any]:
+        return self.coordinator.refresh_metrics
+
+    def _state_key(self) -> tuple[Any, ...]:
+        """Change only when a new refresh has been measured."""
+        return (self.available, self._metrics().get("last_refresh"))
+
+
+class NotionTravelRefreshDurationSensor(NotionTravelDiagnosticSensor):
+    """Wall-clock duration of the last coordinator refresh."""
+
+    _attr_name = "Refresh Duration"
+    _unique_id_suffix = "refresh_duration"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last refresh duration."""
+        return self._metrics().get("duration_ms")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return per-stage timings of the last refresh."""
+        metrics = self._metrics()
+        return {
+            "last_refresh": metrics.get("last_refresh"),
+            "stages": metrics.get("stages", {}),
+            "normalize": metrics.get("normalize", {}),
+        }
+
+
+class NotionTravelApiRequestsSensor(NotionTravelDiagnosticSensor):
+    """Notion API requests made by the last coordinator refresh."""
+
+    _attr_name = "API Requests"
+    _unique_id_suffix = "api_requests"
+    _attr_icon = "mdi:api"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the request count of the last refresh."""
+        return self._metrics().get("api", {}).get("requests")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return retries, errors and per-database fetch stats."""
+        metrics = self._metrics()
+        api = metrics.get("api", {})
+        return {
+            "retries": api.get("retries"),
+            "errors": api.get("errors"),
+            "http_ms": api.get("http_ms"),
+            "databases": metrics.get("databases", {}),
+        }
+
+
+class NotionTravelResponseBytesSensor(NotionTravelDiagnosticSensor):
+    """Notion response payload size fetched by the last coordinator refresh."""
+
+    _attr_name = "Response Size"
+    _unique_id_suffix = "response_bytes"
+    _attr_icon = "mdi:download-network-outline"
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+
+    @property
+    def native_value(self) -> int | None:
+        """Return response bytes of the last refresh."""
+        return self._metrics().get("api", {}).get("response_bytes")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return decode time and cached row counts."""
+        metrics = self._metrics()
+        return {
+            "decode_ms": metrics.get("api", {}).get("decode_ms"),
+            "cached_rows": metrics.get("cached_rows", {}),
+        }
+
+
+def _trip_state_key(trip: Trip | None) -> tuple[Any, ...]:
+    """Return the trip fingerprint plus the time-dependent values shown for it."""
+    if trip is None:
+        return (None,)
+    return (trip.id, *TripView.key_for(trip), _days_until(trip.start_dt))
+
+
+def _days_until(start_dt: datetime | None) -> int | None:
+    """Return number of days until the pre-parsed start datetime."""
     if start_dt is None:
         return None
 
@@ -359,16 +571,3 @@ def _days_until(start_date: str | None) -> int | None:
     now_local = dt_util.as_local(now)
     delta = start_local.date() - now_local.date()
     return delta.days
-
-
-def _parse_datetime(value: str) -> datetime | None:
-    """Parse Notion date/date-time strings."""
-    try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt_util.UTC)
-
-    return parsed
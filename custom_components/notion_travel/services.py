@@ -0,0 +1,126 @@
+"""Services for the Notion Travel integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.redact import async_redact_data
+
+from .api import NotionApiError
+from .const import (
+    ATTR_PAGE_ID,
+    ATTR_WORKSPACE,
+    CONF_TOKEN,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_VERIFICATION_TOKEN,
+    DATA_CLIENT_POOL,
+    DATA_CONFIG,
+    DATA_COORDINATORS,
+    DOMAIN,
+    SERVICE_GET_DIAGNOSTICS,
+    SERVICE_REFRESH_PAGE,
+)
+from .coordinator import NotionTravelDataUpdateCoordinator, async_loaded_coordinators
+
+TO_REDACT = {CONF_TOKEN, CONF_WEBHOOK_ID, CONF_WEBHOOK_VERIFICATION_TOKEN}
+
+REFRESH_PAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PAGE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_WORKSPACE): cv.string,
+    }
+)
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register Notion Travel services."""
+
+    async def async_refresh_page(call: ServiceCall) -> None:
+        """Refetch specific Notion pages and update their trips."""
+        pages_by_coordinator = _pages_by_coordinator(
+            hass, call.data[ATTR_PAGE_ID], call.data.get(ATTR_WORKSPACE)
+        )
+        try:
+            for coordinator, page_ids in pages_by_coordinator:
+                await coordinator.async_refresh_pages(page_ids)
+        except NotionApiError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    async def async_get_diagnostics_service(call: ServiceCall) -> ServiceResponse:
+        """Return diagnostics as the service response."""
+        return async_get_diagnostics(hass)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH_PAGE, async_refresh_page, schema=REFRESH_PAGE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DIAGNOSTICS,
+        async_get_diagnostics_service,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _pages_by_coordinator(
+    hass: HomeAssistant, page_ids: list[str], workspace: str | None
+) -> list[tuple[NotionTravelDataUpdateCoordinator, list[str]]]:
+    """Route pages to the workspace coordinators that have them cached.
+
+    Pages no coordinator knows yet (e.g. just created in Notion) go to the
+    requested workspace, or to the only one configured.
+    """
+    coordinators = async_loaded_coordinators(hass)
+    if workspace is not None:
+        coordinators = [c for c in coordinators if c.workspace == workspace]
+        if not coordinators:
+            raise HomeAssistantError(f"Unknown {DOMAIN} workspace: {workspace}")
+    if not coordinators:
+        raise HomeAssistantError(f"{DOMAIN} is not set up yet")
+
+    routed: dict[NotionTravelDataUpdateCoordinator, list[str]] = {}
+    for page_id in page_ids:
+        owners = [c for c in coordinators if c.has_page(page_id)]
+        if not owners:
+            if len(coordinators) > 1:
+                raise HomeAssistantError(
+                    f"Page {page_id} is not cached by any {DOMAIN} workspace; "
+                    f"set `{ATTR_WORKSPACE}`"
+                )
+            owners = coordinators
+        for coordinator in owners:
+            routed.setdefault(coordinator, []).append(page_id)
+    return list(routed.items())
+
+
+@callback
+def async_get_diagnostics(hass: HomeAssistant) -> dict[str, Any]:
+    """Return, per workspace, redacted config plus sync state and refresh metrics."""
+    domain_data = hass.data.get(DOMAIN, {})
+    coordinators = domain_data.get(DATA_COORDINATORS, {})
+    pool = domain_data.get(DATA_CLIENT_POOL)
+    workspaces = []
+    for workspace, config in domain_data.get(DATA_CONFIG, {}).items():
+        coordinator = coordinators.get(workspace)
+        workspaces.append(
+            {
+                "workspace": workspace,
+                "config": async_redact_data(dict(config), TO_REDACT),
+                "coordinator": coordinator.diagnostics() if coordinator else None,
+            }
+        )
+    return {
+        "workspaces": workspaces,
+        "rate_budgets": pool.token_count if pool else 0,
+    }
@@ -0,0 +1,196 @@
+"""Webhook endpoint for Notion change notifications."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import hashlib
+import hmac
+import logging
+from typing import Any
+
+from aiohttp.web import Request, Response
+
+from homeassistant.components import persistent_notification, webhook
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DATA_COORDINATORS,
+    DOMAIN,
+    NOTION_SIGNATURE_HEADER,
+    STORAGE_VERSION,
+    WEBHOOK_STORAGE_KEY,
+)
+from .helpers import workspace_key
+
+_LOGGER = logging.getLogger(__name__)
+
+_VERIFICATION_TOKEN = "verification_token"
+_NOTIFICATION_ID = f"{DOMAIN}_webhook_verification"
+
+
+async def async_register_webhook(
+    hass: HomeAssistant,
+    workspace: str | None,
+    webhook_id: str,
+    verification_token: str | None = None,
+) -> None:
+    """Register the change-notification webhook of one workspace.
+
+    Without a configured `verification_token`, the first token Notion sends
+    is stored and used to check the signature of later deliveries.
+    """
+    store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_VERSION, workspace_key(WEBHOOK_STORAGE_KEY, workspace)
+    )
+    if verification_token is None:
+        stored = await store.async_load() or {}
+        verification_token = stored.get(_VERIFICATION_TOKEN)
+    handler = NotionWebhookHandler(hass, store, verification_token, workspace)
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        "Notion Travel" if workspace is None else f"Notion Travel ({workspace})",
+        webhook_id,
+        handler.async_handle,
+        allowed_methods=["POST"],
+    )
+
+
+class NotionWebhookHandler:
+    """Checks and dispatches change notifications posted to the webhook."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: Store[dict[str, Any]],
+        verification_token: str | None,
+        workspace: str | None = None,
+    ) -> None:
+        """Initialize handler."""
+        self._hass = hass
+        self._workspace = workspace
+        self._store = store
+        self._verification_token = verification_token
+
+    async def async_handle(
+        self, hass: HomeAssistant, webhook_id: str, request: Request
+    ) -> Response | None:
+        """Queue a targeted refresh for the pages/databases named in a notification."""
+        body = await request.read()
+        try:
+            payload = json_loads(body)
+        except ValueError:
+            _LOGGER.warning("Ignoring %s webhook call without a JSON body", DOMAIN)
+            return Response(status=400)
+
+        if not isinstance(payload, dict):
+            return Response(status=400)
+
+        if _VERIFICATION_TOKEN in payload:
+            await self._async_received_verification_token(str(payload[_VERIFICATION_TOKEN]))
+            return None
+
+        if not self._is_authentic(request, body, payload):
+            _LOGGER.warning("Ignoring %s webhook call with a missing or bad signature", DOMAIN)
+            return Response(status=401)
+
+        coordinator = hass.data.get(DOMAIN, {}).get(DATA_COORDINATORS, {}).get(self._workspace)
+        if coordinator is None:
+            return Response(status=503)
+
+        database_ids, page_ids = extract_change_targets(payload)
+        await coordinator.async_request_targeted_refresh(database_ids, page_ids)
+        return None
+
+    def _is_authentic(self, request: Request, body: bytes, payload: dict[str, Any]) -> bool:
+        """Return False for deliveries whose Notion signature does not match.
+
+        Once the verification token is known, Notion integration events
+        (which carry `entity`) must be signed. Relay and automation payloads
+        are unsigned and are only protected by the secret webhook ID.
+        """
+        signature = request.headers.get(NOTION_SIGNATURE_HEADER)
+        if signature is None:
+            return self._verification_token is None or "entity" not in payload
+        if self._verification_token is None:
+            return False
+        return hmac.compare_digest(signature, notion_signature(self._verification_token, body))
+
+    async def _async_received_verification_token(self, token: str) -> None:
+        """Keep the first verification token and show it so it can be entered in Notion."""
+        if self._verification_token is None:
+            self._verification_token = token
+            await self._store.async_save({_VERIFICATION_TOKEN: token})
+            message = (
+                "Notion sent a webhook verification token. Enter it in the Notion "
+                f"integration settings to verify the subscription:\n\n`{token}`"
+            )
+        elif token == self._verification_token:
+            return
+        else:
+            message = (
+                "Notion sent a new webhook verification token, but signatures are still "
+                "checked against the previous one. To switch, set "
+                "`webhook_verification_token` in the notion_travel configuration to:"
+                f"\n\n`{token}`"
+            )
+        _LOGGER.info("Received a Notion webhook verification token; see the notification")
+        persistent_notification.async_create(
+            self._hass,
+            message,
+            title=self._notification_title(),
+            notification_id=workspace_key(_NOTIFICATION_ID, self._workspace),
+        )
+
+    def _notification_title(self) -> str:
+        if self._workspace is None:
+            return "Notion Travel webhook"
+        return f"Notion Travel webhook ({self._workspace})"
+
+
+def notion_signature(verification_token: str, body: bytes) -> str:
+    """Return the `X-Notion-Signature` value Notion sends for a request body."""
+    digest = hmac.new(verification_token.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def extract_change_targets(payload: dict[str, Any]) -> tuple[set[str], set[str]]:
+    """Return (database IDs, page IDs) named by a change notification.
+
+    Accepts plain relay payloads (`database_id(s)` / `page_id(s)`), Notion
+    integration webhook events (`entity` plus `data.parent`) and Notion
+    database automation payloads (`data` holding the changed page).
+    """
+    database_ids = set(_ids(payload, "database_id", "database_ids"))
+    page_ids = set(_ids(payload, "page_id", "page_ids"))
+
+    entity = payload.get("entity")
+    if isinstance(entity, dict) and entity.get("id"):
+        if entity.get("type") == "database":
+            database_ids.add(entity["id"])
+        elif entity.get("type") == "page":
+            page_ids.add(entity["id"])
+
+    data = payload.get("data")
+    if isinstance(data, dict):
+        if data.get("object") == "page" and data.get("id"):
+            page_ids.add(data["id"])
+        parent = data.get("parent")
+        if isinstance(parent, dict):
+            parent_id = parent.get("database_id") or (
+                parent.get("id") if parent.get("type") == "database" else None
+            )
+            if parent_id:
+                database_ids.add(parent_id)
+
+    return database_ids, page_ids
+
+
+def _ids(payload: dict[str, Any], single_key: str, list_key: str) -> Iterable[str]:
+    if isinstance(payload.get(single_key), str):
+        yield payload[single_key]
+    values = payload.get(list_key)
+    if isinstance(values, list):
+        yield from (value for value in values if isinstance(value, str))
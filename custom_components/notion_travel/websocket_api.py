@@ -0,0 +1,96 @@
+"""Websocket API for the Notion Travel integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ATTR_WORKSPACE,
+    WS_TYPE_ITEM_PROPERTIES,
+    WS_TYPE_TRIP_TIMELINE,
+)
+from .coordinator import NotionTravelDataUpdateCoordinator, async_loaded_coordinators
+
+# construct_result_message takes the encoded result as bytes since Home
+# Assistant 2024.2 and as str before.
+_RESULT_PAYLOAD_IS_BYTES = (MAJOR_VERSION, MINOR_VERSION) >= (2024, 2)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register Notion Travel websocket commands."""
+    websocket_api.async_register_command(hass, websocket_trip_timeline)
+    websocket_api.async_register_command(hass, websocket_item_properties)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_TRIP_TIMELINE,
+        vol.Optional("trip_id"): str,
+        vol.Optional(ATTR_WORKSPACE): str,
+    }
+)
+@callback
+def websocket_trip_timeline(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the full timeline for one trip (default: the next trip)."""
+    trip = coordinator = None
+    for coordinator in _coordinators(hass, msg):
+        if (trip := coordinator.get_trip(msg.get("trip_id"))) is not None:
+            break
+    if trip is None or coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Trip not found")
+        return
+
+    payload = coordinator.trip_view(trip).timeline_json
+    connection.send_message(
+        websocket_api.messages.construct_result_message(
+            msg["id"], payload if _RESULT_PAYLOAD_IS_BYTES else payload.decode()
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_ITEM_PROPERTIES,
+        vol.Required("item_id"): str,
+        vol.Optional("properties"): [str],
+        vol.Optional(ATTR_WORKSPACE): str,
+    }
+)
+@callback
+def websocket_item_properties(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return parsed Notion properties of one child item (default: all)."""
+    properties = None
+    for coordinator in _coordinators(hass, msg):
+        properties = coordinator.get_item_properties(msg["item_id"], msg.get("properties"))
+        if properties is not None:
+            break
+    if properties is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Item not found")
+        return
+
+    connection.send_result(msg["id"], {"item_id": msg["item_id"], "properties": properties})
+
+
+def _coordinators(
+    hass: HomeAssistant, msg: dict[str, Any]
+) -> list[NotionTravelDataUpdateCoordinator]:
+    """Return the coordinators a command searches: the requested workspace, or all."""
+    coordinators = async_loaded_coordinators(hass)
+    if ATTR_WORKSPACE in msg:
+        return [c for c in coordinators if c.workspace == msg[ATTR_WORKSPACE]]
+    return coordinators
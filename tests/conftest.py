@@ -0,0 +1,12 @@
+"""Test configuration for the custom components in this repo."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent / "notion_travel"))
+
+# Loads Home Assistant's bootstrap before any test module imports the integration.
+import fake_notion  # noqa: E402, F401
@@ -0,0 +1,280 @@
+"""In-memory Notion workspace served through a fake aiohttp session.
+
+Shared by the tests and the benchmarks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import json
+from pathlib import Path
+import tempfile
+from typing import Any
+
+# Importing bootstrap first loads the websocket/http components in dependency
+# order, which the integration package imports at module level.
+import homeassistant.bootstrap  # noqa: F401
+from homeassistant.core import HomeAssistant
+
+from custom_components.notion_travel.api import NotionApiClient, TokenBucket
+from custom_components.notion_travel.coordinator import NotionTravelDataUpdateCoordinator
+
+EDITED = "2026-01-01T00:00:00.000Z"
+
+DATABASES = {
+    "trips": "db-trips",
+    "flights": "db-flights",
+    "notes": "db-notes",
+}
+
+
+def title(text: str) -> dict[str, Any]:
+    return {"type": "title", "title": [{"plain_text": text}]}
+
+
+def rich_text(text: str) -> dict[str, Any]:
+    return {"type": "rich_text", "rich_text": [{"plain_text": text}]}
+
+
+def date(start: str, end: str | None = None) -> dict[str, Any]:
+    return {"type": "date", "date": {"start": start, "end": end, "time_zone": None}}
+
+
+def relation(*ids: str) -> dict[str, Any]:
+    return {"type": "relation", "relation": [{"id": page_id} for page_id in ids]}
+
+
+def trip_page(trip_id: str, start: str, end: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": trip_id,
+        "url": f"https://notion.so/{trip_id}",
+        "last_edited_time": EDITED,
+        "parent": {"database_id": DATABASES["trips"]},
+        "properties": {
+            "Name": title(trip_id.title()),
+            "Dates": date(start, end),
+            "Status": {"type": "select", "select": {"name": "Planned"}},
+        },
+        **extra,
+    }
+
+
+def flight_page(
+    flight_id: str, trip_ids: list[str], departure: str, arrival: str
+) -> dict[str, Any]:
+    return {
+        "id": flight_id,
+        "url": f"https://notion.so/{flight_id}",
+        "last_edited_time": EDITED,
+        "parent": {"database_id": DATABASES["flights"]},
+        "properties": {
+            "Name": title(flight_id.title()),
+            "Trip": relation(*trip_ids),
+            "Departure Time": date(departure),
+            "Arrival Time": date(arrival),
+            "Cost": {"type": "number", "number": 100},
+        },
+    }
+
+
+def note_page(note_id: str, trip_ids: list[str]) -> dict[str, Any]:
+    return {
+        "id": note_id,
+        "url": f"https://notion.so/{note_id}",
+        "last_edited_time": EDITED,
+        "parent": {"database_id": DATABASES["notes"]},
+        "properties": {
+            "Name": title(note_id.title()),
+            "Trip": relation(*trip_ids),
+            "Content": rich_text("hello"),
+        },
+    }
+
+
+def default_workspace() -> dict[str, list[dict[str, Any]]]:
+    """Return pages per database ID: two future trips sharing one note."""
+    return {
+        "db-trips": [
+            trip_page("trip-1", "2099-11-01", "2099-11-10"),
+            trip_page("trip-2", "2099-12-01", "2099-12-05"),
+        ],
+        "db-flights": [
+            flight_page(
+                "flight-1", ["trip-1"], "2099-11-01T08:00:00.000Z", "2099-11-01T12:00:00.000Z"
+            ),
+            flight_page(
+                "flight-2", ["trip-2"], "2099-12-01T08:00:00.000Z", "2099-12-01T10:00:00.000Z"
+            ),
+        ],
+        "db-notes": [note_page("note-1", ["trip-1", "trip-2"])],
+    }
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in; `body` is JSON data or encoded bytes."""
+
+    def __init__(self, status: int, body: Any) -> None:
+        self.status = status
+        self.headers: dict[str, str] = {}
+        self._body = body if isinstance(body, bytes) else json.dumps(body).encode()
+
+    async def __aenter__(self) -> FakeResponse:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+def _edited_since(query_filter: dict[str, Any] | None) -> datetime | None:
+    """Return the `last_edited_time` lower bound of a query filter, if any."""
+    if not query_filter:
+        return None
+    for condition in [query_filter, *query_filter.get("and", ())]:
+        if condition.get("timestamp") == "last_edited_time":
+            return datetime.fromisoformat(condition["last_edited_time"]["on_or_after"])
+    return None
+
+
+class FakeNotionSession:
+    """Serves database queries and page retrievals from `pages`.
+
+    Only the `last_edited_time` condition of a query filter is applied; every
+    query body is kept in `queries`. With `page_size`, query results are
+    paginated. With `cache_responses`, each distinct query is encoded once,
+    so benchmarks do not time the fake's JSON encoding; pages must then not
+    change between queries.
+    """
+
+    def __init__(
+        self,
+        pages: dict[str, list[dict[str, Any]]],
+        page_size: int | None = None,
+        cache_responses: bool = False,
+    ) -> None:
+        self.pages = pages
+        self.page_size = page_size
+        self.requests: list[tuple[str, str]] = []
+        self.queries: list[tuple[str, dict[str, Any]]] = []
+        self.response_bytes = 0
+        self._encoded: dict[tuple[str, str], bytes] | None = {} if cache_responses else None
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        path = url.split("/v1/", 1)[1]
+        self.requests.append((method, path))
+        response = self._respond(path, kwargs.get("json") or {})
+        self.response_bytes += len(response._body)  # noqa: SLF001
+        return response
+
+    def _respond(self, path: str, payload: dict[str, Any]) -> FakeResponse:
+        if path.startswith("pages/"):
+            page_id = path.removeprefix("pages/")
+            for pages in self.pages.values():
+                for page in pages:
+                    if page["id"] == page_id:
+                        return FakeResponse(200, page)
+            return FakeResponse(404, {"message": "not found"})
+
+        database_id = path.split("/")[1]
+        if not path.endswith("/query"):
+            # The schema is the property types of the database's first page.
+            pages = self.pages[database_id]
+            properties = pages[0]["properties"] if pages else {}
+            return FakeResponse(
+                200,
+                {
+                    "object": "database",
+                    "properties": {
+                        name: {"type": prop["type"]} for name, prop in properties.items()
+                    },
+                },
+            )
+        self.queries.append((database_id, payload))
+        if self._encoded is None:
+            return FakeResponse(200, self._query(database_id, payload))
+        key = (database_id, json.dumps(payload, sort_keys=True))
+        if key not in self._encoded:
+            self._encoded[key] = json.dumps(
+                self._query(database_id, payload), separators=(",", ":")
+            ).encode()
+        return FakeResponse(200, self._encoded[key])
+
+    def _query(self, database_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        results = self.pages[database_id]
+        if (since := _edited_since(payload.get("filter"))) is not None:
+            results = [
+                page
+                for page in results
+                if datetime.fromisoformat(page["last_edited_time"]) >= since
+            ]
+        if self.page_size is None:
+            return {"results": results, "has_more": False, "next_cursor": None}
+        offset = int(payload.get("start_cursor") or 0)
+        end = offset + self.page_size
+        has_more = end < len(results)
+        return {
+            "results": results[offset:end],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+
+CoordinatorTest = Callable[
+    [NotionTravelDataUpdateCoordinator, FakeNotionSession], Awaitable[None]
+]
+
+
+def run_with_coordinator(
+    test: CoordinatorTest,
+    pages: dict[str, list[dict[str, Any]]] | None = None,
+    **options: Any,
+) -> None:
+    """Run `test` against a refreshed coordinator backed by a fake workspace.
+
+    `options` go to the coordinator; `databases` defaults to `DATABASES`.
+    """
+    databases = options.pop("databases", DATABASES)
+
+    async def _run() -> None:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(str(Path(config_dir)))
+            session = FakeNotionSession(pages if pages is not None else default_workspace())
+            coordinator = NotionTravelDataUpdateCoordinator(
+                hass, "token", databases, 1800, **options
+            )
+            coordinator._client = NotionApiClient(  # noqa: SLF001
+                session, "token", limiter=TokenBucket(rate=1e9, burst=10**9)
+            )
+            await coordinator.async_refresh()
+            assert coordinator.last_update_success
+            try:
+                await test(coordinator, session)
+            finally:
+                await coordinator.async_shutdown()
+                await hass.async_stop(force=True)
+
+    asyncio.run(_run())
+
+
+def coordinator_test(
+    pages: Callable[[], dict[str, list[dict[str, Any]]]] = default_workspace, **options: Any
+) -> Callable[[CoordinatorTest], Callable[[], None]]:
+    """Turn `async def test_...(coordinator, session)` into a test of a refreshed coordinator.
+
+    `pages` builds the workspace for the run; `options` go to the coordinator.
+    """
+
+    def decorate(test: CoordinatorTest) -> Callable[[], None]:
+        def run() -> None:
+            run_with_coordinator(test, pages(), **options)
+
+        # Not functools.wraps: pytest would read the wrapped signature as fixtures.
+        run.__name__ = run.__qualname__ = test.__name__
+        run.__doc__ = test.__doc__
+        return run
+
+    return decorate
@@ -0,0 +1,93 @@
+"""Tests for the Notion API client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from fake_notion import FakeResponse
+
+import pytest
+
+from custom_components.notion_travel import api
+from custom_components.notion_travel.api import NotionApiClient, NotionApiError, TokenBucket
+from custom_components.notion_travel.const import NOTION_MAX_RETRIES
+
+
+class _ScriptedSession:
+    """Answers requests with a fixed sequence of (status, headers, body) responses."""
+
+    def __init__(self, *responses: tuple[int, dict[str, str], Any]) -> None:
+        self.responses = list(responses)
+        self.requests = 0
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.requests += 1
+        status, headers, body = self.responses.pop(0)
+        response = FakeResponse(status, body)
+        response.headers = headers
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _no_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api.random, "uniform", lambda low, high: 0.0)
+
+
+def _query(
+    session: _ScriptedSession, limiter: TokenBucket | None = None
+) -> tuple[NotionApiClient, Any]:
+    client = NotionApiClient(
+        session, "token", limiter=limiter or TokenBucket(rate=1e9, burst=10**9)
+    )
+
+    async def _run() -> tuple[NotionApiClient, Any]:
+        try:
+            return client, await client.query_database("db", {})
+        except NotionApiError as err:
+            return client, err
+
+    return asyncio.run(_run())
+
+
+def test_rate_limited_request_waits_for_retry_after() -> None:
+    """A 429 pauses the token's bucket for Retry-After, then the request is retried."""
+    limiter = TokenBucket(rate=100, burst=5)
+    session = _ScriptedSession(
+        (429, {"Retry-After": "0.05"}, {"message": "slow down"}),
+        (200, {}, {"results": []}),
+    )
+
+    client, result = _query(session, limiter)
+
+    assert result == {"results": []}
+    assert session.requests == 2
+    assert client.metrics.retries == 1
+    assert client.metrics.errors == 0
+    # The pause drained the bucket below zero, so a later request must wait too.
+    assert limiter._tokens < 1  # noqa: SLF001
+
+
+def test_client_error_is_not_retried() -> None:
+    """Statuses outside the retryable set fail on the first response."""
+    session = _ScriptedSession((400, {}, {"message": "bad filter"}))
+
+    client, result = _query(session)
+
+    assert isinstance(result, NotionApiError)
+    assert "400" in str(result)
+    assert session.requests == 1
+    assert client.metrics.errors == 1
+
+
+def test_transient_errors_give_up_after_max_retries() -> None:
+    """Server errors are retried with backoff up to the retry limit."""
+    session = _ScriptedSession(
+        *[(503, {}, {"message": "unavailable"})] * (NOTION_MAX_RETRIES + 1)
+    )
+
+    client, result = _query(session)
+
+    assert isinstance(result, NotionApiError)
+    assert session.requests == NOTION_MAX_RETRIES + 1
+    assert client.metrics.retries == NOTION_MAX_RETRIES
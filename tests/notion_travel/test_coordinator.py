@@ -0,0 +1,429 @@
+"""Tests for the Notion Travel data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from fake_notion import (
+    DATABASES,
+    EDITED,
+    FakeNotionSession,
+    coordinator_test,
+    default_workspace,
+    flight_page,
+    note_page,
+    relation,
+    rich_text,
+    title,
+    trip_page,
+)
+
+from custom_components.notion_travel.api import NotionApiClient
+from custom_components.notion_travel.coordinator import NotionTravelDataUpdateCoordinator
+
+
+@coordinator_test()
+async def test_refresh_pages_drops_archived_trip(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """An archived trip page is removed from the published data right away."""
+    updates: list[None] = []
+    coordinator.async_add_listener(lambda: updates.append(None))
+    session.pages["db-trips"][0]["archived"] = True
+
+    await coordinator.async_refresh_pages(["trip-1"])
+
+    assert updates
+    assert "trip-1" not in coordinator.data["trip_index"]
+    assert [trip.id for trip in coordinator.data["trips"]] == ["trip-2"]
+    assert coordinator.data["relations"].trips_for_item("note-1") == ("trip-1", "trip-2")
+    assert [trip.id for trip in coordinator.get_item_trips("note-1")] == ["trip-2"]
+
+
+@coordinator_test()
+async def test_refresh_pages_relinks_child_item(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """A child page moved to another trip leaves the old trip's timeline."""
+    flight = session.pages["db-flights"][0]
+    flight["properties"]["Trip"]["relation"] = [{"id": "trip-2"}]
+
+    await coordinator.async_refresh_pages(["flight-1"])
+
+    trip_1 = coordinator.get_trip("trip-1")
+    trip_2 = coordinator.get_trip("trip-2")
+    assert [event.id for event in trip_1.timeline_events if event.dataset == "flights"] == []
+    assert [
+        event.id for event in trip_2.timeline_events if event.dataset == "flights"
+    ] == ["flight-1", "flight-2"]
+    assert trip_1.counts["flights"] == 0
+    assert trip_2.counts["flights"] == 2
+
+
+@coordinator_test()
+async def test_refresh_pages_patches_indexes_like_a_full_rebuild(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Page patches update the shared indexes in place to what a relink builds."""
+    data = coordinator.data
+    session.pages["db-trips"][1] = trip_page("trip-2", "2099-10-01", "2099-10-03")
+    session.pages["db-trips"].append(trip_page("trip-3", "2099-11-01", "2099-11-02"))
+    session.pages["db-flights"].append(
+        flight_page(
+            "flight-3", ["trip-3"], "2099-11-01T09:00:00.000Z", "2099-11-01T10:00:00.000Z"
+        )
+    )
+    session.pages["db-flights"][0]["archived"] = True
+
+    await coordinator.async_refresh_pages(["trip-2", "trip-3", "flight-3"])
+    await coordinator.async_refresh_pages(["flight-1"])
+
+    patched = coordinator.data
+    assert patched["relations"] is data["relations"]
+    assert patched["trip_calendar"] is data["trip_calendar"]
+    assert patched["event_calendar"] is data["event_calendar"]
+
+    rebuilt = coordinator._link(  # noqa: SLF001
+        {
+            dataset: list(records.values())
+            for dataset, records in coordinator._records.items()  # noqa: SLF001
+        }
+    )
+    assert [trip.id for trip in patched["trips"]] == ["trip-2", "trip-1", "trip-3"]
+    assert [trip.id for trip in patched["trips"]] == [trip.id for trip in rebuilt["trips"]]
+    assert patched["next_trip_id"] == rebuilt["next_trip_id"] == "trip-2"
+    assert patched["fingerprint"] == rebuilt["fingerprint"]
+    start = datetime(2099, 1, 1, tzinfo=UTC)
+    end = datetime(2100, 1, 1, tzinfo=UTC)
+    for key in ("trip_calendar", "event_calendar"):
+        assert patched[key].between(start, end) == rebuilt[key].between(start, end)
+
+
+@coordinator_test()
+async def test_refresh_pages_saves_pages_that_touch_no_trip(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """A page linked only to unloaded trips is still written to the snapshot."""
+    data = coordinator.data
+    saves: list[Any] = []
+    coordinator._store.async_delay_save = lambda func, delay: saves.append(func)  # noqa: SLF001
+    session.pages["db-notes"].append(note_page("note-2", ["trip-9"]))
+
+    await coordinator.async_refresh_pages(["note-2"])
+
+    assert coordinator.data is data
+    assert len(saves) == 1
+    assert [page["id"] for page in saves[0]()["pages"]["notes"]] == ["note-1", "note-2"]
+
+
+@coordinator_test()
+async def test_refresh_pages_ignores_unknown_database(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Pages outside the configured databases leave the data untouched."""
+    data = coordinator.data
+    session.pages["db-other"] = [
+        {"id": "other-1", "parent": {"database_id": "db-other"}, "properties": {}}
+    ]
+
+    await coordinator.async_refresh_pages(["other-1"])
+
+    assert coordinator.data is data
+
+
+@coordinator_test()
+async def test_explicit_refresh_fetches_every_dataset(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Scheduled polls skip datasets that are not due; explicit refreshes do not."""
+    session.requests.clear()
+    await coordinator._async_refresh(log_failures=True, scheduled=True)  # noqa: SLF001
+    assert session.requests == []
+
+    await coordinator.async_refresh()
+    assert sorted(path for _, path in session.requests) == [
+        "databases/db-flights/query",
+        "databases/db-notes/query",
+        "databases/db-trips/query",
+    ]
+
+
+@coordinator_test()
+async def test_shutdown_cancels_time_boundary(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Shutting down stops the debouncer and the time boundary timer."""
+    assert coordinator._unsub_time_boundary is not None  # noqa: SLF001
+
+    await coordinator.async_shutdown()
+
+    assert coordinator._unsub_time_boundary is None  # noqa: SLF001
+
+
+@coordinator_test(executor_threshold=0)
+async def test_large_refresh_parses_responses_in_executor(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Past the executor threshold no parsing is done on the event loop."""
+    stats = coordinator.refresh_metrics["databases"]
+    assert {dataset: stats[dataset]["parse_loop_ms"] for dataset in stats} == {
+        "trips": 0.0,
+        "flights": 0.0,
+        "notes": 0.0,
+    }
+    assert coordinator.normalize_stats["loop_blocking_ms"] == 0.0
+    assert [trip.id for trip in coordinator.data["trips"]] == ["trip-1", "trip-2"]
+
+
+@coordinator_test(executor_threshold=10_000)
+async def test_loop_blocking_includes_parsing_below_threshold(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Small refreshes parse and link on the loop, and report both."""
+    parse_loop_ms = sum(
+        stats["parse_loop_ms"] for stats in coordinator.refresh_metrics["databases"].values()
+    )
+    normalize = coordinator.normalize_stats
+    assert not normalize["executor"]
+    assert normalize["loop_blocking_ms"] == round(parse_loop_ms + normalize["duration_ms"], 2)
+
+
+def _renamed_relation_workspace() -> dict[str, list[dict[str, Any]]]:
+    pages = default_workspace()
+    renamed = pages["db-flights"][1]["properties"]
+    renamed["Trips"] = renamed.pop("Trip")
+    return pages
+
+
+@coordinator_test(_renamed_relation_workspace, executor_threshold=0)
+async def test_executor_parsing_handles_pages_across_a_schema_change(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Pages whose schema differs from the dataset resolver still parse and link."""
+    assert coordinator.data["relations"].trips_for_item("flight-2") == ("trip-2",)
+    assert coordinator.get_trip("trip-2").counts["flights"] == 1
+    assert set(coordinator._resolvers) == {"trips", "flights", "notes"}  # noqa: SLF001
+
+
+def _count_links(coordinator: NotionTravelDataUpdateCoordinator) -> list[None]:
+    links: list[None] = []
+    link = coordinator._link  # noqa: SLF001
+    coordinator._link = lambda *args: links.append(None) or link(*args)  # noqa: SLF001
+    return links
+
+
+@coordinator_test(incremental_sync=True)
+async def test_incremental_refresh_patches_changed_pages(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """An incremental poll patches the pages it fetched instead of relinking."""
+    links = _count_links(coordinator)
+    flight = session.pages["db-flights"][0]
+    flight["properties"]["Trip"]["relation"] = [{"id": "trip-2"}]
+    flight["last_edited_time"] = "2099-01-01T00:00:00.000Z"
+
+    await coordinator.async_refresh()
+
+    assert not links
+    assert coordinator.normalize_stats["patched"]
+    assert coordinator.normalize_stats["rows"] == 1
+    assert coordinator.get_trip("trip-1").counts["flights"] == 0
+    assert coordinator.get_trip("trip-2").counts["flights"] == 2
+    assert coordinator.data["relations"].trips_for_item("flight-1") == ("trip-2",)
+
+
+@coordinator_test(incremental_sync=True)
+async def test_incremental_refresh_without_changes_keeps_data(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """A poll whose edited-since queries return nothing does not relink."""
+    links = _count_links(coordinator)
+    data = coordinator.data
+    session.queries.clear()
+
+    await coordinator.async_refresh()
+
+    assert not links
+    assert coordinator.data is data
+    assert coordinator.normalize_stats["rows"] == 0
+    assert {database_id for database_id, _ in session.queries} == {
+        "db-trips",
+        "db-flights",
+        "db-notes",
+    }
+    assert all(
+        payload["filter"]["timestamp"] == "last_edited_time"
+        for _, payload in session.queries
+    )
+
+
+def _trip_in_progress_workspace() -> dict[str, list[dict[str, Any]]]:
+    today = datetime.now(UTC).date()
+    pages = default_workspace()
+    pages["db-trips"] += [
+        trip_page(
+            "trip-0",
+            (today - timedelta(days=20)).isoformat(),
+            (today + timedelta(days=2)).isoformat(),
+        ),
+        trip_page("trip-old", "2020-01-01", "2020-01-05"),
+    ]
+    return pages
+
+
+@coordinator_test(
+    _trip_in_progress_workspace,
+    incremental_sync=False,
+    query_filters={"past_trip_days": 7, "exclude_statuses": ["Cancelled"]},
+)
+async def test_trip_filter_keeps_trip_in_progress(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """The Notion date cutoff leaves room for trips that started before the window."""
+    status = {"property": "Status", "select": {"does_not_equal": "Cancelled"}}
+    trip_queries = [payload for db, payload in session.queries if db == "db-trips"]
+    # Nothing is known about trip lengths yet, so only the status is sent.
+    assert [payload["filter"] for payload in trip_queries] == [status]
+    assert [trip.id for trip in coordinator.data["trips"]] == ["trip-0", "trip-1", "trip-2"]
+
+    session.queries.clear()
+    await coordinator.async_refresh()
+
+    [query_filter] = [payload["filter"] for db, payload in session.queries if db == "db-trips"]
+    assert query_filter["and"][0] == status
+    on_or_after, is_empty = query_filter["and"][1]["or"]
+    assert is_empty == {"property": "Dates", "date": {"is_empty": True}}
+    assert on_or_after["property"] == "Dates"
+    assert on_or_after["date"]["on_or_after"] <= coordinator.get_trip("trip-0").start_date
+    assert "trip-0" in coordinator.data["trip_index"]
+
+
+@coordinator_test()
+async def test_snapshot_restores_data_before_the_first_refresh(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """A persisted snapshot is published without any Notion request."""
+    await coordinator._store.async_save(coordinator._snapshot_data())  # noqa: SLF001
+    restored = NotionTravelDataUpdateCoordinator(
+        coordinator.hass, "token", coordinator._databases, 1800  # noqa: SLF001
+    )
+    restored_session = FakeNotionSession({})
+    restored._client = NotionApiClient(restored_session, "token")  # noqa: SLF001
+
+    assert await restored.async_load_snapshot()
+
+    assert restored_session.requests == []
+    assert [trip.id for trip in restored.data["trips"]] == ["trip-1", "trip-2"]
+    assert [event.id for event in restored.get_trip("trip-1").timeline_events] == [
+        event.id for event in coordinator.get_trip("trip-1").timeline_events
+    ]
+    assert restored.data["fingerprint"] == coordinator.data["fingerprint"]
+    await restored.async_shutdown()
+
+
+POLICIES = {
+    "flights": {"interval": 300},
+    "notes": {
+        "adaptive": True,
+        "interval": 3600,
+        "active_interval": 120,
+        "active_window_days": 3,
+        "idle_after": 86400,
+        "idle_interval": 7200,
+    },
+}
+
+
+def _scheduled_intervals(coordinator: NotionTravelDataUpdateCoordinator) -> dict[str, int]:
+    refreshed = datetime.fromisoformat(coordinator.refresh_metrics["last_refresh"])
+    return {
+        dataset: int((due - refreshed).total_seconds())
+        for dataset, due in coordinator._next_due.items()  # noqa: SLF001
+    }
+
+
+@coordinator_test(refresh_policies=POLICIES)
+async def test_datasets_poll_on_their_own_intervals(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Each dataset is scheduled by its policy, and a tick fetches only due datasets."""
+    assert coordinator.update_interval == timedelta(seconds=120)
+    # Notes were last edited long ago and no trip is near, so they back off.
+    assert _scheduled_intervals(coordinator) == {"trips": 1800, "flights": 300, "notes": 7200}
+
+    session.requests.clear()
+    coordinator._next_due["flights"] = datetime.now(UTC)  # noqa: SLF001
+    await coordinator._async_refresh(log_failures=True, scheduled=True)  # noqa: SLF001
+
+    assert session.requests == [("POST", "databases/db-flights/query")]
+
+
+@coordinator_test(_trip_in_progress_workspace, refresh_policies=POLICIES)
+async def test_adaptive_dataset_polls_faster_during_a_trip(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """An adaptive dataset switches to its active interval while a trip is in progress."""
+    assert _scheduled_intervals(coordinator)["notes"] == 120
+
+
+@coordinator_test()
+async def test_overlapping_refreshes_share_one_fetch(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Refreshes requested while one is in flight join it instead of refetching."""
+    session.queries.clear()
+
+    await asyncio.gather(coordinator.async_refresh(), coordinator.async_refresh())
+
+    assert sorted(database_id for database_id, _ in session.queries) == [
+        "db-flights",
+        "db-notes",
+        "db-trips",
+    ]
+    assert coordinator.last_update_success
+
+
+def _packing_workspace() -> dict[str, list[dict[str, Any]]]:
+    pages = default_workspace()
+    pages["db-packing"] = [
+        {
+            "id": "pack-1",
+            "url": "https://notion.so/pack-1",
+            "last_edited_time": EDITED,
+            "parent": {"database_id": "db-packing"},
+            "properties": {
+                "Name": title("Boots"),
+                "Trip": relation("trip-1"),
+                "Quantity": {"type": "number", "number": 2},
+                "Packed": {"type": "checkbox", "checkbox": True},
+                "Notes": rich_text("waterproof"),
+            },
+        }
+    ]
+    return pages
+
+
+@coordinator_test(
+    _packing_workspace,
+    databases={**DATABASES, "packing": "db-packing"},
+    generic_properties={"packing": ["quantity"]},
+)
+async def test_generic_dataset_parses_only_projected_properties(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Projected properties are published; the rest are parsed on request."""
+    item = coordinator.get_item("pack-1")
+    assert item.details["properties"] == {"Quantity": 2}
+    assert coordinator.get_trip("trip-1").counts["packing"] == 1
+
+    assert coordinator.get_item_properties("pack-1", ["packed"]) == {"Packed": True}
+    assert coordinator.get_item_properties("pack-1") == {
+        "Name": "Boots",
+        "Trip": ["trip-1"],
+        "Quantity": 2,
+        "Packed": True,
+        "Notes": "waterproof",
+    }
+    assert coordinator.get_item_properties("missing") is None
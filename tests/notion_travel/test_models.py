@@ -0,0 +1,145 @@
+"""Tests for the Notion Travel record models and indexes."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.notion_travel.models import (
+    CalendarIndex,
+    CalendarItem,
+    ChildItem,
+    RelationGraph,
+    Timeline,
+    TimelineEvent,
+)
+
+BASE = datetime(2099, 1, 1, tzinfo=UTC)
+
+
+def _item(item_id: str, trip_ids: list[str], dataset: str = "flights") -> ChildItem:
+    return ChildItem(
+        id=item_id,
+        dataset=dataset,
+        name=item_id,
+        status="",
+        notes="",
+        notion_url="",
+        external_url="",
+        last_edited_time=None,
+        cost=None,
+        trip_ids=trip_ids,
+        relation_ids=trip_ids,
+    )
+
+
+def _event(item_id: str, start_hours: int, end_hours: int | None = None) -> TimelineEvent:
+    start = BASE + timedelta(hours=start_hours)
+    end = BASE + timedelta(hours=end_hours) if end_hours is not None else None
+    return TimelineEvent(
+        item=_item(item_id, ["trip-1"]),
+        start=start.isoformat(),
+        end=end.isoformat() if end else None,
+        time_zone=None,
+        subtitle="",
+        location="",
+        start_dt=start,
+        end_dt=end,
+        sort_key=(start, item_id),
+    )
+
+
+def _calendar_item(uid: str, start_hours: int, end_hours: int) -> CalendarItem:
+    lower = BASE + timedelta(hours=start_hours)
+    upper = BASE + timedelta(hours=end_hours)
+    return CalendarItem(uid=uid, summary=uid, start=lower, end=upper, lower=lower, upper=upper)
+
+
+def test_timeline_keeps_events_sorted_across_insert_and_remove() -> None:
+    """Inserted events land in order and replacing an item moves its event."""
+    timeline = Timeline([_event("c", 30), _event("a", 10)])
+    timeline.insert(_event("b", 20))
+    timeline.insert(_event("a", 40))
+    timeline.remove("c")
+    timeline.remove("missing")
+
+    assert [event.id for event in timeline.events] == ["b", "a"]
+    assert len(timeline) == 2
+
+
+def test_timeline_upcoming_includes_long_running_events() -> None:
+    """An event that started before `now` is upcoming while it is still active."""
+    timeline = Timeline(
+        [_event("stay", 0, 100), _event("past", 1, 2), _event("next", 50)]
+    )
+
+    upcoming = timeline.upcoming(BASE + timedelta(hours=10))
+
+    assert [event.id for event in upcoming] == ["stay", "next"]
+
+
+def test_relation_graph_links_both_directions() -> None:
+    """Shared items are stored once and relinking updates both directions."""
+    graph = RelationGraph()
+    graph.add(_item("note-1", ["trip-1", "trip-2", "trip-1"]))
+    graph.add(_item("flight-1", ["trip-1"]))
+
+    assert graph.trips_for_item("note-1") == ("trip-1", "trip-2")
+    assert [item.id for item in graph.items_for_trip("trip-1")] == ["note-1", "flight-1"]
+
+    graph.add(_item("note-1", ["trip-3"]))
+
+    assert [item.id for item in graph.items_for_trip("trip-1")] == ["flight-1"]
+    assert graph.items_for_trip("trip-2") == []
+    assert [item.id for item in graph.items_for_trip("trip-3")] == ["note-1"]
+
+    removed = graph.remove("flight-1")
+
+    assert removed is not None and removed.id == "flight-1"
+    assert graph.remove("flight-1") is None
+    assert graph.items_for_trip("trip-1") == []
+    assert len(graph) == 1
+
+
+def test_calendar_index_matches_brute_force() -> None:
+    """Range queries return exactly the overlapping items, in start order."""
+    items = [
+        _calendar_item(f"item-{index}", index * 7 % 50, index * 7 % 50 + index % 9 + 1)
+        for index in range(40)
+    ]
+    index = CalendarIndex(items)
+
+    for start_hours in range(-5, 60, 3):
+        start = BASE + timedelta(hours=start_hours)
+        end = start + timedelta(hours=4)
+        expected = sorted(
+            (item for item in items if item.lower < end and item.upper > start),
+            key=lambda item: (item.lower, item.uid),
+        )
+        assert index.between(start, end) == expected
+
+
+def test_calendar_index_insert_and_remove_keep_start_order() -> None:
+    """Single inserts, replacements and removals answer like a rebuilt index."""
+    index = CalendarIndex([_calendar_item("a", 5, 6), _calendar_item("b", 1, 2)])
+
+    index.insert(_calendar_item("c", 3, 30))
+    index.insert(_calendar_item("a", 0, 1))
+    index.remove("b")
+    index.remove("missing")
+
+    start, end = BASE, BASE + timedelta(hours=40)
+    expected = CalendarIndex([_calendar_item("a", 0, 1), _calendar_item("c", 3, 30)])
+    assert index.between(start, end) == expected.between(start, end)
+    assert index.next_after(BASE + timedelta(hours=20)).uid == "c"
+    assert len(index) == 2
+
+
+def test_calendar_index_next_after_prefers_in_progress_item() -> None:
+    """The current entry wins over later ones; nothing is returned after the last."""
+    index = CalendarIndex(
+        [_calendar_item("long", 0, 48), _calendar_item("short", 10, 11)]
+    )
+
+    assert index.next_after(BASE + timedelta(hours=12)).uid == "long"
+    assert index.next_after(BASE + timedelta(hours=49)) is None
+    assert len(index) == 2
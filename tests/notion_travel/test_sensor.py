@@ -0,0 +1,57 @@
+"""Tests for the Notion Travel sensor platform."""
+
+from __future__ import annotations
+
+from fake_notion import FakeNotionSession, coordinator_test
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from custom_components.notion_travel.const import DOMAIN, ENTITY_STORAGE_KEY, STORAGE_VERSION
+from custom_components.notion_travel.coordinator import NotionTravelDataUpdateCoordinator
+from custom_components.notion_travel.sensor import TripEntityManager
+
+
+def _registered_trips(registry: er.EntityRegistry) -> set[str]:
+    return {
+        entry.unique_id.removeprefix(f"{DOMAIN}_").split("_", 1)[0]
+        for entry in registry.entities.values()
+        if entry.platform == DOMAIN
+    }
+
+
+@coordinator_test()
+async def test_trip_sensors_follow_max_trips(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Only the first `max_trips` trips keep sensors; stale registry entries go."""
+    hass = coordinator.hass
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    for trip_id in ("trip-1", "trip-2", "trip-gone"):
+        unique_id = coordinator.unique_id(f"{trip_id}_summary")
+        registry.async_get_or_create("sensor", DOMAIN, unique_id)
+    # A trip that had sensors before the restart and no longer exists in Notion.
+    await Store(hass, STORAGE_VERSION, ENTITY_STORAGE_KEY).async_save(
+        {"trip_ids": ["trip-gone"]}
+    )
+    added: list[SensorEntity] = []
+    manager = TripEntityManager(
+        hass, coordinator, lambda entities: added.extend(entities), max_trips=1, past_days=0
+    )
+
+    await manager.async_setup()
+
+    assert _registered_trips(registry) == {"trip-1"}
+    assert {entity.unique_id for entity in added} == {
+        coordinator.unique_id(f"trip-1_{suffix}")
+        for suffix in ("summary", "total_cost", "flights_count", "notes_count")
+    }
+
+    added.clear()
+    session.pages["db-trips"][0]["archived"] = True
+    await coordinator.async_refresh_pages(["trip-1"])
+
+    assert _registered_trips(registry) == set()
+    assert coordinator.unique_id("trip-2_summary") in {entity.unique_id for entity in added}
@@ -0,0 +1,30 @@
+"""Tests for the Notion Travel services."""
+
+from __future__ import annotations
+
+from fake_notion import FakeNotionSession, coordinator_test
+
+from custom_components.notion_travel.const import DATA_CONFIG, DATA_COORDINATORS, DOMAIN
+from custom_components.notion_travel.coordinator import NotionTravelDataUpdateCoordinator
+from custom_components.notion_travel.services import async_get_diagnostics
+
+
+@coordinator_test()
+async def test_diagnostics_redact_secrets(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """Tokens and webhook secrets are redacted; sync state is reported per workspace."""
+    hass = coordinator.hass
+    hass.data[DOMAIN] = {
+        DATA_CONFIG: {None: {"token": "secret", "webhook_id": "hook", "scan_interval": 60}},
+        DATA_COORDINATORS: {None: coordinator},
+    }
+
+    (workspace,) = async_get_diagnostics(hass)["workspaces"]
+
+    assert workspace["config"] == {
+        "token": "**REDACTED**",
+        "webhook_id": "**REDACTED**",
+        "scan_interval": 60,
+    }
+    assert workspace["coordinator"]["cached_rows"] == {"trips": 2, "flights": 2, "notes": 1}
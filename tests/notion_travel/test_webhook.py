@@ -0,0 +1,88 @@
+"""Tests for the Notion Travel change-notification webhook."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant
+
+from custom_components.notion_travel.webhook import (
+    NotionWebhookHandler,
+    extract_change_targets,
+    notion_signature,
+)
+
+EVENT = {
+    "entity": {"id": "page-1", "type": "page"},
+    "data": {"parent": {"id": "db-1", "type": "database"}},
+}
+
+
+class _Request:
+    def __init__(self, payload: dict[str, Any], signature: str | None = None) -> None:
+        self.body = json.dumps(payload).encode()
+        self.headers = {} if signature is None else {"X-Notion-Signature": signature}
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class _Coordinator:
+    def __init__(self) -> None:
+        self.calls: list[tuple[set[str], set[str]]] = []
+
+    async def async_request_targeted_refresh(
+        self, database_ids: set[str], page_ids: set[str]
+    ) -> None:
+        self.calls.append((database_ids, page_ids))
+
+
+class _Store:
+    def __init__(self) -> None:
+        self.saved: dict[str, Any] | None = None
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self.saved = data
+
+
+def test_extract_change_targets() -> None:
+    """Integration events, automation payloads and relay payloads are understood."""
+    assert extract_change_targets(EVENT) == ({"db-1"}, {"page-1"})
+    assert extract_change_targets(
+        {"data": {"object": "page", "id": "p", "parent": {"database_id": "db-2"}}}
+    ) == ({"db-2"}, {"p"})
+    assert extract_change_targets({"database_ids": ["a", 1], "page_id": "b"}) == ({"a"}, {"b"})
+
+
+def test_signatures_are_checked_once_the_verification_token_is_known() -> None:
+    """The first token is kept; Notion events must then be signed with it."""
+
+    async def run() -> None:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(str(Path(config_dir)))
+            await persistent_notification.async_setup(hass, {})
+            coordinator = _Coordinator()
+            hass.data["notion_travel"] = {"coordinators": {None: coordinator}}
+            handler = NotionWebhookHandler(hass, _Store(), None)
+
+            assert await handler.async_handle(hass, "id", _Request(EVENT)) is None
+            await handler.async_handle(hass, "id", _Request({"verification_token": "secret"}))
+            await handler.async_handle(hass, "id", _Request({"verification_token": "forged"}))
+
+            signed = _Request(EVENT)
+            signed.headers["X-Notion-Signature"] = notion_signature("secret", signed.body)
+            assert await handler.async_handle(hass, "id", signed) is None
+            forged = _Request(EVENT, notion_signature("forged", signed.body))
+            assert (await handler.async_handle(hass, "id", forged)).status == 401
+            assert (await handler.async_handle(hass, "id", _Request(EVENT))).status == 401
+            assert await handler.async_handle(hass, "id", _Request({"page_id": "p"})) is None
+
+            assert len(coordinator.calls) == 3
+            await hass.async_stop(force=True)
+
+    asyncio.run(run())
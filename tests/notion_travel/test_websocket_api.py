@@ -0,0 +1,51 @@
+"""Tests for the Notion Travel websocket commands."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fake_notion import FakeNotionSession, coordinator_test
+
+from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
+
+from custom_components.notion_travel.const import DATA_COORDINATORS, DOMAIN
+from custom_components.notion_travel.coordinator import NotionTravelDataUpdateCoordinator
+from custom_components.notion_travel.websocket_api import websocket_trip_timeline
+
+
+class _Connection:
+    def __init__(self) -> None:
+        self.messages: list[bytes | str] = []
+        self.errors: list[str] = []
+
+    def send_message(self, message: bytes | str) -> None:
+        self.messages.append(message)
+
+    def send_error(self, msg_id: int, code: str, message: str) -> None:
+        self.errors.append(code)
+
+
+@coordinator_test()
+async def test_trip_timeline_sends_the_cached_encoded_timeline(
+    coordinator: NotionTravelDataUpdateCoordinator, session: FakeNotionSession
+) -> None:
+    """The result message is built from the view's cached payload."""
+    hass = coordinator.hass
+    hass.data[DOMAIN] = {DATA_COORDINATORS: {None: coordinator}}
+    connection = _Connection()
+    msg: dict[str, Any] = {"id": 7, "type": "notion_travel/trip_timeline"}
+
+    websocket_trip_timeline(hass, connection, {**msg, "trip_id": "trip-2"})
+    websocket_trip_timeline(hass, connection, {**msg, "trip_id": "missing"})
+
+    (message,) = connection.messages
+    assert connection.errors == ["not_found"]
+    assert isinstance(message, bytes if (MAJOR_VERSION, MINOR_VERSION) >= (2024, 2) else str)
+    result = json.loads(message)
+    assert result["id"] == 7 and result["success"]
+    assert result["result"]["trip_id"] == "trip-2"
+    assert {event["id"] for event in result["result"]["timeline_events"]} == {
+        "flight-2",
+        "note-1",
+    }
@@ -0,0 +1,122 @@
+"""Tests for running several Notion workspaces side by side."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from fake_notion import DATABASES, FakeNotionSession, default_workspace
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.notion_travel import CONFIG_SCHEMA
+from custom_components.notion_travel.api import NotionApiClient, NotionClientPool, TokenBucket
+from custom_components.notion_travel.const import DATA_CLIENT_POOL, DATA_CONFIG
+from custom_components.notion_travel.coordinator import async_get_coordinators
+from custom_components.notion_travel.sensor import _build_entities_for_trip
+
+
+def _workspace(token: str, **extra: Any) -> dict[str, Any]:
+    return {"token": token, "databases": dict(DATABASES), **extra}
+
+
+def test_config_schema_accepts_one_or_several_workspaces() -> None:
+    """A single workspace keeps the flat form; several need unique names."""
+    single = CONFIG_SCHEMA({"notion_travel": _workspace("a")})["notion_travel"]
+    assert single["token"] == "a"
+
+    several = CONFIG_SCHEMA(
+        {
+            "notion_travel": {
+                "workspaces": [
+                    _workspace("a", name="home"),
+                    _workspace("b", name="work"),
+                ]
+            }
+        }
+    )["notion_travel"]
+    assert [workspace["name"] for workspace in several["workspaces"]] == ["home", "work"]
+    assert several["workspaces"][1]["scan_interval"] == single["scan_interval"]
+
+    with pytest.raises(vol.Invalid):
+        CONFIG_SCHEMA(
+            {
+                "notion_travel": {
+                    "workspaces": [_workspace("a", name="home"), _workspace("b", name="home")]
+                }
+            }
+        )
+
+
+def test_one_coordinator_per_workspace() -> None:
+    """Each workspace gets its own coordinator, rate budget and unique IDs."""
+
+    async def run() -> None:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(str(Path(config_dir)))
+            config = CONFIG_SCHEMA(
+                {
+                    "notion_travel": {
+                        "workspaces": [
+                            _workspace("token-a", name="home"),
+                            _workspace("token-b", name="work"),
+                        ]
+                    }
+                }
+            )["notion_travel"]
+            session = FakeNotionSession(default_workspace())
+            hass.data["notion_travel"] = {
+                DATA_CONFIG: {workspace["name"]: workspace for workspace in config["workspaces"]},
+                DATA_CLIENT_POOL: NotionClientPool(session),
+            }
+
+            home, work = await async_get_coordinators(hass)
+            assert await async_get_coordinators(hass) == [home, work]
+
+            assert (home.workspace, work.workspace) == ("home", "work")
+            assert home.last_update_success and work.last_update_success
+            assert hass.data["notion_travel"][DATA_CLIENT_POOL].token_count == 2
+            assert len(session.requests) == 6
+            assert home.unique_id("next_trip") == "notion_travel_home_next_trip"
+            assert work.unique_id("next_trip") == "notion_travel_work_next_trip"
+            assert work.entity_name("Next Trip") == "Work Next Trip"
+            assert [
+                entity.name for entity in _build_entities_for_trip(work, work.get_trip("trip-1"))
+            ] == [
+                "Work Trip-1",
+                "Work Trip-1 Total Cost",
+                "Work Trip-1 Flights",
+                "Work Trip-1 Notes",
+            ]
+
+            for coordinator in (home, work):
+                await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+def test_paused_token_does_not_hold_shared_request_slots() -> None:
+    """A token waiting out a 429 leaves the shared in-flight slots to other tokens."""
+
+    async def run() -> None:
+        session = FakeNotionSession(default_workspace())
+        semaphore = asyncio.Semaphore(1)
+        paused = TokenBucket(rate=1, burst=1)
+        paused.pause(60)
+        client_a = NotionApiClient(session, "a", limiter=paused, semaphore=semaphore)
+        client_b = NotionApiClient(session, "b", semaphore=semaphore)
+
+        waiting = asyncio.create_task(client_a.retrieve_page("trip-1"))
+        await asyncio.sleep(0)
+        page = await asyncio.wait_for(client_b.retrieve_page("trip-2"), timeout=1)
+
+        assert page["id"] == "trip-2"
+        assert not waiting.done()
+        waiting.cancel()
+
+    asyncio.run(run())
@@ -2,6 +2,7 @@
   const CARD_TYPE = "notion-travel-trip-card";
   const ALIAS_CARD_TYPE = "notion-travel-trip-card-v2";
   const DEFAULT_ENTITY = "sensor.notion_travel_next_trip";
+  const WS_TRIP_TIMELINE = "notion_travel/trip_timeline";
 
   const BAD_STATES = new Set(["unknown", "unavailable", "none", ""]);
   const COST_DISPLAY_MIN = 0.01;
@@ -602,6 +603,38 @@
       return this._hass.states[this._config.entity] || null;
     }
 
+    _attributes(stateObj) {
+      const attrs = stateObj.attributes || {};
+      if (attrs.attribute_mode !== "compact") {
+        return attrs;
+      }
+
+      // Compact sensors omit the full timeline; fetch it once per trip revision.
+      const key = `${attrs.trip_id || ""}|${attrs.fingerprint || ""}`;
+      if (this._timelineKey !== key && this._hass && typeof this._hass.callWS === "function") {
+        this._timelineKey = key;
+        this._hass
+          .callWS({ type: WS_TRIP_TIMELINE, trip_id: attrs.trip_id })
+          .then((result) => {
+            if (this._timelineKey !== key) {
+              return;
+            }
+            this._timeline = result;
+            this._render();
+          })
+          .catch((err) => {
+            console.warn("notion-travel-trip-card: timeline fetch failed", err);
+          });
+      }
+
+      const timeline = this._timeline && this._timeline.trip_id === attrs.trip_id ? this._timeline : null;
+      return {
+        ...attrs,
+        timeline_events: timeline ? timeline.timeline_events : [],
+        timeline_events_upcoming: timeline ? timeline.timeline_events_upcoming : attrs.upcoming_events || [],
+      };
+    }
+
     _events(attrs) {
       const source = this._config.use_upcoming
         ? attrs.timeline_events_upcoming || attrs.timeline_events
@@ -922,7 +955,7 @@
           return;
         }
 
-        const attrs = stateObj.attributes || {};
+        const attrs = this._attributes(stateObj);
         const mode = this._config.mode;
         const title = this._config.title || (mode === "overview" ? "Trip Console" : mode === "timeline" ? "Itinerary Timeline" : mode === "details" ? "Trip Details" : "Next Trip");
 